@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Headless benchmarks for the QtRangeSlider hot paths.
+
+Runs on the offscreen QPA platform, writes the results as JSON and compares them
+against a stored baseline. Exits with status 1 if a signal emission count grew or
+a benchmark is slower than the baseline by more than the threshold.
+
+Timings are gated relative to a fixed reference workload timed next to every
+repeat, so a machine which is busier than when the baseline was recorded doesn't
+fail the run. A benchmark may be slower by the threshold plus its noise floor, the
+spread of its own repeats. Re-record the baseline in every change which makes a
+hot path intentionally slower or faster.
+
+    python benchmarks/bench_slider.py --output results.json
+    python benchmarks/bench_slider.py --update-baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+from dataclasses import dataclass
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# pylint: disable=wrong-import-position
+from PyQt6.QtCore import Qt, QEvent, QPointF
+from PyQt6.QtGui import QImage, QMouseEvent
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QWidget
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=import-error
+from qt_range_slider import QtRangeSlider, RangeModel
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 15
+# the allowed slowdown is the threshold plus this many times the spread of repeats
+NOISE_FACTOR = 3
+
+PAINT_WIDTHS = (200, 800, 2000)
+PAINT_TICKS = (0, 10, 200)
+PAINT_COUNT = 200
+DRAG_MOVES = 5000
+CONSTRUCT_COUNT = 1000
+MODEL_UPDATES = 100_000
+MAX_VALUE_64 = 2**64 - 1
+REFERENCE_LOOPS = 20_000
+
+
+def _slider(parent, width, max_value=100, ticks=0):
+    slider = QtRangeSlider(parent, 0, max_value, max_value // 4, max_value // 2)
+    slider.resize(width, QtRangeSlider.HEIGHT)
+    slider.set_ticks_count(ticks)
+    # hidden widgets don't get resize events, deliver it by hand like the tests do
+    slider.resizeEvent(None)
+    return slider
+
+
+def _image(slider):
+    # render() delivers a real paint event, even to hidden widgets
+    image = QImage(slider.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    return image
+
+
+def _reference():
+    """A fixed workload, its time tracks how fast the machine is right now."""
+    total = 0
+    for value in range(REFERENCE_LOOPS):
+        total += value * value
+    return total
+
+
+def _timed(function):
+    # like timeit, keep the garbage collector out of the measurement
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+@dataclass
+class Timing:
+    """
+    Timing of one operation, see _time.
+
+    seconds is the best wall time. relative is the lower quartile of the times in
+    reference runs, a single lucky run doesn't set it like it would the minimum,
+    and noise their relative spread (median over lower quartile - 1).
+    """
+
+    seconds: float
+    relative: float
+    noise: float
+
+
+def _time(function, repeat, count):
+    """Time function (count operations) over repeat runs, each next to a reference."""
+    timings = []
+    relatives = []
+    for _ in range(repeat):
+        reference = _timed(_reference)
+        timing = _timed(function)
+        timings.append(timing)
+        relatives.append(timing / reference)
+    relatives.sort()
+    relative = relatives[len(relatives) // 4]
+    return Timing(
+        seconds=min(timings) / count,
+        relative=relative / count,
+        noise=relatives[len(relatives) // 2] / relative - 1,
+    )
+
+
+def bench_paint(parent, repeat):
+    results = {}
+    for width in PAINT_WIDTHS:
+        for ticks in PAINT_TICKS:
+            slider = _slider(parent, width, ticks=ticks)
+            image = _image(slider)
+
+            def paint(slider=slider, image=image):
+                for _ in range(PAINT_COUNT):
+                    slider.render(image)
+
+            def cold_paint(slider=slider, image=image, ticks=ticks):
+                for _ in range(PAINT_COUNT):
+                    # dropping the cached layers forces a full render
+                    slider.set_ticks_count(ticks)
+                    slider.render(image)
+
+            results[f"paint_w{width}_t{ticks}"] = _time(paint, repeat, PAINT_COUNT)
+            results[f"paint_cold_w{width}_t{ticks}"] = _time(
+                cold_paint, repeat, PAINT_COUNT
+            )
+    return results
+
+
+def _drag(slider, moves):
+    emissions = []
+    slider.left_thumb_value_changed.connect(emissions.append)
+    slider.render(_image(slider))
+    start = slider.get_layout().thumb_rects[0].center()
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=start)
+    width = slider.width()
+    for step in range(moves):
+        x = (start.x() + step) % width
+        event = QMouseEvent(
+            QEvent.Type.MouseMove,
+            QPointF(x, start.y()),
+            Qt.MouseButton.LeftButton,
+            Qt.MouseButton.LeftButton,
+            Qt.KeyboardModifier.NoModifier,
+        )
+        QApplication.sendEvent(slider, event)
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=start)
+    QApplication.processEvents()
+    return len(emissions)
+
+
+def _drag_slider(parent, max_value, compressed):
+    slider = _slider(parent, 800, max_value)
+    # events are sent faster than any frame rate, so nearly all are coalesced
+    slider.set_drag_compression(compressed)
+    return slider
+
+
+def bench_drag(parent, repeat):
+    results = {}
+    for name, max_value, compressed in (
+        ("drag", 100_000, False),
+        ("drag_64bit", MAX_VALUE_64, False),
+        ("drag_compressed", 100_000, True),
+    ):
+        slider = _drag_slider(parent, max_value, compressed)
+        results[f"{name}_emissions"] = _drag(slider, DRAG_MOVES)
+
+        def drag(max_value=max_value, compressed=compressed):
+            _drag(_drag_slider(parent, max_value, compressed), DRAG_MOVES)
+
+        results[name] = _time(drag, repeat, DRAG_MOVES)
+    return results
+
+
+def bench_construction(parent, repeat):
+    def construct():
+        sliders = [QtRangeSlider(parent, 0, 100) for _ in range(CONSTRUCT_COUNT)]
+        for slider in sliders:
+            slider.deleteLater()
+        QApplication.processEvents()
+
+    return {"construct": _time(construct, repeat, CONSTRUCT_COUNT)}
+
+
+def bench_model(repeat):
+    def update():
+        model = RangeModel(0, MAX_VALUE_64)
+        model.add_listener(lambda old_low, old_high: None)
+        for value in range(1, MODEL_UPDATES + 1):
+            model.set_range(value, MAX_VALUE_64 - value)
+
+    return {"model_set_range": _time(update, repeat, MODEL_UPDATES)}
+
+
+def run(repeat):
+    parent = QWidget()
+    results = {}
+    results.update(bench_paint(parent, repeat))
+    results.update(bench_drag(parent, repeat))
+    results.update(bench_construction(parent, repeat))
+    results.update(bench_model(repeat))
+    return results
+
+
+def report(results):
+    """Split results into the report sections: seconds, relative times and noise."""
+    sections = {"results": {}, "relative": {}, "noise": {}}
+    for name, result in results.items():
+        if isinstance(result, Timing):
+            sections["results"][name] = result.seconds
+            sections["relative"][name] = result.relative
+            sections["noise"][name] = result.noise
+        else:
+            sections["results"][name] = result
+    return sections
+
+
+def compare(current, baseline, threshold):
+    """
+    Return the names of the benchmarks which regressed: emission counts which grew
+    and relative timings slower by more than threshold plus NOISE_FACTOR times the
+    noise of the noisier run.
+    """
+    regressions = []
+    for name, base in baseline["results"].items():
+        if name not in current["results"]:
+            continue
+        if name not in baseline["relative"]:
+            # emission counts are exact
+            count = current["results"][name]
+            print(f"{name:32} {base:12} {count:12}")
+            if count > base:
+                regressions.append(name)
+            continue
+        ratio = current["relative"][name] / baseline["relative"][name]
+        noise = max(current["noise"][name], baseline["noise"][name])
+        allowed = threshold + NOISE_FACTOR * noise
+        print(f"{name:32} {ratio:7.2f}x  allowed {1 + allowed:5.2f}x")
+        if ratio > 1 + allowed:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store the results as the new baseline instead of comparing",
+    )
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    current = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qpa": app.platformName(),
+            "repeat": args.repeat,
+        },
+        # results are seconds per operation, *_emissions signal emissions per drag;
+        # relative are the times per operation in reference runs
+        **report(run(args.repeat)),
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fid:
+            json.dump(current, fid, indent=2, sort_keys=True)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as fid:
+            json.dump(current, fid, indent=2, sort_keys=True)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as fid:
+        baseline = json.load(fid)
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"regressions: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
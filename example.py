@@ -7,7 +7,7 @@ import humanize
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout, QVBoxLayout, QLabel
 
-from qt_range_slider import QtRangeSlider
+from qt_range_slider import QtRangeSlider, Scale
 
 
 def _size(size):
@@ -85,7 +85,7 @@ def main():
     )
     min_value = 0
     max_value = 10 * 1024 * 1024 * 1024
-    _render_slider_with_labels(
+    slider = _render_slider_with_labels(
         layout,
         min_value,
         max_value,
@@ -93,6 +93,8 @@ def main():
         max_value * 3 // 4,
         size_value=True,
     )
+    # file sizes are skewed, a log scale keeps small sizes selectable
+    slider.set_scale(Scale.LOG)
 
     slider = _render_slider_with_labels(
         layout,
@@ -103,7 +105,7 @@ def main():
         size_value=True,
     )
     slider.setMinimumWidth(500)
-    slider.set_ticks_count(10)
+    slider.set_ticks_count(10, 4)
 
     main_window.show()
 
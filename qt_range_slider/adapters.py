@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Value adapters map user values (floats, decimals, datetimes) to the unsigned integer
+positions the sliders work with, and back.
+
+A position is the number of resolution steps from the adapter's origin, so the
+origin is the smallest value a slider can show. The to_positions and from_positions
+batch conversions run on NumPy arrays (an optional dependency) without a Python
+loop per value, e.g. to pass samples to set_distribution or observe.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+
+from .model import UINT64_MAX
+
+
+def _check_position(position):
+    if not 0 <= position <= UINT64_MAX:
+        raise ValueError("Value is outside of the range of the adapter.")
+    return position
+
+
+def _check_positions(positions):
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+
+    # float64 can't hold UINT64_MAX, larger values would wrap around in the cast
+    if positions.size and not (
+        np.isfinite(positions).all()
+        and positions.min() >= 0
+        and positions.max() < 2.0**64
+    ):
+        raise ValueError("Value is outside of the range of the adapter.")
+    return positions.astype(np.uint64)
+
+
+class ValueAdapter(ABC):
+    """
+    Base class of value adapters.
+
+    Subclasses implement the scalar conversions and the batch conversions. The
+    default batch conversions loop in Python, subclasses vectorize them.
+    """
+
+    @abstractmethod
+    def to_position(self, value):
+        """Return the slider position of value, rounded to the nearest step."""
+
+    @abstractmethod
+    def from_position(self, position):
+        """Return the value at a slider position."""
+
+    def format(self, value):
+        """Return the label text of value, e.g. for tick labels."""
+        return str(value)
+
+    def to_positions(self, values):
+        """Return the positions of values (an array-like) as a uint64 array."""
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        return np.array([self.to_position(value) for value in values], dtype=np.uint64)
+
+    def from_positions(self, positions):
+        """Return the values at positions (an array-like) as an array."""
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        return np.array(
+            [self.from_position(int(position)) for position in positions], dtype=object
+        )
+
+
+class FloatAdapter(ValueAdapter):
+    """
+    FloatAdapter maps floats from origin in steps of resolution.
+
+    Positions above 2**53 lose precision in the float arithmetic, so resolution
+    should not be finer than the range needs.
+    """
+
+    def __init__(self, origin=0.0, resolution=1e-6):
+        if resolution <= 0:
+            raise ValueError("Resolution must be positive.")
+        self._origin = float(origin)
+        self._resolution = float(resolution)
+        # as many decimals as the resolution has, e.g. 2 for 0.25 and 0 for 10.0
+        exponent = Decimal(repr(self._resolution)).normalize().as_tuple().exponent
+        self._decimals = max(0, -exponent)
+
+    @property
+    def origin(self):
+        return self._origin
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    def to_position(self, value):
+        return _check_position(round((value - self._origin) / self._resolution))
+
+    def from_position(self, position):
+        return self._origin + position * self._resolution
+
+    def format(self, value):
+        return f"{value:,.{self._decimals}f}"
+
+    def to_positions(self, values):
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64)
+        return _check_positions(np.rint((values - self._origin) / self._resolution))
+
+    def from_positions(self, positions):
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        positions = np.asarray(positions, dtype=np.uint64)
+        return self._origin + positions.astype(np.float64) * self._resolution
+
+
+class DecimalAdapter(ValueAdapter):
+    """
+    DecimalAdapter maps decimals from origin in fixed steps, e.g. cents.
+
+    Scalar conversions are exact. Numeric arrays are converted in float64, arrays
+    of Decimal objects exactly, one value at a time.
+    """
+
+    def __init__(self, origin=0, step="0.01"):
+        self._origin = Decimal(origin)
+        self._step = Decimal(step)
+        if self._step <= 0:
+            raise ValueError("Step must be positive.")
+
+    @property
+    def origin(self):
+        return self._origin
+
+    @property
+    def step(self):
+        return self._step
+
+    def to_position(self, value):
+        steps = (Decimal(value) - self._origin) / self._step
+        return _check_position(int(steps.to_integral_value(rounding=ROUND_HALF_UP)))
+
+    def from_position(self, position):
+        return self._origin + position * self._step
+
+    def format(self, value):
+        return f"{value:,}"
+
+    def to_positions(self, values):
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        values = np.asarray(values)
+        if values.dtype == object:
+            return super().to_positions(values)
+        return _check_positions(
+            np.floor(
+                (values.astype(np.float64) - float(self._origin)) / float(self._step)
+                + 0.5
+            )
+        )
+
+    def from_positions(self, positions):
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        # exact decimals, the multiplication runs per element on the object array
+        return (
+            np.asarray(positions, dtype=np.uint64).astype(object) * self._step
+            + self._origin
+        )
+
+
+class DatetimeAdapter(ValueAdapter):
+    """
+    DatetimeAdapter maps datetimes from origin in steps of resolution (a timedelta).
+
+    Batches are numpy datetime64 arrays. Aware datetimes are compared in UTC, arrays
+    are taken to be UTC. With an aware origin from_positions returns aware datetimes
+    in the zone of the origin, like from_position.
+    """
+
+    def __init__(self, origin, resolution=timedelta(seconds=1)):
+        if resolution <= timedelta(0):
+            raise ValueError("Resolution must be positive.")
+        self._origin = origin
+        self._resolution = resolution
+
+    @property
+    def origin(self):
+        return self._origin
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    def to_position(self, value):
+        return _check_position(round((value - self._origin) / self._resolution))
+
+    def from_position(self, position):
+        return self._origin + position * self._resolution
+
+    def format(self, value):
+        # date only for whole days, down to the seconds or microseconds otherwise
+        if self._resolution % timedelta(days=1) == timedelta(0):
+            return value.strftime("%Y-%m-%d")
+        if self._resolution % timedelta(seconds=1) == timedelta(0):
+            return value.strftime("%Y-%m-%d %H:%M:%S")
+        return value.isoformat(sep=" ")
+
+    def to_positions(self, values):
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        values = np.asarray(values, dtype="datetime64[us]")
+        offsets = (values - self.__numpy_origin()) / np.timedelta64(
+            self._resolution
+        ).astype("timedelta64[us]")
+        return _check_positions(np.rint(offsets))
+
+    def from_positions(self, positions):
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        positions = np.asarray(positions, dtype=np.uint64).astype(np.int64)
+        values = self.__numpy_origin() + positions * np.timedelta64(
+            self._resolution
+        ).astype("timedelta64[us]")
+        tzinfo = getattr(self._origin, "tzinfo", None)
+        if tzinfo is None:
+            return values
+        # datetime64 has no zone, the UTC values are converted one at a time
+        return np.array(
+            [
+                value.replace(tzinfo=timezone.utc).astimezone(tzinfo)
+                for value in values.tolist()
+            ],
+            dtype=object,
+        )
+
+    def __numpy_origin(self):
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        origin = self._origin
+        if isinstance(origin, datetime) and origin.tzinfo is not None:
+            origin = origin.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(origin, "us")
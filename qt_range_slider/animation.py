@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import time
+
+from collections import deque
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+
+# eased progress is applied to the value deltas in fixed point, exact for any range
+_PROGRESS_SCALE = 2**32
+
+
+def _ease_out_cubic(progress):
+    return 1 - (1 - progress) ** 3
+
+
+class RangeAnimation:
+    """
+    RangeAnimation moves a (low, high) range to a target with an ease-out curve.
+
+    Values are computed from the elapsed time, so an animation which misses frames
+    catches up instead of slowing down. apply(low, high) is called on every tick,
+    on_finished() once the target is reached.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, apply, start, target, duration_ms, now, *, on_finished=None):
+        self._apply = apply
+        self._on_finished = on_finished
+        self._start = start
+        self._target = target
+        self._duration = duration_ms / 1000
+        self._start_time = now
+        self._current = start
+        self._cancelled = False
+
+    @property
+    def target(self):
+        return self._target
+
+    def retarget(self, target, duration_ms, now):
+        """Move to a new target from the current values, restarting the duration."""
+        self._start = self._current
+        self._target = target
+        self._duration = duration_ms / 1000
+        self._start_time = now
+
+    def cancel(self):
+        """Stop the animation where it is, e.g. from a callback during a tick."""
+        self._cancelled = True
+
+    def tick(self, now):
+        """Apply the values for now, return if the animation is still running."""
+        elapsed = now - self._start_time
+        if self._duration <= 0 or elapsed >= self._duration:
+            self._current = self._target
+            self._apply(*self._target)
+            if self._on_finished is not None and not self._cancelled:
+                self._on_finished()
+            return False
+        progress = round(_ease_out_cubic(elapsed / self._duration) * _PROGRESS_SCALE)
+        self._current = tuple(
+            start + (target - start) * progress // _PROGRESS_SCALE
+            for start, target in zip(self._start, self._target)
+        )
+        self._apply(*self._current)
+        return not self._cancelled
+
+
+class StepAccelerator:
+    """
+    StepAccelerator sizes the steps of key presses and wheel notches.
+
+    Steps repeated within INTERVAL seconds double every RATE steps, up to the page
+    step, so holding a key crosses a huge range quickly and a single press still
+    moves by single_step. Wheel deltas are summed until they make a whole notch.
+    """
+
+    INTERVAL = 0.25
+    RATE = 3
+    # angle delta of one wheel notch, in eighths of a degree
+    NOTCH = 120
+
+    def __init__(self, single_step=1, page_step=None):
+        self.single_step = single_step
+        # None for a tenth of the span
+        self.page_step = page_step
+        self._streak = 0
+        self._last_time = None
+        self._wheel_delta = 0
+
+    def page(self, span):
+        if self.page_step is not None:
+            return self.page_step
+        return max(span // 10, 1)
+
+    def step(self, span, now):
+        """Return the step of a key press or wheel notch at time now."""
+        if self._last_time is not None and now - self._last_time <= self.INTERVAL:
+            self._streak += 1
+        else:
+            self._streak = 0
+        self._last_time = now
+        return min(
+            self.single_step * 2 ** (self._streak // self.RATE),
+            max(self.page(span), self.single_step),
+        )
+
+    def wheel_notches(self, delta):
+        """Add a wheel angle delta, return the number of whole notches to step."""
+        self._wheel_delta += delta
+        notches = int(self._wheel_delta / self.NOTCH)
+        self._wheel_delta -= notches * self.NOTCH
+        return notches
+
+
+class FrameClock(QObject):
+    """
+    FrameClock ticks every running animation in the process from a single timer.
+
+    Each frame ticks animations round-robin until the frame budget is spent, the
+    rest are ticked first on the next frame. Animations compute their values from
+    the elapsed time, so a deferred tick only lowers their frame rate. The timer
+    stops while nothing animates.
+
+    Methods
+
+            * (FrameClock) instance ():
+            * __init__ (self, parent=None, frame_rate=60, budget_ms=8)
+            * add (self, RangeAnimation animation):
+            * remove (self, RangeAnimation animation):
+            * (bool) is_running (self, RangeAnimation animation):
+            * set_frame_rate (self, frame_rate):
+            * set_budget (self, budget_ms):
+            * (dict) stats (self):
+
+    """
+
+    FRAME_RATE = 60
+    BUDGET_MS = 8
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Return the clock shared by all sliders."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None, frame_rate=FRAME_RATE, budget_ms=BUDGET_MS):
+        super().__init__(parent)
+        self._animations = deque()
+        self._scheduled = set()
+        self._frame_rate = None
+        self._budget_ms = None
+        self._frames = 0
+        self._ticks = 0
+        self._deferred_ticks = 0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.__on_frame)
+
+        self.set_frame_rate(frame_rate)
+        self.set_budget(budget_ms)
+
+    def set_frame_rate(self, frame_rate):
+        if frame_rate <= 0:
+            raise ValueError("Invalid frame rate.")
+        self._frame_rate = frame_rate
+        self._timer.setInterval(round(1000 / frame_rate))
+
+    def set_budget(self, budget_ms):
+        if budget_ms <= 0:
+            raise ValueError("Invalid frame budget.")
+        self._budget_ms = budget_ms
+
+    def add(self, animation):
+        if id(animation) in self._scheduled:
+            return
+        self._scheduled.add(id(animation))
+        self._animations.append(animation)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def remove(self, animation):
+        if id(animation) not in self._scheduled:
+            return
+        self._scheduled.discard(id(animation))
+        self._animations.remove(animation)
+        if not self._animations:
+            self._timer.stop()
+
+    def is_running(self, animation):
+        return id(animation) in self._scheduled
+
+    def stats(self):
+        return {
+            "frames": self._frames,
+            "ticks": self._ticks,
+            "deferred_ticks": self._deferred_ticks,
+            "running": len(self._animations),
+        }
+
+    def __on_frame(self):
+        self._frames += 1
+        deadline = time.monotonic() + self._budget_ms / 1000
+        count = len(self._animations)
+        for ticked in range(count):
+            if not self._animations:
+                break
+            now = time.monotonic()
+            # at least one animation moves per frame, however slow it is
+            if ticked and now > deadline:
+                self._deferred_ticks += count - ticked
+                break
+            animation = self._animations.popleft()
+            self._scheduled.discard(id(animation))
+            self._ticks += 1
+            # the tick may stop or restart the animation through its callbacks
+            if animation.tick(now) and id(animation) not in self._scheduled:
+                self._scheduled.add(id(animation))
+                self._animations.append(animation)
+        if not self._animations:
+            self._timer.stop()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate
+
+from .mapping import MapperCache
+from .renderer import RangeSliderColors, RangeSliderRenderer
+from .slider import QtRangeSlider
+
+
+class RangeSliderDelegate(QStyledItemDelegate):
+    """
+    RangeSliderDelegate paints and edits (low, high) ranges stored in a model role.
+
+    Cells are painted by a shared RangeSliderRenderer, a QtRangeSlider is only
+    created for the cell being edited. The bounds of a row can be stored as a
+    (min, max) pair in bounds_role, otherwise the delegate bounds are used.
+
+    Methods
+
+            * __init__ (self, min_value, max_value, parent=None, role=Qt.ItemDataRole.EditRole, bounds_role=None)
+
+    """
+
+    MAX_CACHED_MAPPERS = 16
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        min_value,
+        max_value,
+        parent=None,
+        role=Qt.ItemDataRole.EditRole,
+        bounds_role=None,
+    ):
+        super().__init__(parent)
+        if max_value <= min_value:
+            raise ValueError("Max value is less or equal min value.")
+        self._min_value = min_value
+        self._max_value = max_value
+        self._role = role
+        self._bounds_role = bounds_role
+        self._renderer = RangeSliderRenderer()
+        self._mappers = MapperCache(self.MAX_CACHED_MAPPERS)
+
+    def __get_bounds(self, index):
+        if self._bounds_role is not None:
+            bounds = index.data(self._bounds_role)
+            if bounds is not None:
+                return tuple(bounds)
+        return self._min_value, self._max_value
+
+    def __get_range(self, index):
+        value = index.data(self._role)
+        if value is None:
+            return self.__get_bounds(index)
+        return tuple(value)
+
+    # override QStyledItemDelegate
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawPrimitive(
+            QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget
+        )
+
+        rect = option.rect
+        mapper = self._mappers.get(
+            *self.__get_bounds(index), self._renderer.available_width(rect)
+        )
+        low, high = self.__get_range(index)
+        self._renderer.paint(
+            painter,
+            rect,
+            (mapper.value_to_pixel(low), mapper.value_to_pixel(high)),
+            RangeSliderColors.from_palette(option.palette, style),
+        )
+
+    # override QStyledItemDelegate
+    def sizeHint(self, option, index):
+        del option, index
+        return QSize(QtRangeSlider.WIDTH, QtRangeSlider.HEIGHT)
+
+    # override QStyledItemDelegate
+    def createEditor(self, parent, option, index):
+        del option
+        min_value, max_value = self.__get_bounds(index)
+        editor = QtRangeSlider(parent, min_value, max_value)
+        editor.setAutoFillBackground(True)
+        editor.range_committed.connect(lambda *_: self.commitData.emit(editor))
+        return editor
+
+    # override QStyledItemDelegate
+    def setEditorData(self, editor, index):
+        editor.set_range(*self.__get_range(index))
+
+    # override QStyledItemDelegate
+    def setModelData(self, editor, model, index):
+        model.setData(
+            index,
+            (editor.get_left_thumb_value(), editor.get_right_thumb_value()),
+            self._role,
+        )
+
+    # override QStyledItemDelegate
+    def updateEditorGeometry(self, editor, option, index):
+        del index
+        editor.setGeometry(option.rect)
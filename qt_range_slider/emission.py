@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import time
+
+from enum import Enum
+
+from PyQt6.QtCore import QTimer
+
+
+class EmissionPolicy(Enum):
+    """When value change signals are delivered to connected slots."""
+
+    # emit on every value change
+    IMMEDIATE = 0
+    # emit at most `rate` times per second, always delivering the latest value
+    THROTTLED = 1
+    # emit once the value has been stable for `delay` milliseconds
+    DEBOUNCED = 2
+    # emit once when the drag is released
+    ON_RELEASE = 3
+
+
+class SignalEmitter:
+    """
+    SignalEmitter delivers values to a bound signal according to an EmissionPolicy.
+
+    Only the latest pending value is kept, intermediate values are dropped.
+    """
+
+    def __init__(self, signal, parent, name=None):
+        self._signal = signal
+        self._name = name
+        # Instrumentation counting the emissions, if any
+        self.instrumentation = None
+        self._policy = EmissionPolicy.IMMEDIATE
+        self._interval_ms = 0
+        self._pending = None
+        self._last_emit_time = None
+
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def policy(self):
+        return self._policy
+
+    def has_pending(self):
+        return self._pending is not None
+
+    def set_policy(self, policy, interval_ms=0):
+        self.flush()
+        self._policy = policy
+        self._interval_ms = interval_ms
+
+    def emit(self, *args, dragging=False):
+        policy = self._policy
+        if policy == EmissionPolicy.IMMEDIATE or (
+            policy == EmissionPolicy.ON_RELEASE and not dragging
+        ):
+            self.__emit(args)
+            return
+
+        self._pending = args
+        if policy == EmissionPolicy.DEBOUNCED:
+            self._timer.start(round(self._interval_ms))
+        elif policy == EmissionPolicy.THROTTLED and not self._timer.isActive():
+            elapsed_ms = (
+                self._interval_ms
+                if self._last_emit_time is None
+                else (time.monotonic() - self._last_emit_time) * 1000
+            )
+            if elapsed_ms >= self._interval_ms:
+                self.flush()
+            else:
+                self._timer.start(round(self._interval_ms - elapsed_ms))
+
+    def flush(self):
+        """Emit the pending value now, if there is one."""
+        self._timer.stop()
+        if self._pending is None:
+            return
+        args = self._pending
+        self._pending = None
+        self.__emit(args)
+
+    def __emit(self, args):
+        self._last_emit_time = time.monotonic()
+        if self.instrumentation is not None:
+            self.instrumentation.count(f"emissions.{self._name}")
+        self._signal.emit(*args)
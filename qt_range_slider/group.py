@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class RangeSliderGroup(QObject):
+    """
+    RangeSliderGroup links sliders whose ranges filter each other.
+
+    Range changes of the registered sliders are collected until the event loop runs
+    again, then the propagate callback is called once with all of them:
+
+        propagate(changes, ranges) -> updates
+
+    changes and ranges map slider keys to (low, high), changes holds only the
+    sliders which changed. updates maps slider keys to a dict with any of the
+    entries "bounds" (min, max), "range" (low, high), "samples" or "histogram"
+    (counts, edges). Each slider applies its updates in one batch, so it repaints
+    once. Changes caused by applying updates don't trigger another propagation.
+
+    Methods
+
+            * __init__ (self, propagate=None, parent=None)
+            * add_slider (self, key, QtRangeSlider slider):
+            * remove_slider (self, key):
+            * (QtRangeSlider) slider (self, key):
+            * (dict) ranges (self):
+            * set_propagate (self, propagate):
+            * flush (self):
+            * (int) propagation_count (self):
+
+    Signals
+
+            * propagated (dict changes)
+
+    """
+
+    propagated = pyqtSignal(object)
+
+    def __init__(self, propagate=None, parent=None):
+        super().__init__(parent)
+        self._propagate = propagate
+        self._sliders = {}
+        self._connections = {}
+        self._changes = {}
+        self._scheduled = False
+        self._applying = False
+        self._propagation_count = 0
+
+    def add_slider(self, key, slider):
+        if key in self._sliders:
+            raise ValueError(f"Slider {key!r} is already in the group.")
+        self._sliders[key] = slider
+        self._connections[key] = slider.range_changed.connect(
+            lambda low, high: self.__on_range_changed(key, low, high)
+        )
+
+    def remove_slider(self, key):
+        slider = self._sliders.pop(key)
+        slider.range_changed.disconnect(self._connections.pop(key))
+        self._changes.pop(key, None)
+
+    def slider(self, key):
+        return self._sliders[key]
+
+    def ranges(self):
+        return {
+            key: (slider.get_left_thumb_value(), slider.get_right_thumb_value())
+            for key, slider in self._sliders.items()
+        }
+
+    def set_propagate(self, propagate):
+        self._propagate = propagate
+
+    def propagation_count(self):
+        return self._propagation_count
+
+    def flush(self):
+        """Propagate the collected changes now instead of on the next event loop turn."""
+        self._scheduled = False
+        if not self._changes:
+            return
+        changes = self._changes
+        self._changes = {}
+        self._propagation_count += 1
+        if self._propagate is not None:
+            self.__apply(self._propagate(changes, self.ranges()) or {})
+        self.propagated.emit(changes)
+
+    def __on_range_changed(self, key, low, high):
+        if self._applying:
+            return
+        self._changes[key] = (low, high)
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def __apply(self, updates):
+        self._applying = True
+        try:
+            for key, update in updates.items():
+                slider = self._sliders[key]
+                with slider.batch_update():
+                    if "bounds" in update:
+                        slider.set_bounds(*update["bounds"])
+                    if "samples" in update:
+                        slider.set_distribution(update["samples"])
+                    if "histogram" in update:
+                        slider.set_histogram(*update["histogram"])
+                    if "range" in update:
+                        slider.set_range(*update["range"])
+        finally:
+            self._applying = False
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+class Distribution:
+    """
+    Distribution holds a data distribution and bins it to a pixel width.
+
+    The data is either raw samples, a precomputed histogram, or both. Binned counts
+    are cached per (width, data version); appended samples are binned on their own
+    and added to the cached counts instead of binning all of the data again.
+    """
+
+    MAX_CACHED_WIDTHS = 8
+
+    def __init__(self, min_value, max_value):
+        if max_value <= min_value:
+            raise ValueError("Max value is less or equal min value.")
+        self._min_value = min_value
+        self._max_value = max_value
+        self._chunks = []
+        self._counts = None
+        self._edges = None
+        self._version = 0
+        self._cache = {}
+
+    @property
+    def version(self):
+        return self._version
+
+    def set_bounds(self, min_value, max_value):
+        if max_value <= min_value:
+            raise ValueError("Max value is less or equal min value.")
+        self._min_value = min_value
+        self._max_value = max_value
+        self.__changed()
+
+    def set_samples(self, samples):
+        self._chunks = [_as_samples(samples)]
+        self._counts = None
+        self._edges = None
+        self.__changed()
+
+    def set_histogram(self, counts, edges):
+        counts = np.asarray(counts, dtype=np.float64).ravel()
+        edges = np.asarray(edges, dtype=np.float64).ravel()
+        if len(edges) != len(counts) + 1:
+            raise ValueError("Histogram must have one more edge than counts.")
+        if np.any(np.diff(edges) <= 0):
+            raise ValueError("Histogram edges must be strictly increasing.")
+        self._chunks = []
+        self._counts = counts
+        self._edges = edges
+        self.__changed()
+
+    def append_samples(self, samples):
+        chunk = _as_samples(samples)
+        if chunk.size == 0:
+            return
+        self._chunks.append(chunk)
+        self._version += 1
+        for width, (_, counts) in self._cache.items():
+            counts += self.__bin_samples(chunk, width)
+            self._cache[width] = (self._version, counts)
+
+    def binned(self, width, edges=None):
+        """
+        Return float64 counts of width equally sized bins over [min, max].
+
+        Non-linear scales pass the width + 1 bin edges instead, these counts are not
+        cached as they are only needed when the track background is drawn again.
+        """
+        if edges is not None:
+            return self.__bin_by_edges(np.asarray(edges, dtype=np.float64))
+
+        cached = self._cache.get(width)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        counts = np.zeros(width, dtype=np.float64)
+        for chunk in self._chunks:
+            counts += self.__bin_samples(chunk, width)
+        if self._counts is not None:
+            counts += self.__rebin_histogram(width)
+
+        if len(self._cache) >= self.MAX_CACHED_WIDTHS:
+            self._cache.clear()
+        self._cache[width] = (self._version, counts)
+        return counts
+
+    def __bin_by_edges(self, edges):
+        counts = np.zeros(len(edges) - 1, dtype=np.float64)
+        for chunk in self._chunks:
+            counts += np.histogram(chunk, bins=edges)[0]
+        if self._counts is not None:
+            counts += np.diff(np.interp(edges, self._edges, self.__cumulative()))
+        return counts
+
+    def __cumulative(self):
+        return np.concatenate(([0.0], np.cumsum(self._counts)))
+
+    def __changed(self):
+        self._version += 1
+        self._cache.clear()
+
+    def __bin_samples(self, samples, width):
+        counts, _ = np.histogram(
+            samples, bins=width, range=(self._min_value, self._max_value)
+        )
+        return counts
+
+    def __rebin_histogram(self, width):
+        # interpolate the cumulative counts at the pixel bin edges
+        pixel_edges = np.linspace(self._min_value, self._max_value, width + 1)
+        return np.diff(np.interp(pixel_edges, self._edges, self.__cumulative()))
+
+
+def _as_samples(samples):
+    return np.asarray(samples).ravel()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import json
+import os
+import threading
+import time
+
+from collections import deque
+
+# Set QT_RANGE_SLIDER_INSTRUMENTATION=1 to instrument every new slider.
+ENABLED_BY_DEFAULT = bool(os.environ.get("QT_RANGE_SLIDER_INSTRUMENTATION"))
+
+
+class Histogram:
+    """Histogram of durations in power of two microsecond buckets."""
+
+    BUCKETS = 24
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * self.BUCKETS
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        micros = int(seconds * 1_000_000)
+        self.buckets[min(micros.bit_length(), self.BUCKETS - 1)] += 1
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_s": self.total,
+            "mean_s": self.total / self.count if self.count else 0.0,
+            "max_s": self.max,
+            # bucket i holds durations below 2**i microseconds
+            "buckets_us": {
+                2**index: count for index, count in enumerate(self.buckets) if count
+            },
+        }
+
+
+class Instrumentation:
+    """
+    Instrumentation collects counters, timing histograms and trace events of a widget.
+
+    Widgets only call into it when it is attached, so it costs a single attribute
+    check when disabled.
+    """
+
+    MAX_TRACE_EVENTS = 10000
+
+    def __init__(self, name="QtRangeSlider"):
+        self._name = name
+        self._counters = {}
+        self._histograms = {}
+        self._trace_events = deque(maxlen=self.MAX_TRACE_EVENTS)
+        self._origin = time.perf_counter()
+
+    @property
+    def name(self):
+        return self._name
+
+    def count(self, counter, amount=1):
+        self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def counter(self, counter):
+        return self._counters.get(counter, 0)
+
+    def start(self):
+        """Return a timestamp to pass to finish."""
+        return time.perf_counter()
+
+    def finish(self, span, start):
+        """Record the duration of span since start in its histogram and the trace."""
+        end = time.perf_counter()
+        histogram = self._histograms.get(span)
+        if histogram is None:
+            histogram = self._histograms[span] = Histogram()
+        histogram.add(end - start)
+        self._trace_events.append((span, start, end))
+
+    def reset(self):
+        self._counters.clear()
+        self._histograms.clear()
+        self._trace_events.clear()
+
+    def to_dict(self):
+        return {
+            "name": self._name,
+            "counters": dict(self._counters),
+            "timings": {
+                span: histogram.to_dict()
+                for span, histogram in self._histograms.items()
+            },
+        }
+
+    def to_chrome_trace(self):
+        """Return the recorded spans in the Chrome trace event format."""
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = [
+            {
+                "name": span,
+                "cat": self._name,
+                "ph": "X",
+                "ts": (start - self._origin) * 1_000_000,
+                "dur": (end - start) * 1_000_000,
+                "pid": pid,
+                "tid": tid,
+            }
+            for span, start, end in self._trace_events
+        ]
+        events.extend(
+            {
+                "name": counter,
+                "cat": self._name,
+                "ph": "C",
+                "ts": (time.perf_counter() - self._origin) * 1_000_000,
+                "pid": pid,
+                "tid": tid,
+                "args": {counter: value},
+            }
+            for counter, value in self._counters.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, path):
+        """Write the Chrome trace JSON to path, loadable in chrome://tracing or Perfetto."""
+        with open(path, "w", encoding="utf-8") as fid:
+            json.dump(self.to_chrome_trace(), fid)
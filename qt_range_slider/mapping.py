@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import math
+
+from bisect import bisect_left, bisect_right
+from enum import Enum
+
+
+def _round_div(numerator, denominator):
+    """Integer division rounding half up, exact for arbitrarily large integers."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+class Scale(Enum):
+    """Scale of a slider track."""
+
+    LINEAR = "linear"
+    LOG = "log"
+    DISTINCT = "distinct"
+
+
+class ValueMapper:
+    """
+    ValueMapper maps values in [min_value, max_value] to pixels in [0, width] and back.
+
+    All arithmetic is done on integers, so 64-bit (and larger) ranges are mapped
+    exactly. The pixel to value table and the value bucket boundaries are
+    precomputed whenever the width changes.
+    """
+
+    scale = Scale.LINEAR
+
+    def __init__(self, min_value, max_value, width=1):
+        if max_value <= min_value:
+            raise ValueError("Max value is less or equal min value.")
+        self._min_value = min_value
+        self._max_value = max_value
+        self._width = None
+        self._pixel_values = None
+        self._bucket_starts = None
+        self.set_width(width)
+
+    @property
+    def min_value(self):
+        return self._min_value
+
+    @property
+    def max_value(self):
+        return self._max_value
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def pixel_values(self):
+        """The value at each pixel from 0 to width, e.g. to bin data per pixel."""
+        return self._pixel_values
+
+    def with_bounds(self, min_value, max_value):
+        """Return a mapper of the same scale and width for other bounds."""
+        return type(self)(min_value, max_value, self._width)
+
+    def set_width(self, width):
+        width = max(width, 1)
+        if width == self._width:
+            return
+        self._width = width
+        self._pixel_values, self._bucket_starts = self._build_tables(width)
+
+    def _build_tables(self, width):
+        """Return the value of each pixel and the smallest value mapped to each pixel."""
+        span = self._max_value - self._min_value
+        pixel_values = [
+            self._min_value + _round_div(pixel * span, width)
+            for pixel in range(width + 1)
+        ]
+        # the smallest value of each pixel: the first v with value_to_pixel(v) == pixel
+        bucket_starts = [self._min_value] + [
+            self._min_value + -((-(2 * pixel - 1) * span) // (2 * width))
+            for pixel in range(1, width + 1)
+        ]
+        return pixel_values, bucket_starts
+
+    def clamp_pixel(self, pixel):
+        return min(max(pixel, 0), self._width)
+
+    def clamp_value(self, value):
+        return min(max(value, self._min_value), self._max_value)
+
+    def value_to_pixel(self, value):
+        span = self._max_value - self._min_value
+        return _round_div(
+            (self.clamp_value(value) - self._min_value) * self._width, span
+        )
+
+    def pixel_to_value(self, pixel):
+        return self._pixel_values[self.clamp_pixel(pixel)]
+
+    def bucket(self, value):
+        """Return the pixel of value looked up in the bucket boundaries table."""
+        return bisect_right(self._bucket_starts, self.clamp_value(value)) - 1
+
+    def bucket_bounds(self, pixel):
+        """Return the inclusive range of values mapped to pixel."""
+        pixel = self.clamp_pixel(pixel)
+        start = self._bucket_starts[pixel]
+        if pixel == self._width:
+            return start, self._max_value
+        return start, self._bucket_starts[pixel + 1] - 1
+
+
+class LogValueMapper(ValueMapper):
+    """
+    LogValueMapper spaces log(1 + value - min_value) evenly over the track.
+
+    Pixels map to values through the precomputed table and values to pixels by a
+    bisect in the bucket boundaries, so both directions stay exact integers.
+    """
+
+    scale = Scale.LOG
+
+    def _build_tables(self, width):
+        span = self._max_value - self._min_value
+        log_span = math.log1p(span)
+
+        def offset(position):
+            return min(span, math.expm1(position * log_span / width))
+
+        pixel_values = [
+            self._min_value + round(offset(pixel)) for pixel in range(width)
+        ] + [self._max_value]
+        bucket_starts = [self._min_value] + [
+            self._min_value + math.ceil(offset(pixel - 0.5))
+            for pixel in range(1, width + 1)
+        ]
+        return pixel_values, bucket_starts
+
+    def value_to_pixel(self, value):
+        return self.bucket(value)
+
+
+class DistinctValueMapper(ValueMapper):
+    """
+    DistinctValueMapper spaces the distinct values of a dataset evenly over the track.
+
+    Pixels snap to dataset values, values in between map to the pixel of the nearest
+    smaller dataset value. The bounds are always part of the values. The whole
+    dataset is kept, so values outside of the bounds come back when they widen.
+    """
+
+    scale = Scale.DISTINCT
+
+    def __init__(self, min_value, max_value, values, width=1):
+        if hasattr(values, "tolist"):
+            # numpy arrays, converting in one call is much faster than iterating
+            values = values.tolist()
+        self._dataset = sorted({int(value) for value in values})
+        self._values = self.__values_in_bounds(min_value, max_value)
+        super().__init__(min_value, max_value, width)
+
+    @property
+    def values(self):
+        return self._values
+
+    def with_bounds(self, min_value, max_value):
+        # rebuilt from the whole dataset, not from the values inside the old bounds
+        return DistinctValueMapper(min_value, max_value, self._dataset, self._width)
+
+    def __values_in_bounds(self, min_value, max_value):
+        start = bisect_left(self._dataset, min_value)
+        end = bisect_right(self._dataset, max_value)
+        return sorted(set(self._dataset[start:end]) | {min_value, max_value})
+
+    def _build_tables(self, width):
+        last = len(self._values) - 1
+        pixel_values = [
+            self._values[_round_div(pixel * last, width)] for pixel in range(width + 1)
+        ]
+        bucket_starts = [self._min_value] + [
+            self._values[-((-(2 * pixel - 1) * last) // (2 * width))]
+            for pixel in range(1, width + 1)
+        ]
+        return pixel_values, bucket_starts
+
+    def value_to_pixel(self, value):
+        return self.bucket(value)
+
+
+class MapperCache:
+    """
+    MapperCache keeps linear ValueMappers by bounds and width.
+
+    Rows of item views and panels usually share their bounds and width, so a few
+    mappers serve all of them. The cache is cleared once it holds max_size mappers.
+    """
+
+    def __init__(self, max_size=16):
+        self._max_size = max_size
+        self._mappers = {}
+
+    def get(self, min_value, max_value, width):
+        key = (min_value, max_value, width)
+        mapper = self._mappers.get(key)
+        if mapper is None:
+            if len(self._mappers) >= self._max_size:
+                self._mappers.clear()
+            mapper = self._mappers[key] = ValueMapper(min_value, max_value, width)
+        return mapper
+
+    def clear(self):
+        self._mappers.clear()
+
+
+def create_mapper(scale, min_value, max_value, values=None, width=1):
+    """Return a mapper of the given Scale, DISTINCT needs the dataset values."""
+    if scale == Scale.LOG:
+        return LogValueMapper(min_value, max_value, width)
+    if scale == Scale.DISTINCT:
+        if values is None:
+            raise ValueError("Distinct values scale needs values.")
+        return DistinctValueMapper(min_value, max_value, values, width)
+    return ValueMapper(min_value, max_value, width)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import math
+
+from contextlib import contextmanager
+
+# the widgets' signals carry unsigned 64-bit values
+UINT64_MAX = 2**64 - 1
+
+
+def _check_bounds(min_value, max_value):
+    if max_value <= min_value:
+        raise ValueError("Max value is less or equal min value.")
+    if min_value < 0 or max_value > UINT64_MAX:
+        raise ValueError("Bounds are outside of the unsigned 64-bit range.")
+
+
+class RangeModel:
+    """
+    RangeModel holds a (low, high) range inside [min_value, max_value].
+
+    It has no Qt dependency, so filters can be validated with the same rules the
+    widget applies, without loading PyQt6. Listeners are called with the previous
+    (low, high) after every change, or once after the outermost batch_update.
+
+    Methods
+
+            * __init__ (self, min_value, max_value, low=None, high=None)
+            * (bool) is_valid_range (self, low, high):
+            * (bool) set_low (self, int value):
+            * (bool) set_high (self, int value):
+            * (bool) set_range (self, int low, int high):
+            * (bool) set_bounds (self, int min_value, int max_value):
+            * batch_update (self):
+            * add_listener (self, callback):
+            * remove_listener (self, callback):
+
+    """
+
+    __slots__ = (
+        "_min_value",
+        "_max_value",
+        "_low",
+        "_high",
+        "_listeners",
+        "_batch_depth",
+        "_batch_range",
+    )
+
+    def __init__(self, min_value, max_value, low=None, high=None):
+        _check_bounds(min_value, max_value)
+        low = min_value if low is None else low
+        high = max_value if high is None else high
+        if high < low + 1:
+            raise ValueError("Right thumb value is less or equal left thumb value.")
+        self._min_value = min_value
+        self._max_value = max_value
+        self._low = low
+        self._high = high
+        self._listeners = []
+        self._batch_depth = 0
+        # the range before the outermost batch started
+        self._batch_range = None
+
+    # the bounds have the same accessors as ValueMapper
+    # pylint: disable=duplicate-code
+    @property
+    def min_value(self):
+        return self._min_value
+
+    @property
+    def max_value(self):
+        return self._max_value
+
+    @property
+    def low(self):
+        return self._low
+
+    @property
+    def high(self):
+        return self._high
+
+    def is_valid_range(self, low, high):
+        return self._min_value <= low <= high - 1 and high <= self._max_value
+
+    def set_low(self, value):
+        """Move the low end, values outside [min_value, high) are ignored."""
+        if value < self._min_value or value > self._high - 1:
+            return False
+        return self.__set(value, self._high)
+
+    def set_high(self, value):
+        """Move the high end, values outside (low, max_value] are ignored."""
+        if value > self._max_value or value < self._low + 1:
+            return False
+        return self.__set(self._low, value)
+
+    def set_range(self, low, high):
+        """Move both ends, validated against each other instead of the current range."""
+        if not self.is_valid_range(low, high):
+            return False
+        return self.__set(low, high)
+
+    def set_bounds(self, min_value, max_value):
+        """Change the bounds and clamp the range into them, return if the range changed."""
+        _check_bounds(min_value, max_value)
+        self._min_value = min_value
+        self._max_value = max_value
+        low = min(max(self._low, min_value), max_value - 1)
+        high = min(max(self._high, low + 1), max_value)
+        return self.__set(low, high)
+
+    @contextmanager
+    def batch_update(self):
+        """Notify the listeners once, when the outermost batch exits."""
+        if not self._batch_depth:
+            self._batch_range = (self._low, self._high)
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                old_range = self._batch_range
+                self._batch_range = None
+                if old_range != (self._low, self._high):
+                    self.__notify(*old_range)
+
+    def add_listener(self, callback):
+        """Call callback(old_low, old_high) after every change of the range."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self._listeners.remove(callback)
+
+    def __set(self, low, high):
+        old_low = self._low
+        old_high = self._high
+        if (low, high) == (old_low, old_high):
+            # nothing to update
+            return False
+        self._low = low
+        self._high = high
+        if not self._batch_depth:
+            self.__notify(old_low, old_high)
+        return True
+
+    def __notify(self, old_low, old_high):
+        for callback in self._listeners:
+            callback(old_low, old_high)
+
+
+def grow_bounds(min_value, max_value, low, high, growth=2):
+    """
+    Return bounds which include [low, high], or None if the bounds already do.
+
+    The bounds grow by growth times the distance to the observed value, doubling the
+    headroom by default, so a steadily growing stream rescales O(log n) times. They
+    never grow past 0 and UINT64_MAX, values outside of these can't be shown.
+    """
+    if growth <= 1:
+        raise ValueError("Growth must be greater than 1.")
+    if min_value <= low and high <= max_value:
+        return None
+    new_min_value = min_value
+    new_max_value = max_value
+    if high > max_value:
+        new_max_value = min(
+            min_value + math.ceil((high - min_value) * growth), UINT64_MAX
+        )
+    if low < min_value:
+        new_min_value = max(max_value - math.ceil((max_value - low) * growth), 0)
+    if (new_min_value, new_max_value) == (min_value, max_value):
+        # already at the limits
+        return None
+    return new_min_value, new_max_value
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from array import array
+from bisect import bisect_left, bisect_right
+
+from PyQt6.QtCore import QEvent, QRect, pyqtSignal
+from PyQt6.QtGui import QPainter, QRegion
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+
+from .mapping import ValueMapper
+from .renderer import RangeSliderColors, RangeSliderRenderer, ThumbDrag
+from .sprites import ThumbSpriteCache, ThumbState
+
+
+# pylint: disable=too-many-instance-attributes
+class MultiThumbSlider(QWidget):
+    """
+    MultiThumbSlider is a slider with any number of thumbs, e.g. bucket breakpoints.
+
+    Thumb values are kept strictly increasing in a compact array, together with the
+    track pixel of every thumb. Hit-tests and neighbor constraints are bisect lookups
+    in these arrays, and moving a thumb repaints only its old and new rects, so the cost of a mouse event does not grow with the number of thumbs.
+
+    Methods
+
+            * __init__ (self, QWidget parent, min_value, max_value, values=()):
+            * (int) count (self):
+            * set_values (self, values):
+            * ((int, ...)) get_values (self):
+            * set_value (self, int index, int value):
+            * (int) get_value (self, int index):
+
+    Signals
+
+            * value_changed (int index, int value)
+            * values_changed (tuple)
+            * values_committed (tuple)
+
+    """
+
+    HEIGHT = 30
+    WIDTH = 120
+
+    value_changed = pyqtSignal(int, "unsigned long long")
+    values_changed = pyqtSignal(tuple)
+    values_committed = pyqtSignal(tuple)
+
+    def __init__(self, parent, min_value, max_value, values=()):
+        super().__init__(parent)
+
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.setMinimumWidth(self.WIDTH)
+        self.setMinimumHeight(self.HEIGHT)
+
+        self._renderer = RangeSliderRenderer()
+        self._colors = RangeSliderColors.from_palette(self.palette(), self.style())
+        self._mapper = ValueMapper(min_value, max_value)
+        self._values = array("Q")
+        self._pixels = array("q")
+
+        self._pressed = None
+        self._drag = ThumbDrag(self._renderer)
+
+        self.set_values(values)
+
+    def count(self):
+        return len(self._values)
+
+    def get_values(self):
+        return tuple(self._values)
+
+    def get_value(self, index):
+        return self._values[index]
+
+    def set_values(self, values):
+        """Replace all thumbs, values must be strictly increasing and within bounds."""
+        values = array("Q", values)
+        for index, value in enumerate(values):
+            if not self._mapper.min_value <= value <= self._mapper.max_value:
+                raise ValueError("Thumb value is out of bounds.")
+            if index and value <= values[index - 1]:
+                raise ValueError("Thumb values are not strictly increasing.")
+        if values == self._values:
+            return
+        self._values = values
+        self._pixels = array("q", map(self._mapper.value_to_pixel, values))
+        self._pressed = None
+        self.update()
+        self.values_changed.emit(self.get_values())
+
+    def set_value(self, index, value):
+        """Move a thumb, values outside of its neighbors are ignored."""
+        low, high = self.__get_value_limits(index)
+        if not low <= value <= high or value == self._values[index]:
+            return
+        old_pixel = self._pixels[index]
+        self._values[index] = value
+        self._pixels[index] = self._mapper.value_to_pixel(value)
+        if self._pixels[index] != old_pixel:
+            self.update(self.__get_thumb_region(index, old_pixel))
+        self.value_changed.emit(index, value)
+        self.values_changed.emit(self.get_values())
+
+    def __get_area(self):
+        return self.rect()
+
+    def __get_value_limits(self, index):
+        """Return the inclusive range of values allowed between the neighbors."""
+        low = self._values[index - 1] + 1 if index > 0 else self._mapper.min_value
+        high = (
+            self._values[index + 1] - 1
+            if index + 1 < len(self._values)
+            else self._mapper.max_value
+        )
+        return low, high
+
+    def __get_thumb_region(self, index, old_pixel=None):
+        """Return the old and new thumb rects plus the track fill strip between them."""
+        area = self.__get_area()
+        new_rect = self._renderer.thumb_rect(area, self._pixels[index])
+        old_rect = (
+            new_rect
+            if old_pixel is None
+            else self._renderer.thumb_rect(area, old_pixel)
+        )
+        # antialiased ellipse edges bleed into the sprite margin
+        margin = ThumbSpriteCache.MARGIN
+        region = QRegion(old_rect.adjusted(-margin, -margin, margin, margin))
+        region = region.united(new_rect.adjusted(-margin, -margin, margin, margin))
+        x1 = min(old_rect.center().x(), new_rect.center().x())
+        x2 = max(old_rect.center().x(), new_rect.center().x())
+        track_rect = self._renderer.track_rect(area)
+        strip = QRect(x1, track_rect.y(), x2 - x1 + 1, track_rect.height())
+        return region.united(strip)
+
+    def __get_thumb_at(self, x, y):
+        """Return the index of the topmost thumb under x, y or None."""
+        area = self.__get_area()
+        pixel = self._renderer.thumb_pixel(area, x)
+        index = bisect_left(self._pixels, pixel)
+        # the nearest thumbs are the only ones which can contain the point
+        candidates = sorted(
+            (i for i in (index - 1, index) if 0 <= i < len(self._pixels)),
+            key=lambda i: abs(self._pixels[i] - pixel),
+        )
+        for candidate in candidates:
+            if self._renderer.hit_test(area, (self._pixels[candidate],), x, y) == 0:
+                return candidate
+        return None
+
+    # override Qt event
+    def changeEvent(self, event):
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.StyleChange):
+            self._colors = RangeSliderColors.from_palette(self.palette(), self.style())
+            self.update()
+        super().changeEvent(event)
+
+    # override Qt event
+    def paintEvent(self, event):
+        area = self.__get_area()
+        bounds = event.region().boundingRect()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        colors = self._colors
+        dpr = self.devicePixelRatioF()
+
+        self._renderer.draw_track(painter, area)
+        if self._pixels:
+            self._renderer.draw_track_fill(
+                painter, area, self._pixels[0], self._pixels[-1]
+            )
+
+        # only thumbs overlapping the exposed area are drawn
+        half_width = self._renderer.thumb_width // 2 + 1
+        first = bisect_left(
+            self._pixels, self._renderer.thumb_pixel(area, bounds.left()) - half_width
+        )
+        last = bisect_right(
+            self._pixels, self._renderer.thumb_pixel(area, bounds.right()) + half_width
+        )
+        for index in range(first, last):
+            state = ThumbState.PRESSED if index == self._pressed else ThumbState.NORMAL
+            self._renderer.draw_thumb(
+                painter,
+                self._renderer.thumb_rect(area, self._pixels[index]),
+                state,
+                colors,
+                dpr,
+            )
+        painter.end()
+
+    # override Qt event
+    def mousePressEvent(self, event):
+        position = event.position()
+        index = self.__get_thumb_at(position.x(), position.y())
+        if index is not None:
+            self._pressed = index
+            self._drag.press(self.__get_area(), position.x(), self._pixels[index])
+            self.update(self.__get_thumb_region(index))
+        super().mousePressEvent(event)
+
+    # override Qt event
+    def mouseMoveEvent(self, event):
+        if self._pressed is not None:
+            pixel = self._drag.move(
+                self.__get_area(), event.position().x(), self._mapper
+            )
+            if pixel is not None:
+                low, high = self.__get_value_limits(self._pressed)
+                self.set_value(
+                    self._pressed,
+                    min(max(self._mapper.pixel_to_value(pixel), low), high),
+                )
+        super().mouseMoveEvent(event)
+
+    # override Qt event
+    def mouseReleaseEvent(self, event):
+        if self._pressed is not None:
+            index = self._pressed
+            self._pressed = None
+            self.update(self.__get_thumb_region(index))
+            self.values_committed.emit(self.get_values())
+        super().mouseReleaseEvent(event)
+
+    # override Qt event
+    def resizeEvent(self, event):
+        del event
+        self._mapper.set_width(self._renderer.available_width(self.__get_area()))
+        self._pixels = array("q", map(self._mapper.value_to_pixel, self._values))
+        self._drag.invalidate()
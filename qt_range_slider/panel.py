@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from array import array
+
+from PyQt6.QtCore import Qt, QEvent, QRect, QSize, pyqtSignal
+from PyQt6.QtGui import QPainter
+from PyQt6.QtWidgets import QAbstractScrollArea
+
+from .mapping import MapperCache
+from .renderer import RangeSliderColors, RangeSliderRenderer, ThumbDrag
+from .sprites import ThumbState
+
+
+# pylint: disable=too-many-instance-attributes
+class RangeSliderPanel(QAbstractScrollArea):
+    """
+    RangeSliderPanel shows many ranges as stacked sliders in a single widget.
+
+    The ranges are kept in compact arrays and only the rows inside the viewport are
+    painted, all with one QPainter. Signals carry the index of the range.
+
+    Methods
+
+            * __init__ (self, QWidget parent=None)
+            * (int) add_range (self, min_value, max_value, left_thumb_value=None, right_thumb_value=None, label=""):
+            * (int) count (self):
+            * clear (self):
+            * set_range (self, int index, int left_thumb_value, int right_thumb_value):
+            * ((int, int)) get_range (self, int index):
+            * ((int, int)) get_bounds (self, int index):
+
+    Signals
+
+            * left_thumb_value_changed (int index, int value)
+            * right_thumb_value_changed (int index, int value)
+            * range_changed (int index, int, int)
+            * range_committed (int index, int, int)
+
+    """
+
+    ROW_HEIGHT = 30
+    LABEL_WIDTH = 120
+    LABEL_PADDING = 4
+    MAX_CACHED_MAPPERS = 64
+
+    left_thumb_value_changed = pyqtSignal(int, "unsigned long long")
+    right_thumb_value_changed = pyqtSignal(int, "unsigned long long")
+    range_changed = pyqtSignal(int, "unsigned long long", "unsigned long long")
+    range_committed = pyqtSignal(int, "unsigned long long", "unsigned long long")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+        self._renderer = RangeSliderRenderer()
+        self._colors = RangeSliderColors.from_palette(self.palette(), self.style())
+        self._min_values = array("Q")
+        self._max_values = array("Q")
+        self._left_values = array("Q")
+        self._right_values = array("Q")
+        self._labels = []
+        # the label column is shown while any row has a label
+        self._labeled_rows = 0
+        self._mappers = MapperCache(self.MAX_CACHED_MAPPERS)
+
+        # (row, thumb index) of the dragged thumb
+        self._drag = None
+        self._thumb_drag = ThumbDrag(self._renderer)
+
+    def count(self):
+        return len(self._left_values)
+
+    def add_range(
+        self,
+        min_value,
+        max_value,
+        left_thumb_value=None,
+        right_thumb_value=None,
+        label="",
+    ):
+        """Append a range and return its index."""
+        left_thumb_value = min_value if left_thumb_value is None else left_thumb_value
+        right_thumb_value = (
+            max_value if right_thumb_value is None else right_thumb_value
+        )
+        if max_value <= min_value:
+            raise ValueError("Max value is less or equal min value.")
+        if not min_value <= left_thumb_value < right_thumb_value <= max_value:
+            raise ValueError("Invalid thumb values.")
+        label_width = self.__get_label_width()
+        self._min_values.append(min_value)
+        self._max_values.append(max_value)
+        self._left_values.append(left_thumb_value)
+        self._right_values.append(right_thumb_value)
+        self._labels.append(label)
+        if label:
+            self._labeled_rows += 1
+        self.__update_scroll_bar()
+        if self.__get_label_width() != label_width:
+            # the label column moves the sliders of all rows
+            self.viewport().update()
+        else:
+            self.viewport().update(self.__get_row_rect(self.count() - 1))
+        return self.count() - 1
+
+    def clear(self):
+        for values in (
+            self._min_values,
+            self._max_values,
+            self._left_values,
+            self._right_values,
+        ):
+            del values[:]
+        self._labels.clear()
+        self._labeled_rows = 0
+        self._mappers.clear()
+        self._drag = None
+        self.__update_scroll_bar()
+        self.viewport().update()
+
+    def get_range(self, index):
+        return self._left_values[index], self._right_values[index]
+
+    def get_bounds(self, index):
+        return self._min_values[index], self._max_values[index]
+
+    def set_range(self, index, left_thumb_value, right_thumb_value):
+        if not (
+            self._min_values[index]
+            <= left_thumb_value
+            < right_thumb_value
+            <= self._max_values[index]
+        ):
+            return
+        old_left_value = self._left_values[index]
+        old_right_value = self._right_values[index]
+        if (left_thumb_value, right_thumb_value) == (old_left_value, old_right_value):
+            # nothing to update
+            return
+        self._left_values[index] = left_thumb_value
+        self._right_values[index] = right_thumb_value
+        if left_thumb_value != old_left_value:
+            self.left_thumb_value_changed.emit(index, left_thumb_value)
+        if right_thumb_value != old_right_value:
+            self.right_thumb_value_changed.emit(index, right_thumb_value)
+        self.range_changed.emit(index, left_thumb_value, right_thumb_value)
+        self.viewport().update(self.__get_row_rect(index))
+
+    def sizeHint(self):
+        return QSize(
+            self.LABEL_WIDTH + 4 * self._renderer.track_padding,
+            min(self.count(), 10) * self.ROW_HEIGHT,
+        )
+
+    def __get_label_width(self):
+        return self.LABEL_WIDTH if self._labeled_rows else 0
+
+    def __get_row_rect(self, row):
+        """Return the slider rect of row in viewport coordinates."""
+        label_width = self.__get_label_width()
+        return QRect(
+            label_width,
+            row * self.ROW_HEIGHT - self.verticalScrollBar().value(),
+            self.viewport().width() - label_width,
+            self.ROW_HEIGHT,
+        )
+
+    def __get_row_at(self, y):
+        row = (y + self.verticalScrollBar().value()) // self.ROW_HEIGHT
+        return row if 0 <= row < self.count() else None
+
+    def __get_mapper(self, row, rect):
+        return self._mappers.get(
+            self._min_values[row],
+            self._max_values[row],
+            self._renderer.available_width(rect),
+        )
+
+    def __get_pixels(self, row, rect):
+        mapper = self.__get_mapper(row, rect)
+        return (
+            mapper.value_to_pixel(self._left_values[row]),
+            mapper.value_to_pixel(self._right_values[row]),
+        )
+
+    def __update_scroll_bar(self):
+        scroll_bar = self.verticalScrollBar()
+        viewport_height = self.viewport().height()
+        scroll_bar.setRange(0, max(0, self.count() * self.ROW_HEIGHT - viewport_height))
+        scroll_bar.setPageStep(viewport_height)
+        scroll_bar.setSingleStep(self.ROW_HEIGHT)
+
+    # override Qt event
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.__update_scroll_bar()
+
+    # override QAbstractScrollArea
+    def scrollContentsBy(self, dx, dy):
+        del dx
+        self.viewport().scroll(0, dy)
+
+    # override Qt event
+    def changeEvent(self, event):
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.StyleChange):
+            self._colors = RangeSliderColors.from_palette(self.palette(), self.style())
+            self.viewport().update()
+        super().changeEvent(event)
+
+    # override Qt event
+    def paintEvent(self, event):
+        exposed = event.rect()
+        first_row = max(0, self.__get_row_at(exposed.top()) or 0)
+        last_row = self.__get_row_at(exposed.bottom())
+        last_row = self.count() - 1 if last_row is None else last_row
+
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        colors = self._colors
+        label_width = self.__get_label_width()
+        for row in range(first_row, last_row + 1):
+            rect = self.__get_row_rect(row)
+            if label_width:
+                painter.setPen(colors.text_pen)
+                painter.drawText(
+                    QRect(
+                        self.LABEL_PADDING,
+                        rect.y(),
+                        label_width - 2 * self.LABEL_PADDING,
+                        rect.height(),
+                    ),
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                    self._labels[row],
+                )
+            states = None
+            if self._drag is not None and self._drag[0] == row:
+                states = [ThumbState.NORMAL, ThumbState.NORMAL]
+                states[self._drag[1]] = ThumbState.PRESSED
+            self._renderer.paint(
+                painter, rect, self.__get_pixels(row, rect), colors, states=states
+            )
+        painter.end()
+
+    # override Qt event
+    def mousePressEvent(self, event):
+        position = event.position()
+        row = self.__get_row_at(int(position.y()))
+        if row is not None:
+            rect = self.__get_row_rect(row)
+            pixels = self.__get_pixels(row, rect)
+            thumb = self._renderer.hit_test(rect, pixels, position.x(), position.y())
+            if thumb is not None:
+                self._drag = (row, thumb)
+                self._thumb_drag.press(rect, position.x(), pixels[thumb])
+                self.viewport().update(rect)
+        super().mousePressEvent(event)
+
+    # override Qt event
+    def mouseMoveEvent(self, event):
+        if self._drag is not None:
+            row, thumb = self._drag
+            rect = self.__get_row_rect(row)
+            mapper = self.__get_mapper(row, rect)
+            pixel = self._thumb_drag.move(rect, event.position().x(), mapper)
+            if pixel is not None:
+                value = mapper.pixel_to_value(pixel)
+                if thumb == 0:
+                    self.set_range(row, value, self._right_values[row])
+                else:
+                    self.set_range(row, self._left_values[row], value)
+        super().mouseMoveEvent(event)
+
+    # override Qt event
+    def mouseReleaseEvent(self, event):
+        if self._drag is not None:
+            row = self._drag[0]
+            self._drag = None
+            self.viewport().update(self.__get_row_rect(row))
+            self.range_committed.emit(
+                row, self._left_values[row], self._right_values[row]
+            )
+        super().mouseReleaseEvent(event)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import time
+
+from collections import deque
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+# pylint: disable=too-few-public-methods
+class _QuerySignals(QObject):
+    """Signals of a query task, delivered to the thread which owns the runner."""
+
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+
+class _QueryTask(QRunnable):
+    """
+    QRunnable which runs a single query on a thread pool.
+
+    The task owns its signals object, without a parent, so it outlives a runner
+    deleted during the query and the connections to the runner drop with it.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, signals, generation, query, low, high):
+        super().__init__()
+        self._signals = signals
+        self._generation = generation
+        self._query = query
+        self._low = low
+        self._high = high
+
+    def run(self):
+        # errors are delivered to the runner instead of being lost in the pool
+        # pylint: disable=broad-exception-caught
+        try:
+            result = self._query(self._low, self._high)
+        except Exception as error:
+            self._signals.failed.emit(self._generation, error)
+            return
+        self._signals.finished.emit(self._generation, result)
+
+
+# pylint: disable=too-many-instance-attributes
+class RangeQueryRunner(QObject):
+    """
+    RangeQueryRunner runs a query callable for a range on a thread pool.
+
+    At most one query is in flight at a time. Ranges submitted meanwhile replace each
+    other, so only the newest one is queried next, and results of queries which were
+    superseded while running are dropped. Results are delivered on the thread which
+    owns the runner (usually the GUI thread).
+
+    Methods
+
+            * __init__ (self, query, parent=None, thread_pool=None)
+            * attach (self, QtRangeSlider slider, committed_only=False):
+            * submit (self, low, high):
+            * (dict) stats (self):
+
+    Signals
+
+            * result_ready (low, high, result)
+            * query_failed (low, high, exception)
+
+    """
+
+    LATENCY_SAMPLES = 100
+
+    result_ready = pyqtSignal(object, object, object)
+    query_failed = pyqtSignal(object, object, object)
+
+    def __init__(self, query, parent=None, thread_pool=None):
+        super().__init__(parent)
+        self._query = query
+        self._thread_pool = (
+            thread_pool if thread_pool is not None else QThreadPool.globalInstance()
+        )
+
+        self._generation = 0
+        # (generation, low, high, submit time) of the running and the next query
+        self._in_flight = None
+        self._pending = None
+
+        self._submitted = 0
+        self._completed = 0
+        self._dropped = 0
+        self._latencies = deque(maxlen=self.LATENCY_SAMPLES)
+
+    def attach(self, slider, committed_only=False):
+        """Query every range of the slider, or only the ranges committed by a drag."""
+        if committed_only:
+            slider.range_committed.connect(self.submit)
+        else:
+            slider.range_changed.connect(self.submit)
+
+    def submit(self, low, high):
+        self._generation += 1
+        self._submitted += 1
+        request = (self._generation, low, high, time.monotonic())
+        if self._in_flight is None:
+            self.__start(request)
+            return
+        if self._pending is not None:
+            self._dropped += 1
+        self._pending = request
+
+    def is_idle(self):
+        return self._in_flight is None and self._pending is None
+
+    def stats(self):
+        """Return the queue depth, request counters and latencies in milliseconds."""
+        latencies = list(self._latencies)
+        return {
+            "queue_depth": (self._in_flight is not None) + (self._pending is not None),
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "dropped": self._dropped,
+            "last_latency_ms": latencies[-1] if latencies else None,
+            "mean_latency_ms": sum(latencies) / len(latencies) if latencies else None,
+            "max_latency_ms": max(latencies) if latencies else None,
+        }
+
+    def __start(self, request):
+        self._in_flight = request
+        generation, low, high, _ = request
+        signals = _QuerySignals()
+        signals.finished.connect(self.__on_finished)
+        signals.failed.connect(self.__on_failed)
+        self._thread_pool.start(_QueryTask(signals, generation, self._query, low, high))
+
+    def __finish(self, generation):
+        """Return the finished request if it is still the newest one, start the next."""
+        request = self._in_flight
+        self._in_flight = None
+        if self._pending is not None:
+            pending = self._pending
+            self._pending = None
+            self.__start(pending)
+        if request is None or request[0] != generation:
+            return None
+        if generation != self._generation:
+            # superseded while running
+            self._dropped += 1
+            return None
+        self._completed += 1
+        self._latencies.append((time.monotonic() - request[3]) * 1000)
+        return request
+
+    def __on_finished(self, generation, result):
+        request = self.__finish(generation)
+        if request is not None:
+            self.result_ready.emit(request[1], request[2], result)
+
+    def __on_failed(self, generation, error):
+        request = self.__finish(generation)
+        if request is not None:
+            self.query_failed.emit(request[1], request[2], error)
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+from PyQt6.QtCore import Qt, QLine, QPointF, QRect
+from PyQt6.QtGui import QBrush, QColor, QPainter, QPalette, QPen, QPolygonF
+
+from .mapping import Scale
+from .sprites import StaticTextCache, ThumbSpriteCache, ThumbState
+
+_PALETTE_ROLES = (
+    QPalette.ColorRole.Base,
+    QPalette.ColorRole.Button,
+    QPalette.ColorRole.Mid,
+    QPalette.ColorRole.WindowText,
+)
+
+# (palette colors, style name) -> RangeSliderColors, shared by all sliders
+_colors_cache = {}
+MAX_CACHED_PALETTES = 32
+
+
+@dataclass(frozen=True)
+class RangeSliderColors:
+    """
+    Palette dependent colors, pens and brushes of a range slider.
+
+    from_palette returns one shared instance per palette and style, so widgets hold
+    references to it instead of creating paint objects on every paint event. Widgets
+    fetch it again on PaletteChange and StyleChange.
+    """
+
+    base: QColor
+    button: QColor
+    border: QColor
+    border_pen: QPen
+    text_pen: QPen
+
+    @classmethod
+    def from_palette(cls, palette, style=None):
+        roles = [palette.color(role) for role in _PALETTE_ROLES]
+        # widget palettes are copies of their parent's, so key by the colors used
+        key = (
+            tuple(color.rgba() for color in roles),
+            style.name() if style is not None else None,
+        )
+        colors = _colors_cache.get(key)
+        if colors is None:
+            if len(_colors_cache) >= MAX_CACHED_PALETTES:
+                _colors_cache.clear()
+            base, button, border, text = roles
+            colors = _colors_cache[key] = cls(
+                base=base,
+                button=button,
+                border=border,
+                border_pen=QPen(border),
+                text_pen=QPen(text),
+            )
+        return colors
+
+
+@dataclass(frozen=True)
+class SliderLayout:
+    """
+    Geometry of a slider inside a rect, see RangeSliderRenderer.layout.
+
+    Widgets compute it once per resize, value, bounds or ticks change and read it
+    for painting, hit-testing and hover handling, so paint events only draw.
+    """
+
+    __slots__ = (
+        "rect",
+        "track_rect",
+        "fill_rect",
+        "background_rect",
+        "text_rect",
+        "thumb_rects",
+        "ticks_count",
+        "tick_indices",
+        "tick_xs",
+        "tick_lines",
+    )
+
+    rect: QRect
+    track_rect: QRect
+    fill_rect: QRect
+    background_rect: QRect
+    text_rect: QRect
+    thumb_rects: tuple
+    ticks_count: int
+    # the index of each major tick in tick_xs, from 0 to ticks_count
+    tick_indices: tuple
+    tick_xs: tuple
+    tick_lines: tuple
+
+    def thumb_at(self, x, y):
+        """Return the index of the first thumb under x, y or None."""
+        for index, thumb_rect in enumerate(self.thumb_rects):
+            if thumb_rect.contains(int(x), int(y)):
+                return index
+        return None
+
+
+class ThumbDrag:
+    """
+    ThumbDrag turns the pointer moves of a dragged thumb into track pixels.
+
+    The grab point stays under the pointer instead of centering the thumb, and
+    moves which end in the pixel of the last handled move are dropped.
+    """
+
+    __slots__ = ("_renderer", "_offset", "_pixel")
+
+    def __init__(self, renderer):
+        self._renderer = renderer
+        self._offset = 0
+        self._pixel = None
+
+    def press(self, rect, x, pixel):
+        """Start dragging the thumb at track pixel, grabbed at the widget x."""
+        self._offset = self._renderer.thumb_pixel(rect, x) - pixel
+        self._pixel = None
+
+    def invalidate(self):
+        """Handle the next move even in the same pixel, e.g. after a mapper change."""
+        self._pixel = None
+
+    def move(self, rect, x, mapper):
+        """Return the track pixel of the thumb moved to x, None if it didn't change."""
+        pixel = mapper.clamp_pixel(self._renderer.thumb_pixel(rect, x) - self._offset)
+        # moves inside the same pixel bucket can't change the value
+        if pixel == self._pixel:
+            return None
+        self._pixel = pixel
+        return pixel
+
+
+# pylint: disable=too-many-instance-attributes,too-many-public-methods
+@dataclass(frozen=True, eq=False)
+class RangeSliderRenderer:
+    """
+    RangeSliderRenderer draws and hit-tests a range slider inside a rect.
+
+    It holds no per-slider state: thumb positions are passed in as pixel offsets
+    from the start of the track (see ValueMapper), so one renderer can paint any
+    number of sliders, e.g. one per item view row.
+    """
+
+    thumb_width: int = 16
+    thumb_height: int = 16
+    track_height: int = 3
+    track_padding: int = 16 // 2 + 5
+    tick_padding: int = 5
+    # ticks closer than this many pixels are decimated
+    min_tick_spacing: int = 4
+    # gap between tick labels, labels which would overlap are skipped
+    tick_label_spacing: int = 8
+    track_color: QColor = field(default_factory=lambda: QColor(0xC7, 0xC7, 0xC7))
+    track_fill_color: QColor = field(default_factory=lambda: QColor(0x01, 0x81, 0xFF))
+    distribution_color: QColor = field(
+        default_factory=lambda: QColor(0x01, 0x81, 0xFF, 0x40)
+    )
+
+    # brushes are created once per renderer, not on every paint
+    track_brush: QBrush = field(init=False, repr=False)
+    track_fill_brush: QBrush = field(init=False, repr=False)
+    distribution_brush: QBrush = field(init=False, repr=False)
+
+    # thumb sprites and tick labels are shared by all renderers in the process
+    thumb_sprites: ClassVar[ThumbSpriteCache] = ThumbSpriteCache()
+    tick_labels: ClassVar[StaticTextCache] = StaticTextCache()
+
+    def __post_init__(self):
+        # the dataclass is frozen, the derived fields are set once here
+        object.__setattr__(self, "track_brush", QBrush(self.track_color))
+        object.__setattr__(self, "track_fill_brush", QBrush(self.track_fill_color))
+        object.__setattr__(self, "distribution_brush", QBrush(self.distribution_color))
+
+    def available_width(self, rect):
+        return rect.width() - 2 * self.track_padding
+
+    def track_y(self, rect):
+        return rect.y() + rect.height() // 2 - self.track_height // 2
+
+    def track_rect(self, rect):
+        return QRect(
+            rect.x() + self.track_padding,
+            self.track_y(rect),
+            self.available_width(rect),
+            self.track_height,
+        )
+
+    def track_fill_rect(self, rect, left_pixel, right_pixel):
+        return QRect(
+            rect.x() + self.track_padding + left_pixel,
+            self.track_y(rect),
+            right_pixel - left_pixel,
+            self.track_height,
+        )
+
+    def thumb_rect(self, rect, pixel):
+        return QRect(
+            rect.x() + self.track_padding + pixel - self.thumb_width // 2,
+            self.track_y(rect) + self.track_height // 2 - self.thumb_height // 2,
+            self.thumb_width,
+            self.thumb_height,
+        )
+
+    def thumb_pixel(self, rect, x):
+        """Return the track pixel under the thumb anchor for a widget x position."""
+        return round(x) - rect.x() - self.track_padding
+
+    def background_rect(self, rect):
+        """Return the area of the static layer: from the top of rect down to the track."""
+        return QRect(
+            rect.x() + self.track_padding,
+            rect.y(),
+            self.available_width(rect) + 1,
+            self.track_y(rect) - rect.y() + self.track_height,
+        )
+
+    def text_rect(self, rect):
+        """Return the area below the track."""
+        y = self.track_y(rect) + self.track_height
+        return QRect(
+            rect.x() + self.track_padding,
+            y,
+            self.available_width(rect),
+            rect.bottom() + 1 - y,
+        )
+
+    def tick_indices(self, rect, ticks_count):
+        """
+        Return the indices of the major ticks to draw out of ticks_count + 1.
+
+        When the ticks would be closer than min_tick_spacing only every n-th tick is
+        returned, so the result never has more entries than the track has room for.
+        """
+        available_width = self.available_width(rect)
+        if not ticks_count or available_width <= 0:
+            return ()
+        stride = -(-ticks_count * self.min_tick_spacing // available_width)
+        return tuple(range(0, ticks_count + 1, max(stride, 1)))
+
+    def tick_xs(self, rect, ticks_count, tick_indices=None):
+        """Return the x positions of the evenly spaced major ticks, see tick_indices."""
+        if tick_indices is None:
+            tick_indices = self.tick_indices(rect, ticks_count)
+        available_width = self.available_width(rect)
+        x0 = rect.x() + self.track_padding
+        # positions are rounded per tick, so the last tick ends exactly at the track end
+        return tuple(
+            x0 + index * available_width // ticks_count for index in tick_indices
+        )
+
+    def minor_tick_xs(self, rect, ticks_count, minor_ticks_count):
+        """
+        Return the x positions of minor_ticks_count ticks between each pair of major
+        ticks, or none if they would be closer than min_tick_spacing.
+        """
+        available_width = self.available_width(rect)
+        steps = ticks_count * (minor_ticks_count + 1)
+        if not ticks_count or not minor_ticks_count or available_width <= 0:
+            return ()
+        if available_width < steps * self.min_tick_spacing:
+            return ()
+        x0 = rect.x() + self.track_padding
+        return tuple(
+            x0 + index * available_width // steps
+            for index in range(steps + 1)
+            if index % (minor_ticks_count + 1)
+        )
+
+    def tick_lines(self, rect, tick_xs, minor_tick_xs=()):
+        """Return the lines of major and minor ticks, minor ticks are half as long."""
+        y1 = self.track_y(rect) - self.tick_padding
+        y2 = y1 - self.thumb_height // 2
+        minor_y2 = y1 - self.thumb_height // 4
+        return tuple(QLine(x, y1, x, y2) for x in tick_xs) + tuple(
+            QLine(x, y1, x, minor_y2) for x in minor_tick_xs
+        )
+
+    # pylint: disable=too-many-arguments
+    def layout(
+        self, rect, pixels, ticks_count=0, minor_ticks_count=0, tick_labels=False
+    ):
+        """
+        Return the SliderLayout of a slider with thumbs at pixels inside rect.
+
+        With tick_labels the background rect reaches down to the bottom of rect, so
+        the labels below the track belong to the static layer.
+        """
+        tick_indices = self.tick_indices(rect, ticks_count)
+        tick_xs = self.tick_xs(rect, ticks_count, tick_indices)
+        background_rect = self.background_rect(rect)
+        if tick_labels:
+            background_rect.setBottom(rect.bottom())
+        return SliderLayout(
+            rect=QRect(rect),
+            track_rect=self.track_rect(rect),
+            fill_rect=self.track_fill_rect(rect, pixels[0], pixels[-1]),
+            background_rect=background_rect,
+            text_rect=self.text_rect(rect),
+            thumb_rects=tuple(self.thumb_rect(rect, pixel) for pixel in pixels),
+            ticks_count=ticks_count,
+            tick_indices=tick_indices,
+            tick_xs=tick_xs,
+            tick_lines=self.tick_lines(
+                rect,
+                tick_xs,
+                self.minor_tick_xs(rect, ticks_count, minor_ticks_count),
+            ),
+        )
+
+    def move_thumbs(self, layout, pixels):
+        """Return layout with the thumbs at pixels, reusing the rects which stay."""
+        rect = layout.rect
+        return SliderLayout(
+            rect=rect,
+            track_rect=layout.track_rect,
+            fill_rect=self.track_fill_rect(rect, pixels[0], pixels[-1]),
+            background_rect=layout.background_rect,
+            text_rect=layout.text_rect,
+            thumb_rects=tuple(self.thumb_rect(rect, pixel) for pixel in pixels),
+            ticks_count=layout.ticks_count,
+            tick_indices=layout.tick_indices,
+            tick_xs=layout.tick_xs,
+            tick_lines=layout.tick_lines,
+        )
+
+    def hit_test(self, rect, pixels, x, y):
+        """Return the index of the thumb (at the given pixels) under x, y or None."""
+        for index, pixel in enumerate(pixels):
+            if self.thumb_rect(rect, pixel).contains(int(x), int(y)):
+                return index
+        return None
+
+    def draw_track(self, painter, rect):
+        painter.fillRect(self.track_rect(rect), self.track_brush)
+
+    def draw_track_fill(self, painter, rect, left_pixel, right_pixel):
+        painter.fillRect(
+            self.track_fill_rect(rect, left_pixel, right_pixel), self.track_fill_brush
+        )
+
+    def draw_ticks(self, painter, tick_lines, pen):
+        """Draw the lines returned by tick_lines in a single call."""
+        if not tick_lines:
+            return
+
+        painter.setPen(pen)
+        painter.drawLines(tick_lines)
+
+    # pylint: disable=too-many-arguments
+    def draw_tick_labels(self, painter, rect, tick_xs, texts, pen):
+        """
+        Draw texts centered below the ticks at tick_xs.
+
+        Labels are skipped where they would overlap the previous one, so dense ticks
+        get labels as far apart as the text allows.
+        """
+        if not tick_xs:
+            return
+
+        painter.setPen(pen)
+        font = painter.font()
+        text_rect = self.text_rect(rect)
+        previous_right = None
+        for x, text in zip(tick_xs, texts):
+            static_text = self.tick_labels.get(text, font)
+            width = static_text.size().width()
+            left = min(max(x - width / 2, rect.x()), rect.right() + 1 - width)
+            if previous_right is not None and left < previous_right:
+                continue
+            painter.drawStaticText(QPointF(left, text_rect.y()), static_text)
+            previous_right = left + width + self.tick_label_spacing
+
+    def draw_distribution(self, painter, rect, counts):
+        """Draw counts (one per track pixel) as a single step polygon behind the track."""
+        available_width = self.available_width(rect)
+        max_count = counts.max() if len(counts) else 0
+        if available_width <= 0 or max_count <= 0:
+            return
+
+        x0 = rect.x() + self.track_padding
+        base_y = self.track_y(rect)
+        heights = (counts / max_count * (base_y - rect.y())).tolist()
+        points = [QPointF(x0, base_y)]
+        for x, height in enumerate(heights, x0):
+            points.append(QPointF(x, base_y - height))
+            points.append(QPointF(x + 1, base_y - height))
+        points.append(QPointF(x0 + available_width, base_y))
+
+        painter.save()
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.distribution_brush)
+        painter.drawPolygon(QPolygonF(points))
+        painter.restore()
+
+    # pylint: disable=too-many-arguments
+    def draw_thumb(self, painter, thumb_rect, state, colors, dpr):
+        base_color = colors.button if state == ThumbState.PRESSED else colors.base
+        border_color = (
+            colors.border if state == ThumbState.NORMAL else self.track_fill_color
+        )
+        sprite = self.thumb_sprites.get(
+            thumb_rect.size(), base_color, border_color, dpr, state
+        )
+        margin = ThumbSpriteCache.MARGIN
+        painter.drawPixmap(thumb_rect.x() - margin, thumb_rect.y() - margin, sprite)
+
+    def draw_text(self, painter, rect, text, pen):
+        painter.setPen(pen)
+        painter.drawText(
+            self.text_rect(rect),
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom,
+            text,
+        )
+
+    def tick_label_texts(self, layout, mapper, formatter=None, adapter=None):
+        """
+        Return the label of every major tick: the value of the tick, formatted.
+
+        On the linear scale that is the exact fraction of the bounds, so labels read
+        round numbers at any width, on other scales the value at the tick's pixel.
+        With a value adapter the positions are converted in one batch and formatted
+        by the adapter unless a formatter is given.
+        """
+        if mapper.scale == Scale.LINEAR:
+            span = mapper.max_value - mapper.min_value
+            values = [
+                mapper.min_value + index * span // layout.ticks_count
+                for index in layout.tick_indices
+            ]
+        else:
+            x0 = layout.track_rect.x()
+            values = [mapper.pixel_values[x - x0] for x in layout.tick_xs]
+        if adapter is not None:
+            values = adapter.from_positions(values).tolist()
+            formatter = formatter or adapter.format
+        formatter = formatter or "{:,}".format
+        return [formatter(value) for value in values]
+
+    # pylint: disable=too-many-arguments
+    def draw_background(self, painter, layout, colors, counts=None, tick_labels=None):
+        """Draw the layers which don't depend on the thumbs: distribution, track, ticks."""
+        if counts is not None and layout.track_rect.width() > 0:
+            self.draw_distribution(painter, layout.rect, counts)
+        painter.fillRect(layout.track_rect, self.track_brush)
+        self.draw_ticks(painter, layout.tick_lines, colors.border_pen)
+        if tick_labels:
+            self.draw_tick_labels(
+                painter, layout.rect, layout.tick_xs, tick_labels, colors.text_pen
+            )
+
+    def draw_thumbs(self, painter, layout, colors, dpr, states=None):
+        """Draw the track fill and the thumbs of layout."""
+        painter.fillRect(layout.fill_rect, self.track_fill_brush)
+        for index, thumb_rect in enumerate(layout.thumb_rects):
+            state = states[index] if states is not None else ThumbState.NORMAL
+            self.draw_thumb(painter, thumb_rect, state, colors, dpr)
+
+    # pylint: disable=too-many-arguments
+    def paint(self, painter, rect, pixels, colors, *, ticks_count=0, states=None):
+        """Paint a whole slider without any caching, e.g. into an item view cell."""
+        dpr = painter.device().devicePixelRatioF()
+        layout = self.layout(rect, pixels, ticks_count)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.draw_background(painter, layout, colors)
+        self.draw_thumbs(painter, layout, colors, dpr, states)
+        painter.restore()
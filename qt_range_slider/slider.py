@@ -0,0 +1,1074 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pylint: disable=too-many-lines
+import time
+import weakref
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+
+from PyQt6.QtCore import Qt, QEvent, QRect, QSize, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtGui import QPainter, QColor, QPixmap, QRegion
+
+from .animation import FrameClock, RangeAnimation, StepAccelerator
+from .emission import EmissionPolicy, SignalEmitter
+from .instrumentation import ENABLED_BY_DEFAULT, Instrumentation
+from .mapping import Scale, ValueMapper, create_mapper
+from .model import RangeModel, grow_bounds
+from .renderer import RangeSliderColors, RangeSliderRenderer, ThumbDrag
+from .sprites import ThumbState
+
+
+@dataclass
+class Thumb:
+    """Thumb class which holds the drawing state of a thumb."""
+
+    pressed: bool
+    hovered: bool = False
+
+    @property
+    def state(self):
+        if self.pressed:
+            return ThumbState.PRESSED
+        if self.hovered:
+            return ThumbState.HOVER
+        return ThumbState.NORMAL
+
+
+# pylint: disable=too-many-instance-attributes,too-many-public-methods
+class QtRangeSlider(QWidget):
+    """
+    QtRangeSlider is a class which implements a slider with 2 thumbs.
+
+    Methods
+
+            * __init__ (self, QWidget parent, left_value, right_value, left_thumb_value=0, right_thumb_value=None)
+            * set_left_thumb_value (self, int value):
+            * set_right_thumb_value (self, int value):
+            * (int) get_left_thumb_value (self):
+            * (int) get_right_thumb_value (self):
+            * set_range (self, int left_thumb_value, int right_thumb_value):
+            * animate_to (self, int left_thumb_value, int right_thumb_value, duration=200):
+            * stop_animation (self):
+            * (bool) is_animating (self):
+            * set_steps (self, int single_step=1, page_step=None, duration=100):
+            * set_value_adapter (self, ValueAdapter adapter):
+            * (ValueAdapter) get_value_adapter (self):
+            * set_value_range (self, low, high):
+            * ((object, object)) get_value_range (self):
+            * set_value_bounds (self, min_value, max_value):
+            * (RangeModel) get_model (self):
+            * (SliderLayout) get_layout (self):
+            * set_bounds (self, int min_value, int max_value):
+            * ((int, int)) get_bounds (self):
+            * set_auto_extend (self, bool enabled, growth=2):
+            * observe (self, values):
+            * batch_update (self):
+            * set_emission_policy (self, EmissionPolicy policy, rate=None, delay=None):
+            * set_drag_compression (self, bool enabled, frame_rate=None):
+            * (int) get_coalesced_moves (self):
+            * set_ticks_count (self, int count, int minor_count=0):
+            * set_tick_labels_visible (self, bool visible, formatter=None):
+            * set_scale (self, Scale scale, values=None):
+            * (Scale) get_scale (self):
+            * set_distribution (self, samples):
+            * set_histogram (self, counts, edges):
+            * append_samples (self, samples):
+            * clear_distribution (self):
+            * set_data_column (self, column, assume_sorted=False):
+            * clear_data_column (self):
+            * (int) get_match_count (self):
+            * set_match_count_visible (self, bool visible):
+            * (Instrumentation) enable_instrumentation (self, instrumentation=None):
+            * disable_instrumentation (self):
+            * (Instrumentation) get_instrumentation (self):
+
+    Signals
+
+            * left_thumb_value_changed (int)
+            * right_thumb_value_changed (int)
+            * range_changed (int, int)
+            * range_committed (int, int)
+            * value_range_changed (object, object)
+            * value_range_committed (object, object)
+            * match_count_changed (int)
+
+    """
+
+    HEIGHT = 30
+    WIDTH = 120
+    THUMB_WIDTH = 16
+    THUMB_HEIGHT = 16
+    TRACK_HEIGHT = 3
+    TRACK_COLOR = QColor(0xC7, 0xC7, 0xC7)
+    TRACK_FILL_COLOR = QColor(0x01, 0x81, 0xFF)
+    DISTRIBUTION_COLOR = QColor(0x01, 0x81, 0xFF, 0x40)
+    TRACK_PADDING = THUMB_WIDTH // 2 + 5
+    TICK_PADDING = 5
+
+    left_thumb_value_changed = pyqtSignal("unsigned long long")
+    right_thumb_value_changed = pyqtSignal("unsigned long long")
+    range_changed = pyqtSignal("unsigned long long", "unsigned long long")
+    range_committed = pyqtSignal("unsigned long long", "unsigned long long")
+    value_range_changed = pyqtSignal(object, object)
+    value_range_committed = pyqtSignal(object, object)
+    match_count_changed = pyqtSignal("unsigned long long")
+
+    def __init__(
+        self,
+        parent,
+        left_value,
+        right_value,
+        left_thumb_value=0,
+        right_thumb_value=None,
+    ):
+        super().__init__(parent)
+
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.setMinimumWidth(self.WIDTH)
+        self.setMinimumHeight(self.HEIGHT)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+
+        self._model = RangeModel(
+            left_value, right_value, left_thumb_value, right_thumb_value
+        )
+        self._model.add_listener(self.__on_range_changed)
+        self._mapper = ValueMapper(left_value, right_value)
+
+        self._left_thumb = Thumb(False)
+        self._right_thumb = Thumb(False)
+
+        # geometry of the current size, range and ticks, None when stale
+        self._layout = None
+
+        # drag compression: moves are applied at most once per frame
+        self._drag_compression = False
+        self._drag_frame_rate = None
+        self._drag_frame_timer = None
+        self._pending_drag_x = None
+        self._coalesced_moves = 0
+
+        self._ticks_count = 0
+        self._minor_ticks_count = 0
+        self._tick_labels_visible = False
+        self._tick_label_formatter = None
+
+        self._distribution = None
+
+        self._range_index = None
+        self._match_count = None
+        self._match_count_visible = False
+
+        self._dirty_region = QRegion()
+        self._update_scheduled = False
+
+        self._background_cache = None
+        self._background_cache_key = None
+
+        self._left_thumb_emitter = SignalEmitter(
+            self.left_thumb_value_changed, self, "left_thumb_value_changed"
+        )
+        self._right_thumb_emitter = SignalEmitter(
+            self.right_thumb_value_changed, self, "right_thumb_value_changed"
+        )
+        self._range_emitter = SignalEmitter(self.range_changed, self, "range_changed")
+        self._match_count_emitter = SignalEmitter(
+            self.match_count_changed, self, "match_count_changed"
+        )
+
+        self._instrumentation = None
+        if ENABLED_BY_DEFAULT:
+            self.enable_instrumentation()
+
+        self._batch_depth = 0
+        self._deferred_emissions = {}
+
+        self._auto_extend = False
+        self._growth = 2
+
+        self._value_adapter = None
+
+        self._animation = None
+        # the shared clock outlives the widget, an animation must not tick a dead one
+        self.destroyed.connect(partial(QtRangeSlider.__on_destroyed, weakref.ref(self)))
+        # keyboard and wheel steps move the active thumb, 0 for left and 1 for right
+        self._active_thumb = 0
+        self._steps = StepAccelerator()
+        self._step_duration = 100
+
+        self._renderer = RangeSliderRenderer(
+            thumb_width=self.THUMB_WIDTH,
+            thumb_height=self.THUMB_HEIGHT,
+            track_height=self.TRACK_HEIGHT,
+            track_padding=self.TRACK_PADDING,
+            tick_padding=self.TICK_PADDING,
+            track_color=self.TRACK_COLOR,
+            track_fill_color=self.TRACK_FILL_COLOR,
+            distribution_color=self.DISTRIBUTION_COLOR,
+        )
+        self._colors = RangeSliderColors.from_palette(self.palette(), self.style())
+        self._drag = ThumbDrag(self._renderer)
+
+    # override Qt event
+    def paintEvent(self, event):
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            self.__paint(event)
+            return
+        start = instrumentation.start()
+        self.__paint(event)
+        instrumentation.finish("paint", start)
+        instrumentation.count("paints")
+
+    def __paint(self, event):
+        region = event.region()
+        layout = self.get_layout()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if region.intersects(layout.background_rect):
+            painter.drawPixmap(0, 0, self.__get_background(layout))
+        if region.intersects(layout.fill_rect):
+            painter.fillRect(layout.fill_rect, self._renderer.track_fill_brush)
+        if self._match_count_visible and region.intersects(layout.text_rect):
+            self.__draw_match_count(painter, layout)
+        for thumb, thumb_rect in zip(
+            (self._left_thumb, self._right_thumb), layout.thumb_rects
+        ):
+            if region.intersects(thumb_rect):
+                self._renderer.draw_thumb(
+                    painter,
+                    thumb_rect,
+                    thumb.state,
+                    self._colors,
+                    self.devicePixelRatioF(),
+                )
+
+        painter.end()
+
+    def get_layout(self):
+        """
+        Return the SliderLayout of the current size, range and ticks.
+
+        It is computed on first use after a change, so hit-tests work before the
+        first paint event, e.g. for sliders which are never shown.
+        """
+        area = self.rect()
+        # hidden widgets are resized without a resize event
+        if self._layout is None or self._layout.rect != area:
+            available_width = self._renderer.available_width(area)
+            if self._mapper.width != max(available_width, 1):
+                self._mapper.set_width(available_width)
+                self._drag.invalidate()
+            self._layout = self._renderer.layout(
+                area,
+                self.__get_thumb_pixels(),
+                self._ticks_count,
+                self._minor_ticks_count,
+                self._tick_labels_visible,
+            )
+        return self._layout
+
+    def __get_thumb_pixels(self):
+        return (
+            self._mapper.value_to_pixel(self._model.low),
+            self._mapper.value_to_pixel(self._model.high),
+        )
+
+    def __invalidate_layout(self):
+        self._layout = None
+
+    def __get_background(self, layout):
+        """Return the static track and ticks layer, rendering it if it is stale."""
+        dpr = self.devicePixelRatioF()
+        area = layout.rect
+        key = (area.width(), area.height(), dpr)
+        if self._background_cache is not None and self._background_cache_key == key:
+            return self._background_cache
+
+        pixmap = QPixmap(QSize(round(area.width() * dpr), round(area.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
+        counts = None
+        if self._distribution is not None and layout.track_rect.width() > 0:
+            counts = self._distribution.binned(
+                layout.track_rect.width(),
+                # non-linear scales bin by the values at the pixels
+                (
+                    None
+                    if self._mapper.scale == Scale.LINEAR
+                    else self._mapper.pixel_values
+                ),
+            )
+        self._renderer.draw_background(
+            painter,
+            layout,
+            self._colors,
+            counts,
+            (
+                self._renderer.tick_label_texts(
+                    layout,
+                    self._mapper,
+                    self._tick_label_formatter,
+                    self._value_adapter,
+                )
+                if self._tick_labels_visible
+                else None
+            ),
+        )
+        painter.end()
+
+        if self._instrumentation is not None:
+            self._instrumentation.count("background_renders")
+        self._background_cache = pixmap
+        self._background_cache_key = key
+        return pixmap
+
+    def __invalidate_background(self):
+        self._background_cache = None
+        self._background_cache_key = None
+
+    def __invalidate(self, region):
+        """Mark region as dirty and schedule a single update for this event loop turn."""
+        self._dirty_region = self._dirty_region.united(region)
+        if self._update_scheduled or self._batch_depth:
+            return
+        self._update_scheduled = True
+        QTimer.singleShot(0, self.__flush_invalidation)
+
+    def __flush_invalidation(self):
+        self._update_scheduled = False
+        region = self._dirty_region
+        self._dirty_region = QRegion()
+        if not region.isEmpty():
+            self.update(region)
+
+    def __invalidate_thumb_move(self, old_value, index):
+        """Invalidate old and new thumb rects plus the track fill strip between them."""
+        layout = self.get_layout()
+        old_rect = self._renderer.thumb_rect(
+            layout.rect, self._mapper.value_to_pixel(old_value)
+        )
+        new_rect = layout.thumb_rects[index]
+        # antialiased ellipse edges bleed one pixel outside of the thumb rect
+        region = QRegion(old_rect.adjusted(-1, -1, 1, 1))
+        region = region.united(new_rect.adjusted(-1, -1, 1, 1))
+        x1 = min(old_rect.center().x(), new_rect.center().x())
+        x2 = max(old_rect.center().x(), new_rect.center().x())
+        track_rect = layout.track_rect
+        strip = QRect(x1, track_rect.y(), x2 - x1 + 1, track_rect.height())
+        self.__invalidate(region.united(strip))
+
+    def __get_thumb_rect(self, thumb):
+        index = 0 if thumb is self._left_thumb else 1
+        return self.get_layout().thumb_rects[index]
+
+    def __invalidate_thumb(self, thumb):
+        self.__invalidate(QRegion(self.__get_thumb_rect(thumb).adjusted(-1, -1, 1, 1)))
+
+    def __set_thumb_hovered(self, thumb, hovered):
+        if thumb.hovered == hovered:
+            return
+        thumb.hovered = hovered
+        self.__invalidate_thumb(thumb)
+
+    def set_left_thumb_value(self, value):
+        self.stop_animation()
+        self._model.set_low(value)
+
+    def set_right_thumb_value(self, value):
+        self.stop_animation()
+        self._model.set_high(value)
+
+    def set_range(self, left_thumb_value, right_thumb_value):
+        """
+        Move both thumbs at once.
+
+        Unlike consecutive set_left_thumb_value and set_right_thumb_value calls the new
+        values are validated against each other, not against the current thumb values,
+        and range_changed is emitted only once.
+        """
+        self.stop_animation()
+        self._model.set_range(left_thumb_value, right_thumb_value)
+
+    def animate_to(self, left_thumb_value, right_thumb_value, duration=200):
+        """
+        Move both thumbs to the new values over duration milliseconds.
+
+        Intermediate values are emitted according to the emission policy, like a
+        drag, and range_committed once the animation ends. All sliders share one
+        timer (see FrameClock), and an animation in progress is redirected to the
+        new values. Invalid ranges are ignored, like in set_range.
+        """
+        if not self._model.is_valid_range(left_thumb_value, right_thumb_value):
+            return
+        target = (left_thumb_value, right_thumb_value)
+        if duration <= 0:
+            self.set_range(*target)
+            self.__commit()
+            return
+        now = time.monotonic()
+        if self._animation is None:
+            self._animation = RangeAnimation(
+                self.__apply_animation,
+                (self._model.low, self._model.high),
+                target,
+                duration,
+                now,
+                on_finished=self.__on_animation_finished,
+            )
+        else:
+            self._animation.retarget(target, duration, now)
+        FrameClock.instance().add(self._animation)
+
+    def stop_animation(self):
+        """Stop an animation where it is and commit the range it reached."""
+        if self.__cancel_animation():
+            self.__commit()
+
+    def is_animating(self):
+        return self._animation is not None
+
+    def __cancel_animation(self):
+        animation = self._animation
+        if animation is None:
+            return False
+        self._animation = None
+        animation.cancel()
+        FrameClock.instance().remove(animation)
+        return True
+
+    @staticmethod
+    def __on_destroyed(slider_ref, *_):
+        # PyQt doesn't call slots bound to the destroyed object, hence the weak reference
+        slider = slider_ref()
+        if slider is not None:
+            slider.__cancel_animation()  # pylint: disable=protected-access
+
+    def __apply_animation(self, left_thumb_value, right_thumb_value):
+        self._model.set_range(left_thumb_value, right_thumb_value)
+
+    def __on_animation_finished(self):
+        self._animation = None
+        self.__commit()
+
+    def __commit(self):
+        """Deliver the values held back by the emission policy and range_committed."""
+        self._left_thumb_emitter.flush()
+        self._right_thumb_emitter.flush()
+        self._range_emitter.flush()
+        self.range_committed.emit(self._model.low, self._model.high)
+
+    def set_steps(self, single_step=1, page_step=None, duration=100):
+        """
+        Set how far the arrow keys and the mouse wheel (single_step) and the page
+        keys and the shifted wheel (page_step) move a thumb.
+
+        page_step defaults to a tenth of the bounds. Repeated steps accelerate up
+        to the page step. Steps are animated over duration milliseconds, 0 jumps.
+        """
+        if single_step < 1 or (page_step is not None and page_step < 1):
+            raise ValueError("Invalid step.")
+        self._steps.single_step = single_step
+        self._steps.page_step = page_step
+        self._step_duration = duration
+
+    def __get_span(self):
+        return self._model.max_value - self._model.min_value
+
+    def __step(self, delta):
+        """Move the active thumb by delta from where it is heading."""
+        low, high = (
+            self._animation.target
+            if self._animation is not None
+            else (self._model.low, self._model.high)
+        )
+        if self._active_thumb == 0:
+            low = min(max(low + delta, self._model.min_value), high - 1)
+        else:
+            high = max(min(high + delta, self._model.max_value), low + 1)
+        self.animate_to(low, high, self._step_duration)
+
+    def set_value_adapter(self, adapter):
+        """
+        Convert positions to user values (see qt_range_slider.adapters) for the
+        value_range_* signals and methods and the tick labels, None to stop.
+
+        The integer API and signals keep working on positions.
+        """
+        if self._value_adapter is None and adapter is not None:
+            self.range_changed.connect(self.__emit_value_range)
+            self.range_committed.connect(self.__emit_value_range_committed)
+        elif self._value_adapter is not None and adapter is None:
+            self.range_changed.disconnect(self.__emit_value_range)
+            self.range_committed.disconnect(self.__emit_value_range_committed)
+        self._value_adapter = adapter
+        if self._tick_labels_visible:
+            self.__invalidate_background()
+            self.__invalidate(QRegion(self.rect()))
+
+    def get_value_adapter(self):
+        return self._value_adapter
+
+    def set_value_range(self, low, high):
+        """Move both thumbs to user values, converted by the value adapter."""
+        adapter = self.__get_value_adapter()
+        self.set_range(adapter.to_position(low), adapter.to_position(high))
+
+    def get_value_range(self):
+        adapter = self.__get_value_adapter()
+        return (
+            adapter.from_position(self._model.low),
+            adapter.from_position(self._model.high),
+        )
+
+    def set_value_bounds(self, min_value, max_value):
+        """Change the min and max values to user values, see set_bounds."""
+        adapter = self.__get_value_adapter()
+        self.set_bounds(adapter.to_position(min_value), adapter.to_position(max_value))
+
+    def __get_value_adapter(self):
+        if self._value_adapter is None:
+            raise ValueError("No value adapter is set.")
+        return self._value_adapter
+
+    def __emit_value_range(self, low, high):
+        adapter = self._value_adapter
+        self.value_range_changed.emit(
+            adapter.from_position(low), adapter.from_position(high)
+        )
+
+    def __emit_value_range_committed(self, low, high):
+        adapter = self._value_adapter
+        self.value_range_committed.emit(
+            adapter.from_position(low), adapter.from_position(high)
+        )
+
+    def get_model(self):
+        """Return the Qt-free RangeModel which holds the range of the slider."""
+        return self._model
+
+    def set_bounds(self, min_value, max_value):
+        """
+        Change the min and max values.
+
+        Thumb values are kept where possible and clamped into the new bounds
+        otherwise, with a single repaint and at most one signal of each kind.
+        """
+        with self.batch_update():
+            self.__set_bounds(min_value, max_value)
+
+    def get_bounds(self):
+        return self._model.min_value, self._model.max_value
+
+    def set_auto_extend(self, enabled, growth=2):
+        """
+        Let observe extend the bounds to the observed values.
+
+        The bounds grow by growth times the distance to the value outside of them, so
+        a growing stream rescales the slider only O(log n) times.
+        """
+        if growth <= 1:
+            raise ValueError("Growth must be greater than 1.")
+        self._auto_extend = enabled
+        self._growth = growth
+
+    def observe(self, values):
+        """Extend the bounds to include values (a number or an array-like) if enabled."""
+        if not self._auto_extend:
+            return
+        if hasattr(values, "min"):
+            if not values.size:
+                return
+            low, high = int(values.min()), int(values.max())
+        elif hasattr(values, "__iter__"):
+            values = list(values)
+            if not values:
+                return
+            low, high = min(values), max(values)
+        else:
+            low = high = values
+        bounds = grow_bounds(*self.get_bounds(), low, high, self._growth)
+        if bounds is None:
+            return
+        if self._instrumentation is not None:
+            self._instrumentation.count("bounds_extensions")
+        with self.batch_update():
+            old_min_value, old_max_value = self.get_bounds()
+            low, high = self._model.low, self._model.high
+            self.__set_bounds(*bounds)
+            # thumbs at the bounds keep showing everything
+            self._model.set_range(
+                bounds[0] if low == old_min_value else self._model.low,
+                bounds[1] if high == old_max_value else self._model.high,
+            )
+
+    def __set_bounds(self, min_value, max_value):
+        if (min_value, max_value) == self.get_bounds():
+            return
+        # the target may be outside of the new bounds
+        self.stop_animation()
+        self._model.set_bounds(min_value, max_value)
+        self._mapper = self._mapper.with_bounds(min_value, max_value)
+        if self._distribution is not None:
+            self._distribution.set_bounds(min_value, max_value)
+        self._drag.invalidate()
+        self.__invalidate_layout()
+        self.__invalidate_background()
+        self.__invalidate(QRegion(self.rect()))
+
+    def __on_range_changed(self, old_left_value, old_right_value):
+        left_thumb_value = self._model.low
+        right_thumb_value = self._model.high
+        if self._layout is not None:
+            # only the thumbs and the fill moved
+            self._layout = self._renderer.move_thumbs(
+                self._layout, self.__get_thumb_pixels()
+            )
+        if left_thumb_value != old_left_value:
+            self.__emit(self._left_thumb_emitter, left_thumb_value)
+            self.__invalidate_thumb_move(old_left_value, 0)
+        if right_thumb_value != old_right_value:
+            self.__emit(self._right_thumb_emitter, right_thumb_value)
+            self.__invalidate_thumb_move(old_right_value, 1)
+        self.__emit_range()
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Defer repaints and value signals until the outermost batch exits.
+
+        Every signal is emitted at most once, with its latest value.
+        """
+        self._batch_depth += 1
+        try:
+            with self._model.batch_update():
+                yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.__flush_batch()
+
+    def __flush_batch(self):
+        deferred_emissions = self._deferred_emissions
+        self._deferred_emissions = {}
+        for emitter, args in deferred_emissions.items():
+            emitter.emit(*args, dragging=self.__is_adjusting())
+        if not self._dirty_region.isEmpty() and not self._update_scheduled:
+            self._update_scheduled = True
+            QTimer.singleShot(0, self.__flush_invalidation)
+
+    def __emit(self, emitter, *args):
+        if self._batch_depth:
+            self._deferred_emissions[emitter] = args
+            return
+        emitter.emit(*args, dragging=self.__is_adjusting())
+
+    def __emit_range(self):
+        self.__emit(self._range_emitter, self._model.low, self._model.high)
+        self.__update_match_count()
+
+    def set_data_column(self, column, assume_sorted=False):
+        """
+        Bind a numeric column (an array-like) to report how many rows match the range.
+
+        The column is sorted once unless assume_sorted is set, so every range change
+        costs O(log n).
+        """
+        # numpy is an optional dependency, only needed for data columns
+        # pylint: disable=import-outside-toplevel
+        from .range_index import SortedRangeIndex
+
+        self._range_index = SortedRangeIndex(column, assume_sorted)
+        self._match_count = None
+        self.__update_match_count()
+
+    def clear_data_column(self):
+        self._range_index = None
+        self._match_count = None
+        self.__invalidate_match_count()
+
+    def get_match_count(self):
+        """Return the number of rows of the data column inside the range, or None."""
+        return self._match_count
+
+    def set_match_count_visible(self, visible):
+        if visible == self._match_count_visible:
+            return
+        self._match_count_visible = visible
+        self.__invalidate_match_count()
+
+    def __update_match_count(self):
+        if self._range_index is None:
+            return
+        match_count = self._range_index.count(self._model.low, self._model.high)
+        if match_count == self._match_count:
+            return
+        self._match_count = match_count
+        self.__emit(self._match_count_emitter, match_count)
+        self.__invalidate_match_count()
+
+    def __invalidate_match_count(self):
+        self.__invalidate(QRegion(self.get_layout().text_rect))
+
+    def __draw_match_count(self, painter, layout):
+        if self._match_count is None:
+            return
+        self._renderer.draw_text(
+            painter,
+            layout.rect,
+            f"{self._match_count:,}",
+            self._colors.border_pen,
+        )
+
+    def set_emission_policy(self, policy, rate=None, delay=None):
+        """
+        Set when left_thumb_value_changed, right_thumb_value_changed and range_changed
+        are emitted.
+
+        rate is the maximum number of emissions per second for EmissionPolicy.THROTTLED,
+        delay is the quiet period in milliseconds for EmissionPolicy.DEBOUNCED.
+        """
+        if policy == EmissionPolicy.THROTTLED:
+            if rate is None or rate <= 0:
+                raise ValueError("Invalid throttling rate.")
+            interval_ms = 1000 / rate
+        elif policy == EmissionPolicy.DEBOUNCED:
+            if delay is None or delay < 0:
+                raise ValueError("Invalid debouncing delay.")
+            interval_ms = delay
+        else:
+            interval_ms = 0
+        self._left_thumb_emitter.set_policy(policy, interval_ms)
+        self._right_thumb_emitter.set_policy(policy, interval_ms)
+        self._range_emitter.set_policy(policy, interval_ms)
+
+    def set_scale(self, scale, values=None):
+        """
+        Set how values are spread over the track.
+
+        Scale.DISTINCT snaps the thumbs to the distinct values (an array-like) of a
+        dataset, the other scales ignore values.
+        """
+        self._mapper = create_mapper(
+            scale,
+            self._model.min_value,
+            self._model.max_value,
+            values,
+            self._mapper.width,
+        )
+        self._drag.invalidate()
+        self.__invalidate_layout()
+        self.__invalidate_background()
+        self.__invalidate(QRegion(self.rect()))
+
+    def get_scale(self):
+        return self._mapper.scale
+
+    def set_drag_compression(self, enabled, frame_rate=None):
+        """
+        Apply at most one mouse move per frame while dragging, the latest one.
+
+        frame_rate is in frames per second and defaults to the refresh rate of the
+        screen the slider is on.
+        """
+        if frame_rate is not None and frame_rate <= 0:
+            raise ValueError("Invalid frame rate.")
+        if not enabled:
+            self.__apply_pending_drag()
+        self._drag_compression = enabled
+        self._drag_frame_rate = frame_rate
+        if enabled and self._drag_frame_timer is None:
+            self._drag_frame_timer = QTimer(self)
+            self._drag_frame_timer.setSingleShot(True)
+            self._drag_frame_timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self._drag_frame_timer.timeout.connect(self.__on_drag_frame)
+
+    def get_coalesced_moves(self):
+        """Return how many mouse moves were dropped for a later one by drag compression."""
+        return self._coalesced_moves
+
+    def __get_frame_interval_ms(self):
+        frame_rate = self._drag_frame_rate
+        if frame_rate is None:
+            screen = self.screen()
+            frame_rate = screen.refreshRate() if screen is not None else 0
+        # some platforms report 0 when the rate is unknown
+        return round(1000 / (frame_rate if frame_rate > 0 else 60))
+
+    def __compress_drag(self, x):
+        """Record the latest pointer position, apply it now or at the next frame."""
+        if self._drag_frame_timer.isActive():
+            if self._pending_drag_x is not None:
+                self._coalesced_moves += 1
+                if self._instrumentation is not None:
+                    self._instrumentation.count("moves_coalesced")
+            self._pending_drag_x = x
+            return
+        # the first move after an idle frame is applied right away
+        self.__drag_to(x)
+        self._drag_frame_timer.start(self.__get_frame_interval_ms())
+
+    def __on_drag_frame(self):
+        if self._pending_drag_x is None:
+            return
+        self.__apply_pending_drag()
+        self._drag_frame_timer.start(self.__get_frame_interval_ms())
+
+    def __apply_pending_drag(self):
+        if self._pending_drag_x is None:
+            return
+        x = self._pending_drag_x
+        self._pending_drag_x = None
+        if self.__is_dragging():
+            self.__drag_to(x)
+
+    def __is_dragging(self):
+        return self._left_thumb.pressed or self._right_thumb.pressed
+
+    def __is_adjusting(self):
+        """Return if values are still moving, so ON_RELEASE holds their signals."""
+        return self.__is_dragging() or self._animation is not None
+
+    # override Qt event
+    def mousePressEvent(self, event):
+        position = event.position()
+        layout = self.get_layout()
+        for thumb, thumb_rect in zip(
+            (self._left_thumb, self._right_thumb), layout.thumb_rects
+        ):
+            if thumb_rect.contains(int(position.x()), int(position.y())):
+                # the pointer takes over, the drag release commits
+                self.__cancel_animation()
+                self._active_thumb = 0 if thumb is self._left_thumb else 1
+                thumb.pressed = True
+                self._drag.press(
+                    layout.rect,
+                    position.x(),
+                    self.__get_thumb_pixels()[self._active_thumb],
+                )
+                self._pending_drag_x = None
+                self.__invalidate_thumb(thumb)
+        super().mousePressEvent(event)
+
+    # override Qt event
+    def mouseReleaseEvent(self, event):
+        # the release position is committed, not a move still waiting for its frame
+        self.__apply_pending_drag()
+        dragging = self.__is_dragging()
+        for thumb in (self._left_thumb, self._right_thumb):
+            if thumb.pressed:
+                thumb.pressed = False
+                self.__invalidate_thumb(thumb)
+        if dragging:
+            self.__commit()
+        super().mouseReleaseEvent(event)
+
+    # override Qt event
+    def keyPressEvent(self, event):
+        key = event.key()
+        if key in (Qt.Key.Key_Left, Qt.Key.Key_Down):
+            self.__step(-self._steps.step(self.__get_span(), time.monotonic()))
+        elif key in (Qt.Key.Key_Right, Qt.Key.Key_Up):
+            self.__step(self._steps.step(self.__get_span(), time.monotonic()))
+        elif key == Qt.Key.Key_PageDown:
+            self.__step(-self._steps.page(self.__get_span()))
+        elif key == Qt.Key.Key_PageUp:
+            self.__step(self._steps.page(self.__get_span()))
+        elif key == Qt.Key.Key_Home:
+            self.__step(-self.__get_span())
+        elif key == Qt.Key.Key_End:
+            self.__step(self.__get_span())
+        else:
+            super().keyPressEvent(event)
+            return
+        event.accept()
+
+    # override Qt event
+    def wheelEvent(self, event):
+        delta = event.angleDelta().y() or event.angleDelta().x()
+        # high resolution wheels and touchpads send fractions of a notch
+        notches = self._steps.wheel_notches(delta)
+        if notches:
+            if self._left_thumb.hovered or self._right_thumb.hovered:
+                self._active_thumb = 0 if self._left_thumb.hovered else 1
+            if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+                step = self._steps.page(self.__get_span())
+            else:
+                step = self._steps.step(self.__get_span(), time.monotonic())
+            self.__step(notches * step)
+        event.accept()
+
+    # override Qt event
+    def focusNextPrevChild(self, next_child):
+        # Tab moves from the left to the right thumb before leaving the slider
+        if next_child and self._active_thumb == 0 and self.hasFocus():
+            self._active_thumb = 1
+            return True
+        if not next_child and self._active_thumb == 1 and self.hasFocus():
+            self._active_thumb = 0
+            return True
+        return super().focusNextPrevChild(next_child)
+
+    # override Qt event
+    def leaveEvent(self, event):
+        self.__set_thumb_hovered(self._left_thumb, False)
+        self.__set_thumb_hovered(self._right_thumb, False)
+        super().leaveEvent(event)
+
+    # override Qt event
+    def mouseMoveEvent(self, event):
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            start = instrumentation.start()
+
+        if self.__is_dragging():
+            if self._drag_compression:
+                self.__compress_drag(event.position().x())
+            else:
+                self.__drag_to(event.position().x())
+        else:
+            x = int(event.position().x())
+            y = int(event.position().y())
+            left_thumb_rect, right_thumb_rect = self.get_layout().thumb_rects
+            self.__set_thumb_hovered(self._left_thumb, left_thumb_rect.contains(x, y))
+            self.__set_thumb_hovered(self._right_thumb, right_thumb_rect.contains(x, y))
+
+        if instrumentation is not None:
+            instrumentation.finish("mouse_move", start)
+        super().mouseMoveEvent(event)
+
+    def __drag_to(self, x):
+        instrumentation = self._instrumentation
+        pixel = self._drag.move(self.get_layout().rect, x, self._mapper)
+        if pixel is None:
+            if instrumentation is not None:
+                instrumentation.count("moves_skipped")
+            return
+        if instrumentation is not None:
+            instrumentation.count("moves_handled")
+        new_val = self._mapper.pixel_to_value(pixel)
+        if self._left_thumb.pressed:
+            self._model.set_low(new_val)
+        else:
+            self._model.set_high(new_val)
+
+    def enable_instrumentation(self, instrumentation=None):
+        """
+        Start collecting paint, mouse move and emission statistics.
+
+        An Instrumentation may be shared by several sliders. Returns the one in use.
+        """
+        if instrumentation is None:
+            instrumentation = Instrumentation(self.objectName() or "QtRangeSlider")
+        self.__set_instrumentation(instrumentation)
+        return instrumentation
+
+    def disable_instrumentation(self):
+        self.__set_instrumentation(None)
+
+    def get_instrumentation(self):
+        return self._instrumentation
+
+    def __set_instrumentation(self, instrumentation):
+        self._instrumentation = instrumentation
+        for emitter in (
+            self._left_thumb_emitter,
+            self._right_thumb_emitter,
+            self._range_emitter,
+            self._match_count_emitter,
+        ):
+            emitter.instrumentation = instrumentation
+
+    def get_left_thumb_value(self):
+        return self._model.low
+
+    def get_right_thumb_value(self):
+        return self._model.high
+
+    def __get_distribution(self):
+        if self._distribution is None:
+            # numpy is an optional dependency, only needed for distributions
+            # pylint: disable=import-outside-toplevel
+            from .histogram import Distribution
+
+            self._distribution = Distribution(
+                self._model.min_value, self._model.max_value
+            )
+        return self._distribution
+
+    def __distribution_changed(self):
+        self.__invalidate_background()
+        self.__invalidate(QRegion(self.rect()))
+
+    def set_distribution(self, samples):
+        """Draw the distribution of the samples (an array-like) behind the track."""
+        self.__get_distribution().set_samples(samples)
+        self.__distribution_changed()
+
+    def set_histogram(self, counts, edges):
+        """Draw a precomputed histogram (as returned by numpy.histogram) behind the track."""
+        self.__get_distribution().set_histogram(counts, edges)
+        self.__distribution_changed()
+
+    def append_samples(self, samples):
+        """Add streamed samples to the distribution without binning all of the data again."""
+        self.__get_distribution().append_samples(samples)
+        self.__distribution_changed()
+
+    def clear_distribution(self):
+        self._distribution = None
+        self.__distribution_changed()
+
+    def set_ticks_count(self, count, minor_count=0):
+        """
+        Draw count intervals of major ticks, each split by minor_count minor ticks.
+
+        Ticks which would be closer than a few pixels are thinned out, minor ticks
+        first, so any count costs at most one line per few track pixels.
+        """
+        if count < 0 or minor_count < 0:
+            raise ValueError("Invalid ticks count.")
+        self._ticks_count = count
+        self._minor_ticks_count = minor_count
+        self.__ticks_changed()
+
+    def set_tick_labels_visible(self, visible, formatter=None):
+        """
+        Show the value of every major tick below the track.
+
+        formatter turns a value into the label text, by default with thousands
+        separators. Labels which would overlap are skipped.
+        """
+        self._tick_labels_visible = visible
+        self._tick_label_formatter = formatter
+        self.__ticks_changed()
+
+    def __ticks_changed(self):
+        self.__invalidate_layout()
+        self.__invalidate_background()
+        self.__invalidate(QRegion(self.rect()))
+
+    def resizeEvent(self, event):
+        del event
+        if self._instrumentation is not None:
+            self._instrumentation.count("resizes")
+        # get_layout picks up the new size and resizes the mapper
+        self.__invalidate_layout()
+        self.__invalidate_background()
+
+    # override Qt event
+    def changeEvent(self, event):
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.StyleChange):
+            self._colors = RangeSliderColors.from_palette(self.palette(), self.style())
+            self.__invalidate_background()
+            self.__invalidate(QRegion(self.rect()))
+        elif event.type() == QEvent.Type.FontChange and self._tick_labels_visible:
+            self.__invalidate_background()
+            self.__invalidate(QRegion(self.rect()))
+        super().changeEvent(event)
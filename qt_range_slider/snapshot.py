@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import get_context
+from typing import Any, Optional
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QRect, QSize, Qt
+from PyQt6.QtGui import QGuiApplication, QImage, QPainter
+
+from .mapping import Scale, create_mapper
+from .model import RangeModel
+from .renderer import RangeSliderColors, RangeSliderRenderer
+
+# worker processes keep their application for all of their tasks
+_worker_app = None
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass(frozen=True)
+class SliderState:
+    """
+    Everything render_range_slider needs to draw a slider, e.g. a saved filter.
+
+    It is a plain picklable value, so it can be sent to worker processes.
+    """
+
+    min_value: int
+    max_value: int
+    low: int
+    high: int
+    scale: Scale = Scale.LINEAR
+    # the distinct values of Scale.DISTINCT
+    values: Optional[Any] = None
+    ticks_count: int = 0
+    minor_ticks_count: int = 0
+    tick_labels: bool = False
+
+
+def render_range_slider(state, size, dpr=1.0, image_format=None, palette=None):
+    """
+    Draw a slider in state into an offscreen image of size (a QSize or a tuple).
+
+    Uses the renderer of QtRangeSlider, so snapshots look like the widget. Returns
+    the QImage, or its bytes encoded as image_format (e.g. "PNG") if given. Needs a
+    QGuiApplication, on the offscreen platform if there is no display.
+    """
+    if not isinstance(size, QSize):
+        size = QSize(*size)
+    # validated with the rules of the widget
+    model = RangeModel(state.min_value, state.max_value, state.low, state.high)
+    renderer = RangeSliderRenderer()
+    rect = QRect(0, 0, size.width(), size.height())
+    mapper = create_mapper(
+        state.scale,
+        model.min_value,
+        model.max_value,
+        state.values,
+        renderer.available_width(rect),
+    )
+    layout = renderer.layout(
+        rect,
+        (mapper.value_to_pixel(model.low), mapper.value_to_pixel(model.high)),
+        state.ticks_count,
+        state.minor_ticks_count,
+        state.tick_labels,
+    )
+    colors = RangeSliderColors.from_palette(
+        palette if palette is not None else QGuiApplication.palette()
+    )
+
+    image = QImage(
+        round(size.width() * dpr),
+        round(size.height() * dpr),
+        QImage.Format.Format_ARGB32_Premultiplied,
+    )
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    renderer.draw_background(
+        painter,
+        layout,
+        colors,
+        tick_labels=(
+            renderer.tick_label_texts(layout, mapper) if state.tick_labels else None
+        ),
+    )
+    renderer.draw_thumbs(painter, layout, colors, dpr)
+    painter.end()
+
+    if image_format is None:
+        return image
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, image_format)
+    buffer.close()
+    return bytes(data)
+
+
+# pylint: disable=too-many-arguments
+def render_range_sliders(
+    states, size, dpr=1.0, image_format="PNG", *, processes=None, chunksize=16
+):
+    """
+    Render many states on a pool of processes, yielding the encoded images in order.
+
+    Every worker runs its own QGuiApplication on the offscreen platform, so no
+    display and no widgets are needed. Images are yielded as workers finish them.
+    """
+    if not isinstance(size, QSize):
+        size = QSize(*size)
+    render = partial(
+        _render_in_worker, (size.width(), size.height()), dpr, image_format
+    )
+    # Qt doesn't survive a fork, workers start from a fresh interpreter
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+    ) as executor:
+        yield from executor.map(render, states, chunksize=chunksize)
+
+
+def _init_worker():
+    # pylint: disable=global-statement
+    global _worker_app
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    _worker_app = QGuiApplication.instance() or QGuiApplication([])
+
+
+def _render_in_worker(size, dpr, image_format, state):
+    return render_range_slider(state, size, dpr, image_format)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from enum import Enum
+
+from PyQt6.QtCore import Qt, QRect, QSize
+from PyQt6.QtGui import QPainter, QBrush, QPen, QPixmap, QStaticText, QTransform
+
+
+class ThumbState(Enum):
+    """Visual state of a thumb."""
+
+    NORMAL = 0
+    HOVER = 1
+    PRESSED = 2
+
+
+class ThumbSpriteCache:
+    """
+    Bounded LRU cache of pre-rendered antialiased thumb pixmaps.
+
+    Sprites are keyed by (size, fill color, border color, device pixel ratio,
+    state) and can be shared by any number of widgets.
+    Each sprite has a MARGIN pixel border around the thumb ellipse so that
+    antialiased edges are not cut off.
+    """
+
+    MARGIN = 1
+
+    def __init__(self, max_size=64):
+        if max_size < 1:
+            raise ValueError("Invalid sprite cache size.")
+        self._max_size = max_size
+        self._sprites = OrderedDict()
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def clear(self):
+        self._sprites.clear()
+
+    # pylint: disable=too-many-arguments
+    def get(self, size, base_color, border_color, dpr, state):
+        key = (
+            size.width(),
+            size.height(),
+            base_color.rgba(),
+            border_color.rgba(),
+            dpr,
+            state,
+        )
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+
+        sprite = self.__render(size, base_color, border_color, dpr)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self._max_size:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def __render(self, size, base_color, border_color, dpr):
+        margin = self.MARGIN
+        pixmap = QPixmap(
+            QSize(
+                round((size.width() + 2 * margin) * dpr),
+                round((size.height() + 2 * margin) * dpr),
+            )
+        )
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(border_color))
+        painter.setBrush(QBrush(base_color, Qt.BrushStyle.SolidPattern))
+        painter.drawEllipse(QRect(margin, margin, size.width(), size.height()))
+        painter.end()
+        return pixmap
+
+
+class StaticTextCache:
+    """
+    Bounded LRU cache of laid out QStaticText labels, keyed by text and font.
+
+    Tick labels repeat across repaints and sliders, caching them skips the text
+    layout on every background render.
+    """
+
+    def __init__(self, max_size=256):
+        if max_size < 1:
+            raise ValueError("Invalid text cache size.")
+        self._max_size = max_size
+        self._texts = OrderedDict()
+
+    def __len__(self):
+        return len(self._texts)
+
+    def clear(self):
+        self._texts.clear()
+
+    def get(self, text, font):
+        key = (text, font.key())
+        static_text = self._texts.get(key)
+        if static_text is not None:
+            self._texts.move_to_end(key)
+            return static_text
+
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.prepare(QTransform(), font)
+        self._texts[key] = static_text
+        if len(self._texts) > self._max_size:
+            self._texts.popitem(last=False)
+        return static_text
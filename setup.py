@@ -31,5 +31,6 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     include_package_data=True,
     install_requires=["PyQt6_Qt6", "PyQt6-sip"],
+    extras_require={"numpy": ["numpy"]},
     python_requires=">=3.9",
 )
@@ -26,8 +26,18 @@ def test(c):
 
 @task
 def lint(c):
-    run_arg = "pylint -j 4 qt_range_slider/__init__.py example.py tests/"
+    run_arg = "pylint -j 4 qt_range_slider/ example.py tests/ benchmarks/"
     if os.name == "nt":  # Windows
         c.run(run_arg)
     else:
         c.run(run_arg, pty=True)
+
+
+@task
+def bench(c, update_baseline=False, threshold=None):
+    run_arg = f"{py} benchmarks/bench_slider.py"
+    if update_baseline:
+        run_arg += " --update-baseline"
+    if threshold is not None:
+        run_arg += f" --threshold {threshold}"
+    c.run(run_arg)
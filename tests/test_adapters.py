@@ -0,0 +1,97 @@
+import unittest
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+
+from qt_range_slider import (
+    DatetimeAdapter,
+    DecimalAdapter,
+    FloatAdapter,
+    ValueAdapter,
+)
+
+
+class ValueAdaptersTest(unittest.TestCase):
+    """Tests for qt_range_slider.adapters"""
+
+    def test_float(self):
+        adapter = FloatAdapter(-1.0, 0.001)
+        self.assertEqual(adapter.to_position(-1.0), 0)
+        self.assertEqual(adapter.to_position(0.5004), 1500)
+        self.assertAlmostEqual(adapter.from_position(1500), 0.5)
+        self.assertEqual(adapter.format(1234.5), "1,234.500")
+        positions = adapter.to_positions(np.array([-1.0, 0.0, 2.5]))
+        self.assertEqual(positions.dtype, np.uint64)
+        self.assertEqual(positions.tolist(), [0, 1000, 3500])
+        np.testing.assert_allclose(adapter.from_positions(positions), [-1.0, 0.0, 2.5])
+        with self.assertRaises(ValueError):
+            adapter.to_position(-2.0)
+        with self.assertRaises(ValueError):
+            adapter.to_positions([0.0, -2.0])
+        with self.assertRaises(ValueError):
+            adapter.to_positions([np.nan])
+        with self.assertRaises(ValueError):
+            FloatAdapter(resolution=0)
+        quarters = FloatAdapter(0.0, 0.25)
+        self.assertEqual(
+            [quarters.format(quarters.from_position(i)) for i in (1, 3)],
+            ["0.25", "0.75"],
+        )
+        self.assertEqual(FloatAdapter(0.0, 10.0).format(1234.0), "1,234")
+        self.assertEqual(FloatAdapter(resolution=1e-6).format(0.5), "0.500000")
+
+    def test_value_adapter_is_abstract(self):
+        with self.assertRaises(TypeError):
+            ValueAdapter()  # pylint: disable=abstract-class-instantiated
+
+    def test_decimal(self):
+        adapter = DecimalAdapter(Decimal("-10.00"), "0.05")
+        self.assertEqual(adapter.to_position(Decimal("-9.975")), 1)
+        self.assertEqual(adapter.from_position(201), Decimal("0.05"))
+        self.assertEqual(adapter.format(Decimal("1234.50")), "1,234.50")
+        self.assertEqual(
+            adapter.to_positions([-10.0, 0.0, 0.05]).tolist(), [0, 200, 201]
+        )
+        self.assertEqual(
+            adapter.to_positions(np.array([Decimal("0.05")], dtype=object)).tolist(),
+            [201],
+        )
+        self.assertEqual(
+            adapter.from_positions([0, 201]).tolist(),
+            [Decimal("-10.00"), Decimal("0.05")],
+        )
+
+    def test_datetime(self):
+        origin = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        adapter = DatetimeAdapter(origin, timedelta(minutes=1))
+        value = datetime(2024, 1, 2, 0, 30, tzinfo=timezone.utc)
+        self.assertEqual(adapter.to_position(value), 24 * 60 + 30)
+        self.assertEqual(adapter.from_position(24 * 60 + 30), value)
+        self.assertEqual(adapter.format(value), "2024-01-02 00:30:00")
+        values = np.array(
+            ["2024-01-01T00:00", "2024-01-02T00:30"], dtype="datetime64[s]"
+        )
+        positions = adapter.to_positions(values)
+        self.assertEqual(positions.tolist(), [0, 24 * 60 + 30])
+        self.assertEqual(
+            adapter.from_positions(positions).tolist(),
+            [origin, value],
+        )
+        days = DatetimeAdapter(datetime(2024, 1, 1), timedelta(days=1))
+        self.assertEqual(days.format(days.from_position(31)), "2024-02-01")
+        naive = days.from_positions([0, 31])
+        self.assertEqual(naive.dtype, np.dtype("datetime64[us]"))
+        self.assertEqual(naive.tolist(), [datetime(2024, 1, 1), datetime(2024, 2, 1)])
+
+    def test_datetime_aware_origin(self):
+        zone = timezone(timedelta(hours=2))
+        adapter = DatetimeAdapter(datetime(2024, 1, 1, tzinfo=zone), timedelta(hours=1))
+        # the batch conversion, e.g. of tick labels, matches the scalar one
+        value = adapter.from_position(3)
+        self.assertEqual(value.utcoffset(), timedelta(hours=2))
+        self.assertEqual(adapter.from_positions([3]).tolist(), [value])
+        self.assertEqual(
+            adapter.format(adapter.from_positions([3])[0]), "2024-01-01 03:00:00"
+        )
@@ -0,0 +1,75 @@
+import sys
+import time
+import unittest
+
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+
+from qt_range_slider.animation import FrameClock, RangeAnimation
+
+
+class FrameClockTest(unittest.TestCase):
+    """Tests for qt_range_slider.animation"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_animation_values(self):
+        values = []
+        finished = []
+        animation = RangeAnimation(
+            lambda low, high: values.append((low, high)),
+            (0, 2**64 - 1),
+            (2**63, 2**64 - 1),
+            1000,
+            0.0,
+            on_finished=lambda: finished.append(True),
+        )
+        self.assertTrue(animation.tick(0.5))
+        low, high = values[-1]
+        self.assertEqual(high, 2**64 - 1)
+        # ease-out: past the middle at half the time
+        self.assertGreater(low, 2**62)
+        self.assertFalse(animation.tick(1.0))
+        self.assertEqual(values[-1], (2**63, 2**64 - 1))
+        self.assertEqual(finished, [True])
+
+    def test_shared_timer_budget(self):
+        clock = FrameClock(frame_rate=200, budget_ms=1)
+        values = {}
+
+        def slow_apply(index):
+            def apply(low, high):
+                time.sleep(0.002)
+                values[index] = (low, high)
+
+            return apply
+
+        animations = [
+            RangeAnimation(slow_apply(index), (0, 10), (5, 10), 20, 0.0)
+            for index in range(10)
+        ]
+        for animation in animations:
+            clock.add(animation)
+            clock.add(animation)
+        self.assertEqual(clock.stats()["running"], 10)
+        deadline = time.monotonic() + 2
+        while clock.stats()["running"] and time.monotonic() < deadline:
+            QTest.qWait(10)
+        self.assertEqual(set(values.values()), {(5, 10)})
+        # one frame couldn't tick all of them within the budget
+        self.assertGreater(clock.stats()["deferred_ticks"], 0)
+        self.assertLessEqual(clock.stats()["ticks"], 10 * clock.stats()["frames"])
+
+    def test_cancel(self):
+        clock = FrameClock()
+        animation = RangeAnimation(lambda low, high: None, (0, 10), (5, 10), 1000, 0.0)
+        clock.add(animation)
+        self.assertTrue(clock.is_running(animation))
+        clock.remove(animation)
+        self.assertFalse(clock.is_running(animation))
+        animation.cancel()
+        self.assertFalse(animation.tick(0.5))
+        with self.assertRaises(ValueError):
+            clock.set_budget(0)
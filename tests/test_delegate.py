@@ -0,0 +1,61 @@
+import sys
+import unittest
+
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QImage, QPainter, QStandardItem, QStandardItemModel
+from PyQt6.QtWidgets import QApplication, QStyleOptionViewItem, QTableView
+
+from qt_range_slider.delegate import RangeSliderDelegate
+from qt_range_slider.renderer import RangeSliderRenderer
+
+BOUNDS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class RangeSliderDelegateTest(unittest.TestCase):
+    """Tests for qt_range_slider.delegate"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self._model = QStandardItemModel(3, 1)
+        for row in range(3):
+            item = QStandardItem()
+            item.setData((row, row + 5), Qt.ItemDataRole.EditRole)
+            self._model.setItem(row, 0, item)
+        self._model.item(2, 0).setData((0, 1000), BOUNDS_ROLE)
+        self._view = QTableView()
+        self._view.setModel(self._model)
+        self._delegate = RangeSliderDelegate(0, 10, self._view, bounds_role=BOUNDS_ROLE)
+        self._view.setItemDelegate(self._delegate)
+
+    def test_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            RangeSliderDelegate(10, 0)
+
+    def test_paint(self):
+        image = QImage(200, 30, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.white)
+        painter = QPainter(image)
+        option = QStyleOptionViewItem()
+        option.rect = QRect(0, 0, 200, 30)
+        self._delegate.paint(painter, option, self._model.index(0, 0))
+        painter.end()
+        # the track fill is drawn between the thumbs
+        renderer = RangeSliderRenderer()
+        y = renderer.track_y(option.rect)
+        fill_x = renderer.track_padding + renderer.available_width(option.rect) // 4
+        self.assertEqual(image.pixelColor(fill_x, y), renderer.track_fill_color)
+
+    def test_editor(self):
+        index = self._model.index(2, 0)
+        editor = self._delegate.createEditor(
+            self._view.viewport(), QStyleOptionViewItem(), index
+        )
+        self._delegate.setEditorData(editor, index)
+        self.assertEqual(editor.get_left_thumb_value(), 2)
+        self.assertEqual(editor.get_right_thumb_value(), 7)
+        editor.set_range(100, 900)
+        self._delegate.setModelData(editor, self._model, index)
+        self.assertEqual(index.data(Qt.ItemDataRole.EditRole), (100, 900))
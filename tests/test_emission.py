@@ -0,0 +1,61 @@
+import sys
+import unittest
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+
+from qt_range_slider.emission import EmissionPolicy, SignalEmitter
+
+
+# pylint: disable=too-few-public-methods
+class _Source(QObject):
+    value_changed = pyqtSignal(int)
+
+
+class SignalEmitterTest(unittest.TestCase):
+    """Tests for qt_range_slider.emission"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self._source = _Source()
+        self._values = []
+        self._source.value_changed.connect(self._values.append)
+        self._emitter = SignalEmitter(self._source.value_changed, self._source)
+
+    def test_immediate(self):
+        for value in range(5):
+            self._emitter.emit(value)
+        self.assertEqual(self._values, [0, 1, 2, 3, 4])
+
+    def test_throttled(self):
+        self._emitter.set_policy(EmissionPolicy.THROTTLED, 50)
+        for value in range(5):
+            self._emitter.emit(value)
+        # the first value goes out at once, the latest one after the interval
+        self.assertEqual(self._values, [0])
+        QTest.qWait(100)
+        self.assertEqual(self._values, [0, 4])
+
+    def test_debounced(self):
+        self._emitter.set_policy(EmissionPolicy.DEBOUNCED, 20)
+        for value in range(5):
+            self._emitter.emit(value)
+        self.assertEqual(self._values, [])
+        QTest.qWait(60)
+        self.assertEqual(self._values, [4])
+
+    def test_on_release(self):
+        self._emitter.set_policy(EmissionPolicy.ON_RELEASE)
+        for value in range(5):
+            self._emitter.emit(value, dragging=True)
+        self.assertEqual(self._values, [])
+        self.assertTrue(self._emitter.has_pending())
+        self._emitter.flush()
+        self.assertEqual(self._values, [4])
+        # values set while not dragging are not held back
+        self._emitter.emit(7)
+        self.assertEqual(self._values, [4, 7])
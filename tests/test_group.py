@@ -0,0 +1,80 @@
+import sys
+import unittest
+
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from qt_range_slider import QtRangeSlider, RangeSliderGroup
+
+
+class RangeSliderGroupTest(unittest.TestCase):
+    """Tests for qt_range_slider.group"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self._calls = []
+        self._form = QWidget()
+        self._group = RangeSliderGroup(self.__propagate)
+        for key in ("a", "b", "c"):
+            self._group.add_slider(key, QtRangeSlider(self._form, 0, 100))
+
+    def __propagate(self, changes, ranges):
+        self._calls.append((changes, ranges))
+        # every other slider follows the low end of the changed ones
+        low = max(low for low, _ in changes.values())
+        return {
+            key: {"range": (low, ranges[key][1])}
+            for key in ranges
+            if key not in changes
+        }
+
+    def test_changes_are_coalesced_per_tick(self):
+        self._group.slider("a").set_left_thumb_value(10)
+        self._group.slider("a").set_left_thumb_value(20)
+        self._group.slider("b").set_right_thumb_value(90)
+        self.assertEqual(self._calls, [])
+        QTest.qWait(10)
+        self.assertEqual(len(self._calls), 1)
+        changes, ranges = self._calls[0]
+        self.assertEqual(changes, {"a": (20, 100), "b": (0, 90)})
+        self.assertEqual(ranges["c"], (0, 100))
+        # the update is applied without propagating again
+        self.assertEqual(self._group.slider("c").get_left_thumb_value(), 20)
+        QTest.qWait(10)
+        self.assertEqual(self._group.propagation_count(), 1)
+
+    def test_flush(self):
+        propagated = []
+        self._group.propagated.connect(propagated.append)
+        self._group.flush()
+        self.assertEqual(propagated, [])
+        self._group.slider("c").set_range(30, 40)
+        self._group.flush()
+        self.assertEqual(propagated, [{"c": (30, 40)}])
+        self.assertEqual(self._group.ranges()["a"], (30, 100))
+
+    def test_bounds_update(self):
+        self._group.set_propagate(
+            lambda changes, ranges: {"b": {"bounds": (0, 10), "range": (2, 8)}}
+        )
+        self._group.slider("a").set_range(30, 40)
+        self._group.flush()
+        self.assertEqual(self._group.slider("b").get_bounds(), (0, 10))
+        self.assertEqual(self._group.ranges()["b"], (2, 8))
+
+    def test_add_and_remove(self):
+        with self.assertRaises(ValueError):
+            self._group.add_slider("a", QtRangeSlider(self._form, 0, 1))
+        slider = self._group.slider("b")
+        self._group.remove_slider("b")
+        slider.set_left_thumb_value(50)
+        self._group.flush()
+        self.assertEqual(self._calls, [])
+        self.assertEqual(sorted(self._group.ranges()), ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from qt_range_slider.histogram import Distribution
+
+
+class DistributionTest(unittest.TestCase):
+    """Tests for qt_range_slider.histogram"""
+
+    def test_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            Distribution(10, 0)
+
+    def test_binned_samples(self):
+        distribution = Distribution(0, 100)
+        distribution.set_samples(np.arange(100))
+        counts = distribution.binned(10)
+        self.assertEqual(counts.tolist(), [10.0] * 10)
+        self.assertIs(distribution.binned(10), counts)
+
+    def test_append_samples_updates_cached_bins(self):
+        distribution = Distribution(0, 100)
+        distribution.set_samples(np.arange(100))
+        counts = distribution.binned(10)
+        version = distribution.version
+        distribution.append_samples([5, 15, 95])
+        self.assertGreater(distribution.version, version)
+        appended = distribution.binned(10)
+        self.assertIs(appended, counts)
+        self.assertEqual(appended[0], 11)
+        self.assertEqual(appended[1], 11)
+        self.assertEqual(appended[9], 11)
+        # a width that was not cached is binned from all chunks
+        self.assertEqual(distribution.binned(5).sum(), 103)
+
+    def test_set_histogram(self):
+        distribution = Distribution(0, 100)
+        distribution.set_histogram([10, 30], [0, 50, 100])
+        counts = distribution.binned(4)
+        self.assertEqual(counts.tolist(), [5.0, 5.0, 15.0, 15.0])
+
+    def test_invalid_histogram(self):
+        distribution = Distribution(0, 100)
+        with self.assertRaises(ValueError):
+            distribution.set_histogram([1, 2], [0, 100])
+        with self.assertRaises(ValueError):
+            distribution.set_histogram([1, 2], [0, 100, 50])
+
+    def test_set_bounds_drops_cache(self):
+        distribution = Distribution(0, 100)
+        distribution.set_samples(np.arange(100))
+        self.assertEqual(distribution.binned(2).tolist(), [50.0, 50.0])
+        distribution.set_bounds(0, 50)
+        # the last bin includes the max value
+        self.assertEqual(distribution.binned(2).tolist(), [25.0, 26.0])
+
+    def test_binned_by_edges(self):
+        distribution = Distribution(0, 100)
+        distribution.set_samples(np.arange(100))
+        counts = distribution.binned(3, [0, 10, 50, 100])
+        self.assertEqual(counts.tolist(), [10.0, 40.0, 50.0])
+        distribution.set_histogram([10, 30], [0, 50, 100])
+        self.assertEqual(distribution.binned(2, [0, 25, 100]).tolist(), [5.0, 35.0])
@@ -0,0 +1,49 @@
+import json
+import os
+import tempfile
+import unittest
+
+from qt_range_slider.instrumentation import Histogram, Instrumentation
+
+
+class InstrumentationTest(unittest.TestCase):
+    """Tests for qt_range_slider.instrumentation"""
+
+    def test_counters(self):
+        instrumentation = Instrumentation()
+        instrumentation.count("paints")
+        instrumentation.count("paints", 2)
+        self.assertEqual(instrumentation.counter("paints"), 3)
+        self.assertEqual(instrumentation.counter("resizes"), 0)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.to_dict()["counters"], {})
+
+    def test_histogram(self):
+        histogram = Histogram()
+        histogram.add(0.000_003)
+        histogram.add(0.001)
+        histogram.add(1000)
+        stats = histogram.to_dict()
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["max_s"], 1000)
+        self.assertEqual(stats["buckets_us"][4], 1)
+        self.assertEqual(stats["buckets_us"][1024], 1)
+        self.assertEqual(stats["buckets_us"][2 ** (Histogram.BUCKETS - 1)], 1)
+
+    def test_chrome_trace(self):
+        instrumentation = Instrumentation("slider")
+        start = instrumentation.start()
+        instrumentation.finish("paint", start)
+        instrumentation.count("paints")
+        self.assertEqual(instrumentation.to_dict()["timings"]["paint"]["count"], 1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            instrumentation.dump_chrome_trace(path)
+            with open(path, encoding="utf-8") as fid:
+                trace = json.load(fid)
+        phases = sorted(event["ph"] for event in trace["traceEvents"])
+        self.assertEqual(phases, ["C", "X"])
+        span = next(event for event in trace["traceEvents"] if event["ph"] == "X")
+        self.assertEqual(span["name"], "paint")
+        self.assertEqual(span["cat"], "slider")
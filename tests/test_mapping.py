@@ -0,0 +1,122 @@
+import unittest
+
+from qt_range_slider.mapping import (
+    DistinctValueMapper,
+    LogValueMapper,
+    MapperCache,
+    Scale,
+    ValueMapper,
+    create_mapper,
+)
+
+
+class ValueMapperTest(unittest.TestCase):
+    """Tests for qt_range_slider.mapping"""
+
+    def test_invalid_range(self):
+        with self.assertRaises(ValueError):
+            ValueMapper(10, 10)
+
+    def test_nonzero_min_value(self):
+        mapper = ValueMapper(100, 200, 50)
+        self.assertEqual(mapper.value_to_pixel(100), 0)
+        self.assertEqual(mapper.value_to_pixel(150), 25)
+        self.assertEqual(mapper.value_to_pixel(200), 50)
+        self.assertEqual(mapper.pixel_to_value(0), 100)
+        self.assertEqual(mapper.pixel_to_value(25), 150)
+        self.assertEqual(mapper.pixel_to_value(50), 200)
+
+    def test_clamping(self):
+        mapper = ValueMapper(0, 10, 100)
+        self.assertEqual(mapper.pixel_to_value(-5), 0)
+        self.assertEqual(mapper.pixel_to_value(500), 10)
+        self.assertEqual(mapper.value_to_pixel(-5), 0)
+        self.assertEqual(mapper.value_to_pixel(500), 100)
+
+    def test_exact_above_float_precision(self):
+        min_value = 2**60
+        max_value = 2**64 - 1
+        mapper = ValueMapper(min_value, max_value, 1000)
+        self.assertEqual(mapper.pixel_to_value(0), min_value)
+        self.assertEqual(mapper.pixel_to_value(1000), max_value)
+        for pixel in (1, 333, 999):
+            value = mapper.pixel_to_value(pixel)
+            self.assertEqual(mapper.value_to_pixel(value), pixel)
+            self.assertEqual(mapper.bucket(value), pixel)
+        # neighbouring values at this magnitude are not distinguishable as floats
+        self.assertEqual(float(max_value), float(max_value - 1))
+        self.assertNotEqual(mapper.value_to_pixel(min_value + 1), 1000)
+
+    def test_bucket_bounds(self):
+        mapper = ValueMapper(0, 1000, 10)
+        start, end = mapper.bucket_bounds(3)
+        self.assertEqual((start, end), (250, 349))
+        for value in (start, end):
+            self.assertEqual(mapper.value_to_pixel(value), 3)
+            self.assertEqual(mapper.bucket(value), 3)
+        self.assertEqual(mapper.value_to_pixel(start - 1), 2)
+        self.assertEqual(mapper.value_to_pixel(end + 1), 4)
+        self.assertEqual(mapper.bucket_bounds(10), (950, 1000))
+
+    def test_buckets_match_direct_mapping(self):
+        mapper = ValueMapper(3, 20, 7)
+        for value in range(3, 21):
+            self.assertEqual(mapper.bucket(value), mapper.value_to_pixel(value))
+
+    def test_log_scale(self):
+        mapper = LogValueMapper(0, 10 * 2**30, 500)
+        self.assertEqual(mapper.pixel_to_value(0), 0)
+        self.assertEqual(mapper.pixel_to_value(500), 10 * 2**30)
+        # the middle of the track is near sqrt(max), not max / 2
+        self.assertLess(mapper.pixel_to_value(250), 2**17)
+        values = mapper.pixel_values
+        self.assertEqual(values, sorted(values))
+        for pixel in (50, 250, 499):
+            value = mapper.pixel_to_value(pixel)
+            self.assertEqual(mapper.value_to_pixel(value), pixel)
+            start, end = mapper.bucket_bounds(pixel)
+            self.assertLessEqual(start, value)
+            self.assertLessEqual(value, end)
+
+    def test_distinct_values_scale(self):
+        mapper = DistinctValueMapper(0, 1000, [999, 5, 100, 7, 5, 2000], 10)
+        self.assertEqual(mapper.values, [0, 5, 7, 100, 999, 1000])
+        self.assertEqual(
+            [mapper.value_to_pixel(value) for value in mapper.values],
+            [0, 2, 4, 6, 8, 10],
+        )
+        # every pixel snaps to a dataset value
+        for pixel in range(11):
+            self.assertIn(mapper.pixel_to_value(pixel), mapper.values)
+        # values in between belong to the nearest smaller dataset value
+        self.assertEqual(mapper.value_to_pixel(50), 4)
+
+    def test_distinct_values_with_bounds(self):
+        mapper = DistinctValueMapper(0, 100, [10, 20, 30])
+        # the old bounds are no snap points of the new ones
+        self.assertEqual(mapper.with_bounds(5, 200).values, [5, 10, 20, 30, 200])
+        # narrowing and widening again brings the dataset values back
+        narrowed = mapper.with_bounds(15, 25)
+        self.assertEqual(narrowed.values, [15, 20, 25])
+        self.assertEqual(narrowed.with_bounds(0, 100).values, [0, 10, 20, 30, 100])
+
+    def test_mapper_cache(self):
+        cache = MapperCache(max_size=2)
+        mapper = cache.get(0, 100, 50)
+        self.assertIs(cache.get(0, 100, 50), mapper)
+        self.assertEqual(
+            (mapper.min_value, mapper.max_value, mapper.width), (0, 100, 50)
+        )
+        cache.get(0, 100, 60)
+        # a full cache starts over
+        cache.get(0, 200, 50)
+        self.assertIsNot(cache.get(0, 100, 50), mapper)
+
+    def test_create_mapper(self):
+        self.assertEqual(create_mapper(Scale.LINEAR, 0, 10).scale, Scale.LINEAR)
+        self.assertEqual(create_mapper(Scale.LOG, 0, 10, width=5).width, 5)
+        self.assertEqual(
+            create_mapper(Scale.DISTINCT, 0, 10, [3]).pixel_values, [0, 10]
+        )
+        with self.assertRaises(ValueError):
+            create_mapper(Scale.DISTINCT, 0, 10)
@@ -0,0 +1,101 @@
+import subprocess
+import sys
+import unittest
+
+from qt_range_slider.model import UINT64_MAX, RangeModel, grow_bounds
+
+
+class RangeModelTest(unittest.TestCase):
+    """Tests for qt_range_slider.model"""
+
+    def setUp(self):
+        self._changes = []
+        self._model = RangeModel(0, 100, 10, 20)
+        self._model.add_listener(lambda *args: self._changes.append(args))
+
+    def test_invalid_init(self):
+        with self.assertRaises(ValueError):
+            RangeModel(10, 10)
+        with self.assertRaises(ValueError):
+            RangeModel(0, 10, 5, 5)
+        model = RangeModel(5, 10)
+        self.assertEqual((model.low, model.high), (5, 10))
+        # the widgets' signals carry unsigned 64-bit values
+        with self.assertRaises(ValueError):
+            RangeModel(-10, 10)
+        with self.assertRaises(ValueError):
+            RangeModel(0, UINT64_MAX + 1)
+
+    def test_setters(self):
+        self.assertTrue(self._model.set_low(15))
+        self.assertFalse(self._model.set_low(15))
+        self.assertFalse(self._model.set_low(20))
+        self.assertFalse(self._model.set_low(-1))
+        self.assertTrue(self._model.set_high(100))
+        self.assertFalse(self._model.set_high(101))
+        self.assertFalse(self._model.set_high(15))
+        self.assertEqual(self._changes, [(10, 20), (15, 20)])
+        self.assertEqual((self._model.low, self._model.high), (15, 100))
+
+    def test_set_range_validates_against_new_values(self):
+        self.assertTrue(self._model.set_range(50, 60))
+        self.assertFalse(self._model.set_range(60, 60))
+        self.assertFalse(self._model.set_range(0, 101))
+        self.assertEqual(self._changes, [(10, 20)])
+        self.assertTrue(self._model.is_valid_range(0, 100))
+        self.assertFalse(self._model.is_valid_range(70, 60))
+
+    def test_batch_update(self):
+        with self._model.batch_update():
+            self._model.set_high(50)
+            with self._model.batch_update():
+                self._model.set_low(40)
+            self.assertEqual(self._changes, [])
+        self.assertEqual(self._changes, [(10, 20)])
+        with self._model.batch_update():
+            self._model.set_low(0)
+            self._model.set_low(40)
+        self.assertEqual(len(self._changes), 1)
+
+    def test_set_bounds_clamps_in_one_pass(self):
+        self.assertFalse(self._model.set_bounds(0, 1000))
+        self.assertTrue(self._model.set_bounds(15, 16))
+        self.assertEqual((self._model.low, self._model.high), (15, 16))
+        self.assertEqual(self._changes, [(10, 20)])
+        self.assertTrue(self._model.set_bounds(50, 60))
+        self.assertEqual((self._model.low, self._model.high), (50, 51))
+        with self.assertRaises(ValueError):
+            self._model.set_bounds(60, 60)
+        with self.assertRaises(ValueError):
+            self._model.set_bounds(-10, 10)
+
+    def test_grow_bounds(self):
+        self.assertIsNone(grow_bounds(0, 100, 0, 100))
+        self.assertEqual(grow_bounds(0, 100, 0, 150), (0, 300))
+        self.assertEqual(grow_bounds(0, 100, 0, 301), (0, 602))
+        self.assertEqual(grow_bounds(10, 100, 5, 50), (0, 100))
+        self.assertEqual(grow_bounds(10, 100, -5, 100), (0, 100))
+        self.assertIsNone(grow_bounds(0, 100, -5, 100))
+        self.assertEqual(
+            grow_bounds(0, UINT64_MAX - 10, 0, UINT64_MAX - 5), (0, UINT64_MAX)
+        )
+        self.assertEqual(grow_bounds(0, 100, 0, 2**65), (0, UINT64_MAX))
+        with self.assertRaises(ValueError):
+            grow_bounds(0, 100, 0, 200, growth=1)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            # pylint: disable=assigning-non-slot
+            self._model.extra = 1
+
+    def test_import_does_not_load_qt(self):
+        code = (
+            "import sys, qt_range_slider; "
+            "qt_range_slider.RangeModel(0, 1).set_range(0, 1); "
+            "sys.exit(any(name.startswith('PyQt6') for name in sys.modules))"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
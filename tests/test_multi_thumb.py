@@ -0,0 +1,121 @@
+import sys
+import unittest
+
+from PyQt6.QtCore import Qt, QEvent, QPoint, QPointF
+from PyQt6.QtGui import QMouseEvent, QRegion
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from qt_range_slider import MultiThumbSlider
+from qt_range_slider.renderer import RangeSliderRenderer
+
+
+def _mouse_move(widget, position):
+    event = QMouseEvent(
+        QEvent.Type.MouseMove,
+        QPointF(position),
+        Qt.MouseButton.LeftButton,
+        Qt.MouseButton.LeftButton,
+        Qt.KeyboardModifier.NoModifier,
+    )
+    QApplication.sendEvent(widget, event)
+
+
+class _PaintRecordingSlider(MultiThumbSlider):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.painted = QRegion()
+
+    # override Qt event
+    def paintEvent(self, event):
+        self.painted = self.painted.united(event.region())
+        super().paintEvent(event)
+
+    def is_painted(self, rect):
+        return QRegion(rect).subtracted(self.painted).isEmpty()
+
+
+class MultiThumbSliderTest(unittest.TestCase):
+    """Tests for qt_range_slider.multi_thumb"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self._form = QWidget()
+        self._slider = MultiThumbSlider(self._form, 0, 1000, range(0, 1000, 20))
+        self._slider.resize(1026, 30)
+        self._renderer = RangeSliderRenderer()
+
+    def __get_thumb_center(self, value):
+        return self._renderer.thumb_rect(self._slider.rect(), value).center()
+
+    def test_values(self):
+        self.assertEqual(self._slider.count(), 50)
+        self.assertEqual(self._slider.get_value(3), 60)
+        with self.assertRaises(ValueError):
+            self._slider.set_values([10, 10])
+        with self.assertRaises(ValueError):
+            self._slider.set_values([10, 2000])
+        self.assertEqual(self._slider.count(), 50)
+
+    def test_set_value_respects_neighbors(self):
+        changes = []
+        self._slider.value_changed.connect(lambda *args: changes.append(args))
+        self._slider.set_value(3, 79)
+        self._slider.set_value(3, 80)
+        self._slider.set_value(3, 40)
+        self._slider.set_value(3, 79)
+        self.assertEqual(changes, [(3, 79)])
+        self.assertEqual(self._slider.get_values()[2:5], (40, 79, 80))
+
+    def test_drag_is_clamped_by_neighbors(self):
+        committed = []
+        self._slider.values_committed.connect(committed.append)
+        self._form.show()
+
+        start = self.__get_thumb_center(100)
+        QTest.mousePress(self._slider, Qt.MouseButton.LeftButton, pos=start)
+        _mouse_move(self._slider, start + QPoint(7, 0))
+        self.assertEqual(self._slider.get_value(5), 107)
+        _mouse_move(self._slider, start + QPoint(200, 0))
+        self.assertEqual(self._slider.get_value(5), 119)
+        QTest.mouseRelease(
+            self._slider, Qt.MouseButton.LeftButton, pos=start + QPoint(200, 0)
+        )
+        self.assertEqual(committed, [self._slider.get_values()])
+        self.assertEqual(self._slider.get_value(6), 120)
+
+    def test_press_outside_thumbs(self):
+        self._form.show()
+        QTest.mousePress(self._slider, Qt.MouseButton.LeftButton, pos=QPoint(5, 2))
+        _mouse_move(self._slider, QPoint(300, 2))
+        QTest.mouseRelease(self._slider, Qt.MouseButton.LeftButton, pos=QPoint(300, 2))
+        self.assertEqual(self._slider.get_values(), tuple(range(0, 1000, 20)))
+
+    def test_move_repaints_old_thumb_rect(self):
+        slider = _PaintRecordingSlider(self._form, 0, 1000, [100, 103, 500])
+        slider.resize(1026, 30)
+        self._form.show()
+        QTest.qWaitForWindowExposed(self._form)
+        QTest.qWait(50)
+        slider.painted = QRegion()
+        slider.set_value(1, 130)
+        QTest.qWait(50)
+        # values and track pixels are the same at this width, the old thumb
+        # reaches past the center of its left neighbor
+        self.assertTrue(
+            slider.is_painted(self._renderer.thumb_rect(slider.rect(), 103))
+        )
+        self.assertTrue(
+            slider.is_painted(self._renderer.thumb_rect(slider.rect(), 130))
+        )
+
+    def test_paint(self):
+        self._slider.set_value(0, 1)
+        self.assertFalse(self._slider.grab().isNull())
+
+
+if __name__ == "__main__":
+    unittest.main()
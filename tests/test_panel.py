@@ -0,0 +1,149 @@
+import sys
+import unittest
+
+from PyQt6.QtCore import Qt, QPoint, QRect
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+
+from qt_range_slider import RangeSliderPanel
+from qt_range_slider.renderer import RangeSliderRenderer
+
+
+class _RecordingRenderer(RangeSliderRenderer):
+    """Renderer which records the rects of the painted sliders."""
+
+    painted = []
+
+    # pylint: disable=too-many-arguments
+    def paint(self, painter, rect, pixels, colors, *, ticks_count=0, states=None):
+        self.painted.append(QRect(rect))
+        super().paint(
+            painter, rect, pixels, colors, ticks_count=ticks_count, states=states
+        )
+
+
+class RangeSliderPanelTest(unittest.TestCase):
+    """Tests for qt_range_slider.panel"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self._panel = RangeSliderPanel()
+        self._panel.resize(226, 10 * RangeSliderPanel.ROW_HEIGHT)
+        for row in range(300):
+            self._panel.add_range(0, 1000 + row)
+
+    def test_add_range(self):
+        self.assertEqual(self._panel.count(), 300)
+        self.assertEqual(self._panel.get_range(5), (0, 1005))
+        self.assertEqual(self._panel.get_bounds(5), (0, 1005))
+        self.assertEqual(self._panel.add_range(10, 20, 12, 15), 300)
+        self.assertEqual(self._panel.get_range(300), (12, 15))
+        with self.assertRaises(ValueError):
+            self._panel.add_range(10, 10)
+        with self.assertRaises(ValueError):
+            self._panel.add_range(10, 20, 15, 12)
+        self._panel.clear()
+        self.assertEqual(self._panel.count(), 0)
+
+    def test_set_range_signals(self):
+        changes = []
+        self._panel.left_thumb_value_changed.connect(
+            lambda *args: changes.append(("left",) + args)
+        )
+        self._panel.right_thumb_value_changed.connect(
+            lambda *args: changes.append(("right",) + args)
+        )
+        self._panel.range_changed.connect(
+            lambda *args: changes.append(("range",) + args)
+        )
+
+        self._panel.set_range(7, 100, 200)
+        self.assertEqual(
+            changes,
+            [("left", 7, 100), ("right", 7, 200), ("range", 7, 100, 200)],
+        )
+        changes.clear()
+        self._panel.set_range(7, 100, 200)
+        self._panel.set_range(7, 300, 200)
+        self._panel.set_range(7, 0, 5000)
+        self.assertEqual(changes, [])
+        self.assertEqual(self._panel.get_range(7), (100, 200))
+        self.assertEqual(self._panel.get_range(8), (0, 1008))
+
+    def test_paints_only_visible_rows(self):
+        # pylint: disable=protected-access
+        renderer = self._panel._renderer = _RecordingRenderer()
+        renderer.painted.clear()
+        self._panel.grab()
+        rows = len(renderer.painted)
+        self.assertGreater(rows, 0)
+        self.assertLessEqual(rows, 11)
+
+        renderer.painted.clear()
+        self._panel.verticalScrollBar().setValue(100 * RangeSliderPanel.ROW_HEIGHT)
+        self._panel.grab()
+        self.assertEqual(renderer.painted[0].y(), 0)
+        self.assertLessEqual(len(renderer.painted), 11)
+
+    def test_first_label_repaints_all_rows(self):
+        # pylint: disable=protected-access
+        renderer = self._panel._renderer = _RecordingRenderer()
+        self._panel.show()
+        QApplication.processEvents()
+        renderer.painted.clear()
+        # the new row is below the viewport, the visible rows move right
+        self._panel.add_range(0, 10, label="labeled")
+        QApplication.processEvents()
+        self.assertGreater(len(renderer.painted), 1)
+        self.assertTrue(
+            all(rect.x() == RangeSliderPanel.LABEL_WIDTH for rect in renderer.painted)
+        )
+        self._panel.hide()
+
+    def test_scroll_bar_range(self):
+        self._panel.show()
+        scroll_bar = self._panel.verticalScrollBar()
+        self.assertEqual(
+            scroll_bar.maximum(),
+            300 * RangeSliderPanel.ROW_HEIGHT - self._panel.viewport().height(),
+        )
+        self._panel.hide()
+
+    def test_drag(self):
+        self._panel.show()
+        viewport = self._panel.viewport()
+        renderer = RangeSliderRenderer()
+        row = 2
+        rect = QRect(
+            0,
+            row * RangeSliderPanel.ROW_HEIGHT,
+            viewport.width(),
+            RangeSliderPanel.ROW_HEIGHT,
+        )
+        changes = []
+        commits = []
+        self._panel.range_changed.connect(lambda *args: changes.append(args))
+        self._panel.range_committed.connect(lambda *args: commits.append(args))
+
+        start = renderer.thumb_rect(rect, 0).center()
+        QTest.mousePress(viewport, Qt.MouseButton.LeftButton, pos=start)
+        QTest.mouseMove(viewport, start + QPoint(50, 0))
+        QTest.mouseRelease(
+            viewport, Qt.MouseButton.LeftButton, pos=start + QPoint(50, 0)
+        )
+
+        low, high = self._panel.get_range(row)
+        self.assertGreater(low, 0)
+        self.assertEqual(high, 1002)
+        self.assertEqual(changes[-1], (row, low, high))
+        self.assertEqual(commits, [(row, low, high)])
+        # other rows are untouched
+        self.assertEqual(self._panel.get_range(row + 1), (0, 1003))
+        self._panel.hide()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import sys
+import threading
+import time
+import unittest
+
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from qt_range_slider import QtRangeSlider, RangeQueryRunner
+
+
+def _wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        QTest.qWait(10)
+    return True
+
+
+class RangeQueryRunnerTest(unittest.TestCase):
+    """Tests for qt_range_slider.query_runner"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self._release = threading.Event()
+        self._queried = []
+        self._results = []
+
+    def _query(self, low, high):
+        self._queried.append((low, high))
+        self._release.wait(5)
+        return high - low
+
+    def _runner(self):
+        runner = RangeQueryRunner(self._query)
+        runner.result_ready.connect(
+            lambda low, high, result: self._results.append((low, high, result))
+        )
+        return runner
+
+    def test_latest_wins(self):
+        runner = self._runner()
+        runner.submit(0, 10)
+        runner.submit(1, 10)
+        runner.submit(2, 10)
+        self.assertEqual(runner.stats()["queue_depth"], 2)
+        self._release.set()
+        self.assertTrue(_wait_until(runner.is_idle))
+        # (1, 10) was replaced before it started, (0, 10) was superseded
+        self.assertEqual(self._queried, [(0, 10), (2, 10)])
+        self.assertEqual(self._results, [(2, 10, 8)])
+        stats = runner.stats()
+        self.assertEqual(stats["submitted"], 3)
+        self.assertEqual(stats["completed"], 1)
+        self.assertEqual(stats["dropped"], 2)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertIsNotNone(stats["last_latency_ms"])
+
+    def test_failed_query(self):
+        def query(low, high):
+            raise RuntimeError(f"{low} {high}")
+
+        runner = RangeQueryRunner(query)
+        errors = []
+        runner.query_failed.connect(lambda low, high, error: errors.append(error))
+        runner.submit(1, 2)
+        self.assertTrue(_wait_until(runner.is_idle))
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], RuntimeError)
+
+    def test_delete_runner_while_querying(self):
+        parent = QWidget()
+        runner = RangeQueryRunner(self._query, parent)
+        runner.submit(1, 5)
+        self.assertTrue(_wait_until(lambda: self._queried))
+        parent.deleteLater()
+        QTest.qWait(10)
+        # the query finishes after the runner is gone
+        self._release.set()
+        self.assertTrue(QThreadPool.globalInstance().waitForDone(5000))
+        QTest.qWait(10)
+        self.assertEqual(self._queried, [(1, 5)])
+
+    def test_attach(self):
+        self._release.set()
+        parent = QWidget()
+        slider = QtRangeSlider(parent, 0, 10)
+        runner = self._runner()
+        runner.attach(slider)
+        slider.set_range(3, 5)
+        self.assertTrue(_wait_until(runner.is_idle))
+        self.assertEqual(self._results, [(3, 5, 2)])
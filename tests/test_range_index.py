@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+
+from qt_range_slider.range_index import SortedRangeIndex
+
+
+class SortedRangeIndexTest(unittest.TestCase):
+    """Tests for qt_range_slider.range_index"""
+
+    def test_count(self):
+        index = SortedRangeIndex([5, 1, 3, 3, 9, 7])
+        self.assertEqual(len(index), 6)
+        self.assertEqual(index.count(3, 7), 4)
+        self.assertEqual(index.count(0, 100), 6)
+        self.assertEqual(index.count(4, 4), 0)
+        self.assertEqual(index.count(7, 3), 0)
+
+    def test_assume_sorted(self):
+        column = np.arange(10)
+        index = SortedRangeIndex(column, assume_sorted=True)
+        self.assertTrue(np.shares_memory(index.column, column))
+        self.assertEqual(index.count(2, 4), 3)
+
+    def test_matches_linear_scan(self):
+        rng = np.random.default_rng(1)
+        column = rng.integers(0, 1000, 10000)
+        index = SortedRangeIndex(column)
+        for low, high in ((0, 999), (100, 200), (500, 500), (990, 2000)):
+            expected = int(np.count_nonzero((column >= low) & (column <= high)))
+            self.assertEqual(index.count(low, high), expected)
@@ -0,0 +1,118 @@
+import unittest
+
+from PyQt6.QtCore import QRect
+from PyQt6.QtGui import QColor, QPalette
+
+from qt_range_slider.mapping import LogValueMapper, ValueMapper
+from qt_range_slider.renderer import RangeSliderColors, RangeSliderRenderer, ThumbDrag
+
+
+class RangeSliderRendererTest(unittest.TestCase):
+    """Tests for qt_range_slider.renderer"""
+
+    def test_geometry_follows_rect(self):
+        renderer = RangeSliderRenderer()
+        rect = QRect(0, 0, 200, 30)
+        moved = rect.translated(50, 100)
+        self.assertEqual(renderer.available_width(rect), 200 - 2 * 13)
+        self.assertEqual(
+            renderer.thumb_rect(moved, 10),
+            renderer.thumb_rect(rect, 10).translated(50, 100),
+        )
+        self.assertEqual(
+            renderer.track_rect(moved), renderer.track_rect(rect).translated(50, 100)
+        )
+
+    def test_hit_test(self):
+        renderer = RangeSliderRenderer()
+        rect = QRect(0, 30, 200, 30)
+        left = renderer.thumb_rect(rect, 20).center()
+        right = renderer.thumb_rect(rect, 150).center()
+        self.assertEqual(renderer.hit_test(rect, (20, 150), left.x(), left.y()), 0)
+        self.assertEqual(renderer.hit_test(rect, (20, 150), right.x(), right.y()), 1)
+        self.assertIsNone(renderer.hit_test(rect, (20, 150), 100, left.y()))
+        self.assertEqual(renderer.thumb_pixel(rect, left.x() + 1), 20)
+
+    def test_layout(self):
+        renderer = RangeSliderRenderer()
+        rect = QRect(0, 30, 200, 30)
+        layout = renderer.layout(rect, (20, 150), ticks_count=4)
+        self.assertEqual(layout.thumb_rects[1], renderer.thumb_rect(rect, 150))
+        self.assertEqual(layout.fill_rect, renderer.track_fill_rect(rect, 20, 150))
+        self.assertEqual(layout.tick_xs, renderer.tick_xs(rect, 4))
+        self.assertEqual(len(layout.tick_xs), 5)
+        left = layout.thumb_rects[0].center()
+        self.assertEqual(layout.thumb_at(left.x(), left.y()), 0)
+        self.assertIsNone(layout.thumb_at(100, left.y()))
+
+    def test_ticks_are_decimated(self):
+        renderer = RangeSliderRenderer()
+        rect = QRect(0, 0, 226, 30)
+        self.assertEqual(renderer.tick_xs(rect, 0), ())
+        self.assertEqual(renderer.tick_xs(rect, 4), (13, 63, 113, 163, 213))
+        # more ticks than pixels don't stack at the track start
+        tick_xs = renderer.tick_xs(rect, 1000)
+        self.assertEqual(tick_xs[0], 13)
+        self.assertLessEqual(len(tick_xs), 200 // renderer.min_tick_spacing + 1)
+        self.assertTrue(
+            all(
+                b - a >= renderer.min_tick_spacing for a, b in zip(tick_xs, tick_xs[1:])
+            )
+        )
+        self.assertEqual(len(renderer.minor_tick_xs(rect, 4, 4)), 16)
+        self.assertEqual(renderer.minor_tick_xs(rect, 40, 4), ())
+        layout = renderer.layout(rect, (0, 200), ticks_count=4, minor_ticks_count=4)
+        self.assertEqual(len(layout.tick_lines), 5 + 16)
+
+    def test_tick_label_texts(self):
+        renderer = RangeSliderRenderer()
+        # labels read the nominal tick values at any width
+        for width in (120, 400, 1000):
+            rect = QRect(0, 0, width, 30)
+            mapper = ValueMapper(0, 1000, renderer.available_width(rect))
+            layout = renderer.layout(rect, (0, 10), ticks_count=10)
+            self.assertEqual(
+                renderer.tick_label_texts(layout, mapper),
+                [f"{value:,}" for value in range(0, 1001, 100)],
+            )
+        # other scales label the value at the tick pixel
+        rect = QRect(0, 0, 226, 30)
+        mapper = LogValueMapper(0, 10**6, renderer.available_width(rect))
+        layout = renderer.layout(rect, (0, 10), ticks_count=2)
+        self.assertEqual(
+            renderer.tick_label_texts(layout, mapper, str),
+            [str(mapper.pixel_values[pixel]) for pixel in (0, 100, 200)],
+        )
+
+    def test_thumb_drag(self):
+        renderer = RangeSliderRenderer()
+        rect = QRect(10, 0, 226, 30)
+        mapper = ValueMapper(0, 1000, renderer.available_width(rect))
+        drag = ThumbDrag(renderer)
+        # grabbed 3 pixels right of the thumb anchor at pixel 50
+        anchor = renderer.thumb_rect(rect, 50).center().x()
+        drag.press(rect, anchor + 3, 50)
+        self.assertEqual(drag.move(rect, anchor + 13, mapper), 60)
+        # moves within the same pixel are dropped until invalidated
+        self.assertIsNone(drag.move(rect, anchor + 13.2, mapper))
+        drag.invalidate()
+        self.assertEqual(drag.move(rect, anchor + 13, mapper), 60)
+        # clamped to the track
+        self.assertEqual(drag.move(rect, -1000, mapper), 0)
+        self.assertEqual(drag.move(rect, 1000, mapper), 200)
+
+    def test_colors_are_shared_per_palette(self):
+        palette = QPalette(QColor(0x20, 0x20, 0x20))
+        colors = RangeSliderColors.from_palette(palette)
+        self.assertIs(RangeSliderColors.from_palette(QPalette(palette)), colors)
+        self.assertEqual(colors.border_pen.color(), colors.border)
+
+        palette.setColor(QPalette.ColorRole.Mid, QColor(0xFF, 0, 0))
+        changed = RangeSliderColors.from_palette(palette)
+        self.assertIsNot(changed, colors)
+        self.assertEqual(changed.border, QColor(0xFF, 0, 0))
+
+    def test_brushes_are_created_once(self):
+        renderer = RangeSliderRenderer(track_color=QColor(1, 2, 3))
+        self.assertEqual(renderer.track_brush.color(), QColor(1, 2, 3))
+        self.assertIs(renderer.track_brush, renderer.track_brush)
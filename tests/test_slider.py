@@ -1,12 +1,16 @@
 import sys
 import unittest
 
+import numpy as np
+
 from PyQt6.QtCore import Qt, QRect, QEvent, QSize, QPoint, QPointF
 from PyQt6.QtTest import QTest
-from PyQt6.QtGui import QPaintEvent, QMouseEvent
+from PyQt6.QtGui import QColor, QPaintEvent, QPalette, QMouseEvent, QWheelEvent
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget
 
-from qt_range_slider import QtRangeSlider
+from qt_range_slider import EmissionPolicy, FloatAdapter, QtRangeSlider, Scale
+from qt_range_slider.animation import FrameClock
+from qt_range_slider.sprites import ThumbState
 
 
 def _mouse_move(widget: QWidget, new_position: QPoint):
@@ -27,10 +31,18 @@ def _draw_widget(widget: QWidget):
     widget.paintEvent(unused_event)
 
 
+def _wait_for(predicate, timeout_ms):
+    for _ in range(timeout_ms // 10):
+        if predicate():
+            return
+        QTest.qWait(10)
+
+
 def _gb_to_bytes(gb_count):
     return gb_count * 1024**3
 
 
+# pylint: disable=too-many-public-methods
 class QtRangeSliderTest(unittest.TestCase):
     """Tests for qt_range_slider"""
 
@@ -59,14 +71,134 @@ class QtRangeSliderTest(unittest.TestCase):
         self.assertEqual(slider._ticks_count, 5)
         _draw_widget(slider)
 
+    def test_tick_labels(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10**12)
+        slider.resize(400, 60)
+        slider.set_ticks_count(10**6, 9)
+        slider.set_tick_labels_visible(True, lambda value: f"{value / 10**12:.0%}")
+        layout = slider.get_layout()
+        self.assertLess(len(layout.tick_lines), layout.track_rect.width())
+        self.assertEqual(layout.background_rect.bottom(), layout.rect.bottom())
+        _draw_widget(slider)
+        slider.set_tick_labels_visible(False)
+        self.assertLess(slider.get_layout().background_rect.bottom(), 59)
+        with self.assertRaises(ValueError):
+            slider.set_ticks_count(1, -1)
+
+    def test_value_adapter(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 100)
+        with self.assertRaises(ValueError):
+            slider.get_value_range()
+        slider.set_value_adapter(FloatAdapter(-5.0, 0.1))
+        slider.set_value_bounds(-5.0, 5.0)
+        self.assertEqual(slider.get_bounds(), (0, 100))
+        values = []
+        slider.value_range_changed.connect(lambda low, high: values.append((low, high)))
+        slider.set_value_range(-1.0, 2.5)
+        self.assertEqual(
+            (slider.get_left_thumb_value(), slider.get_right_thumb_value()), (40, 75)
+        )
+        self.assertEqual(len(values), 1)
+        self.assertAlmostEqual(values[0][0], -1.0)
+        self.assertAlmostEqual(slider.get_value_range()[1], 2.5)
+        slider.set_ticks_count(2)
+        slider.set_tick_labels_visible(True)
+        _draw_widget(slider)
+        slider.set_value_adapter(None)
+        slider.set_range(10, 20)
+        self.assertEqual(len(values), 1)
+
+    def test_animate_to(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 1000, 0, 1000)
+        ranges = []
+        committed = []
+        slider.range_changed.connect(lambda low, high: ranges.append((low, high)))
+        slider.range_committed.connect(lambda low, high: committed.append((low, high)))
+        slider.animate_to(100, 900, duration=100)
+        self.assertTrue(slider.is_animating())
+        _wait_for(lambda: not slider.is_animating(), 1000)
+        self.assertEqual(ranges[-1], (100, 900))
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(committed, [(100, 900)])
+
+        # ON_RELEASE holds the intermediate values back
+        ranges.clear()
+        slider.set_emission_policy(EmissionPolicy.ON_RELEASE)
+        slider.animate_to(0, 500, duration=50)
+        _wait_for(lambda: not slider.is_animating(), 1000)
+        self.assertEqual(ranges, [(0, 500)])
+
+        # setting values stops the animation
+        slider.animate_to(400, 600, duration=1000)
+        slider.set_range(10, 20)
+        self.assertFalse(slider.is_animating())
+        QTest.qWait(50)
+        self.assertEqual(slider.get_model().low, 10)
+
+    def test_delete_while_animating(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 1000, 0, 1000)
+        slider.animate_to(100, 900, duration=300)
+        slider.deleteLater()
+        # the shared clock must not tick the deleted slider
+        QTest.qWait(400)
+        self.assertEqual(FrameClock.instance().stats()["running"], 0)
+
+    def test_keyboard_steps(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10**12, 0, 10**12)
+        committed = []
+        slider.range_committed.connect(lambda low, high: committed.append((low, high)))
+        slider.set_steps(single_step=10, duration=0)
+        QTest.keyClick(slider, Qt.Key.Key_Right)
+        self.assertEqual(slider.get_left_thumb_value(), 10)
+        # steps without animation commit right away
+        self.assertEqual(committed, [(10, 10**12)])
+        slider.set_steps(single_step=1, duration=0)
+        for _ in range(30):
+            QTest.keyClick(slider, Qt.Key.Key_Right)
+        # repeated steps accelerate
+        self.assertGreater(slider.get_left_thumb_value(), 10 + 30)
+        QTest.keyClick(slider, Qt.Key.Key_Home)
+        self.assertEqual(slider.get_left_thumb_value(), 0)
+        QTest.keyClick(slider, Qt.Key.Key_PageUp)
+        self.assertEqual(slider.get_left_thumb_value(), 10**11)
+        # pylint: disable=protected-access
+        slider._active_thumb = 1
+        QTest.keyClick(slider, Qt.Key.Key_Home)
+        self.assertEqual(slider.get_right_thumb_value(), 10**11 + 1)
+
+    def test_wheel_steps(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 1000, 500, 1000)
+        slider.set_steps(single_step=5, duration=0)
+
+        def wheel(delta, modifiers=Qt.KeyboardModifier.NoModifier):
+            event = QWheelEvent(
+                QPointF(10, 10),
+                QPointF(10, 10),
+                QPoint(0, 0),
+                QPoint(0, delta),
+                Qt.MouseButton.NoButton,
+                modifiers,
+                Qt.ScrollPhase.NoScrollPhase,
+                False,
+            )
+            QApplication.sendEvent(slider, event)
+
+        wheel(-120)
+        self.assertEqual(slider.get_left_thumb_value(), 495)
+        # half notches add up
+        wheel(60)
+        self.assertEqual(slider.get_left_thumb_value(), 495)
+        wheel(60)
+        self.assertEqual(slider.get_left_thumb_value(), 500)
+        wheel(-120, Qt.KeyboardModifier.ShiftModifier)
+        self.assertEqual(slider.get_left_thumb_value(), 400)
+
     def test_thumb_values(self):
         slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10)
         slider.set_left_thumb_value(3)
-        # pylint: disable=protected-access
-        self.assertEqual(slider._left_thumb.value, 3)
+        self.assertEqual(slider.get_model().low, 3)
         slider.set_left_thumb_value(5)
-        # pylint: disable=protected-access
-        self.assertEqual(slider._left_thumb.value, 5)
+        self.assertEqual(slider.get_model().low, 5)
 
     def test_change_size_while_dragging(self):
         slider = QtRangeSlider(
@@ -78,8 +210,7 @@ class QtRangeSliderTest(unittest.TestCase):
         )
         slider.setMouseTracking(True)
         _draw_widget(slider)
-        # pylint: disable=protected-access
-        left_thumb_position = slider._left_thumb.rect.center()
+        left_thumb_position = slider.get_layout().thumb_rects[0].center()
 
         _mouse_move(slider, left_thumb_position)
         QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=left_thumb_position)
@@ -89,9 +220,9 @@ class QtRangeSliderTest(unittest.TestCase):
         _mouse_move(slider, new_position)
 
         QTest.mouseRelease(slider, Qt.MouseButton.LeftButton)
-        self.assertEqual(slider.get_left_thumb_value(), 2684354560)
+        self.assertEqual(slider.get_left_thumb_value(), 2056101365)
 
-        left_thumb_position = slider._left_thumb.rect.center()
+        left_thumb_position = slider.get_layout().thumb_rects[0].center()
         new_width = QtRangeSliderTest._initial_size.width() - 50
         QTest.mouseMove(slider, pos=left_thumb_position)
         QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=left_thumb_position)
@@ -105,7 +236,7 @@ class QtRangeSliderTest(unittest.TestCase):
         _mouse_move(slider, new_position)
 
         QTest.mouseRelease(slider, Qt.MouseButton.LeftButton)
-        self.assertEqual(slider.get_left_thumb_value(), 894784853)
+        self.assertEqual(slider.get_left_thumb_value(), 0)
 
     def test_dragging_right_thumb(self):
         slider = QtRangeSlider(
@@ -117,8 +248,7 @@ class QtRangeSliderTest(unittest.TestCase):
         )
         slider.setMouseTracking(True)
         _draw_widget(slider)
-        # pylint: disable=protected-access
-        right_thumb_center = slider._right_thumb.rect.center()
+        right_thumb_center = slider.get_layout().thumb_rects[1].center()
 
         _mouse_move(slider, right_thumb_center)
         QTest.mousePress(slider, Qt.MouseButton.RightButton, pos=right_thumb_center)
@@ -127,7 +257,7 @@ class QtRangeSliderTest(unittest.TestCase):
         _mouse_move(slider, right_thumb_center)
 
         QTest.mouseRelease(slider, Qt.MouseButton.RightButton)
-        self.assertEqual(slider.get_right_thumb_value(), 4384445781)
+        self.assertEqual(slider.get_right_thumb_value(), 4226430584)
 
     def test_invalid_ticks_count(self):
         slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10)
@@ -175,3 +305,352 @@ class QtRangeSliderTest(unittest.TestCase):
         slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10, 3, right_thumb_value)
         slider.set_right_thumb_value(right_thumb_value)
         self.assertEqual(slider.get_right_thumb_value(), right_thumb_value)
+
+    def test_thumb_move_invalidates_dirty_region(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10, 3, 5)
+        _draw_widget(slider)
+        # pylint: disable=protected-access
+        old_rect = slider.get_layout().thumb_rects[0]
+        slider.set_left_thumb_value(1)
+        slider.set_left_thumb_value(2)
+        self.assertTrue(slider._update_scheduled)
+        self.assertTrue(slider._dirty_region.contains(old_rect))
+        self.assertFalse(
+            slider._dirty_region.contains(slider.get_layout().thumb_rects[1])
+        )
+        QApplication.processEvents()
+        self.assertFalse(slider._update_scheduled)
+        self.assertTrue(slider._dirty_region.isEmpty())
+
+    def test_layout_before_first_paint(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10, 3, 5)
+        slider.setMouseTracking(True)
+        layout = slider.get_layout()
+        self.assertEqual(layout.rect, slider.rect())
+        self.assertIs(slider.get_layout(), layout)
+        position = layout.thumb_rects[0].center()
+        QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=position)
+        position.setX(position.x() - 40)
+        _mouse_move(slider, position)
+        QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=position)
+        self.assertLess(slider.get_left_thumb_value(), 3)
+        center = layout.thumb_rects[1].center()
+        self.assertEqual(layout.thumb_at(center.x(), center.y()), 1)
+
+    def test_layout_follows_changes(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10, 3, 5)
+        layout = slider.get_layout()
+        slider.set_left_thumb_value(1)
+        self.assertLess(
+            slider.get_layout().thumb_rects[0].x(), layout.thumb_rects[0].x()
+        )
+        self.assertEqual(slider.get_layout().thumb_rects[1], layout.thumb_rects[1])
+        slider.set_ticks_count(4)
+        self.assertEqual(len(slider.get_layout().tick_xs), 5)
+        slider.resize(slider.width() + 100, slider.height())
+        self.assertEqual(slider.get_layout().rect, slider.rect())
+        self.assertEqual(
+            slider.get_layout().track_rect.width(), layout.track_rect.width() + 100
+        )
+
+    def test_background_cache(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10, 3, 5)
+        _draw_widget(slider)
+        slider.paintEvent(QPaintEvent(slider.rect()))
+        # pylint: disable=protected-access
+        background = slider._background_cache
+        self.assertIsNotNone(background)
+        slider.set_left_thumb_value(1)
+        slider.paintEvent(QPaintEvent(slider.rect()))
+        self.assertIs(slider._background_cache, background)
+        slider.set_ticks_count(10)
+        self.assertIsNone(slider._background_cache)
+        slider.paintEvent(QPaintEvent(slider.rect()))
+        self.assertIsNot(slider._background_cache, background)
+        background = slider._background_cache
+        QApplication.sendEvent(slider, QEvent(QEvent.Type.PaletteChange))
+        self.assertIsNone(slider._background_cache)
+
+    def test_palette_change_refreshes_colors(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10, 3, 5)
+        # pylint: disable=protected-access
+        colors = slider._colors
+        palette = slider.palette()
+        palette.setColor(QPalette.ColorRole.Mid, QColor(0xFF, 0, 0))
+        slider.setPalette(palette)
+        self.assertIsNot(slider._colors, colors)
+        self.assertEqual(slider._colors.border, QColor(0xFF, 0, 0))
+        other = QtRangeSlider(QtRangeSliderTest._form, 0, 10)
+        other.setPalette(palette)
+        self.assertIs(other._colors, slider._colors)
+
+    def test_pressed_thumb_state(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10, 3, 5)
+        _draw_widget(slider)
+        # pylint: disable=protected-access
+        left_thumb_position = slider.get_layout().thumb_rects[0].center()
+        QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=left_thumb_position)
+        self.assertEqual(slider._left_thumb.state, ThumbState.PRESSED)
+        self.assertEqual(slider._right_thumb.state, ThumbState.NORMAL)
+        slider.paintEvent(QPaintEvent(slider.rect()))
+        QTest.mouseRelease(slider, Qt.MouseButton.LeftButton)
+        self.assertEqual(slider._left_thumb.state, ThumbState.NORMAL)
+
+    def test_range_committed_on_release(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 100, 30, 50)
+        slider.setMouseTracking(True)
+        slider.set_emission_policy(EmissionPolicy.ON_RELEASE)
+        left_values = []
+        committed = []
+        slider.left_thumb_value_changed.connect(left_values.append)
+        slider.range_committed.connect(lambda lo, hi: committed.append((lo, hi)))
+        _draw_widget(slider)
+        position = slider.get_layout().thumb_rects[0].center()
+        QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=position)
+        for _ in range(3):
+            position.setX(position.x() - 10)
+            _mouse_move(slider, position)
+        self.assertEqual(left_values, [])
+        QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=position)
+        self.assertEqual(left_values, [slider.get_left_thumb_value()])
+        self.assertEqual(committed, [(slider.get_left_thumb_value(), 50)])
+
+    def test_invalid_emission_policy_arguments(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10)
+        with self.assertRaises(ValueError):
+            slider.set_emission_policy(EmissionPolicy.THROTTLED)
+        with self.assertRaises(ValueError):
+            slider.set_emission_policy(EmissionPolicy.DEBOUNCED, delay=-1)
+
+    def test_set_range(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10, 3, 5)
+        ranges = []
+        slider.range_changed.connect(lambda lo, hi: ranges.append((lo, hi)))
+        # both thumbs jump past each other, which two setter calls can't do
+        slider.set_range(7, 9)
+        self.assertEqual(slider.get_left_thumb_value(), 7)
+        self.assertEqual(slider.get_right_thumb_value(), 9)
+        self.assertEqual(ranges, [(7, 9)])
+        slider.set_range(9, 7)
+        slider.set_range(7, 11)
+        self.assertEqual(ranges, [(7, 9)])
+
+    def test_batch_update(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 10, 3, 5)
+        _draw_widget(slider)
+        # pylint: disable=protected-access
+        left_values = []
+        ranges = []
+        slider.left_thumb_value_changed.connect(left_values.append)
+        slider.range_changed.connect(lambda lo, hi: ranges.append((lo, hi)))
+        with slider.batch_update():
+            slider.set_left_thumb_value(1)
+            with slider.batch_update():
+                slider.set_left_thumb_value(2)
+                slider.set_right_thumb_value(6)
+            self.assertFalse(slider._update_scheduled)
+            self.assertEqual(left_values, [])
+        self.assertTrue(slider._update_scheduled)
+        self.assertEqual(left_values, [2])
+        self.assertEqual(ranges, [(2, 6)])
+
+    def test_nonzero_min_value(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 100, 200, 120, 180)
+        slider.set_left_thumb_value(50)
+        self.assertEqual(slider.get_left_thumb_value(), 120)
+        slider.set_left_thumb_value(100)
+        self.assertEqual(slider.get_left_thumb_value(), 100)
+
+    def test_scale(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, _gb_to_bytes(10))
+        self.assertEqual(slider.get_scale(), Scale.LINEAR)
+        _draw_widget(slider)
+        slider.set_distribution(np.arange(1000) ** 3)
+        slider.set_scale(Scale.LOG)
+        self.assertEqual(slider.get_scale(), Scale.LOG)
+        slider.paintEvent(QPaintEvent(slider.rect()))
+
+        slider.set_scale(Scale.DISTINCT, [10, 20, 30])
+        slider.setMouseTracking(True)
+        position = slider.get_layout().thumb_rects[1].center()
+        QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=position)
+        position.setX(position.x() - 30)
+        _mouse_move(slider, position)
+        QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=position)
+        self.assertIn(slider.get_right_thumb_value(), (10, 20, 30))
+        with self.assertRaises(ValueError):
+            slider.set_scale(Scale.DISTINCT)
+
+    def test_drag_inside_pixel_bucket_is_skipped(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, _gb_to_bytes(10))
+        slider.setMouseTracking(True)
+        _draw_widget(slider)
+        values = []
+        slider.left_thumb_value_changed.connect(values.append)
+        position = slider.get_layout().thumb_rects[0].center()
+        QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=position)
+        position.setX(position.x() + 10)
+        _mouse_move(slider, position)
+        _mouse_move(slider, position)
+        QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=position)
+        self.assertEqual(len(values), 1)
+
+    def test_set_bounds(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 100, 10, 90)
+        _draw_widget(slider)
+        ranges = []
+        slider.range_changed.connect(lambda *args: ranges.append(args))
+        slider.set_distribution(np.arange(100))
+        slider.set_bounds(20, 50)
+        self.assertEqual(slider.get_bounds(), (20, 50))
+        self.assertEqual(ranges, [(20, 50)])
+        slider.set_bounds(0, 1000)
+        self.assertEqual(ranges, [(20, 50)])
+        slider.paintEvent(QPaintEvent(slider.rect()))
+        with self.assertRaises(ValueError):
+            slider.set_bounds(10, 10)
+
+    def test_auto_extend(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 100, 10, 100)
+        slider.enable_instrumentation()
+        ranges = []
+        slider.range_changed.connect(lambda *args: ranges.append(args))
+        slider.observe(500)
+        self.assertEqual(slider.get_bounds(), (0, 100))
+        slider.set_auto_extend(True)
+        slider.observe([50, 60])
+        slider.observe(np.array([], dtype=np.uint64))
+        slider.observe(150)
+        self.assertEqual(slider.get_bounds(), (0, 300))
+        # the right thumb was at the max and follows it
+        self.assertEqual(ranges, [(10, 300)])
+        for value in range(150, 300):
+            slider.observe(value)
+        slider.observe(np.arange(290, 310))
+        self.assertEqual(slider.get_bounds(), (0, 618))
+        self.assertEqual(slider.get_instrumentation().counter("bounds_extensions"), 2)
+        with self.assertRaises(ValueError):
+            slider.set_auto_extend(True, growth=0.5)
+
+    def test_negative_values(self):
+        with self.assertRaises(ValueError):
+            QtRangeSlider(QtRangeSliderTest._form, -10, 10, -5, 5)
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 100, 10, 100)
+        with self.assertRaises(ValueError):
+            slider.set_bounds(-10, 10)
+        self.assertEqual(slider.get_bounds(), (0, 100))
+        slider.set_left_thumb_value(-7)
+        self.assertEqual(slider.get_left_thumb_value(), 10)
+        # auto extend stops at 0
+        slider.set_auto_extend(True)
+        slider.observe([-5])
+        self.assertEqual(slider.get_bounds(), (0, 100))
+        slider.observe(-5)
+        slider.set_bounds(50, 100)
+        slider.observe(np.array([-5, 200]))
+        self.assertEqual(slider.get_bounds(), (0, 350))
+
+    def test_auto_extend_distinct_values(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 100)
+        slider.set_scale(Scale.DISTINCT, [10, 20, 30])
+        slider.set_auto_extend(True)
+        slider.observe(150)
+        slider.observe(1000)
+        # extensions add no snap points at the old bounds
+        # pylint: disable=protected-access
+        self.assertEqual(slider._mapper.values, [0, 10, 20, 30, slider.get_bounds()[1]])
+
+    def test_drag_compression(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 1000)
+        slider.setMouseTracking(True)
+        slider.set_drag_compression(True, frame_rate=1)
+        _draw_widget(slider)
+        values = []
+        slider.left_thumb_value_changed.connect(values.append)
+        position = slider.get_layout().thumb_rects[0].center()
+        QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=position)
+        for offset in (10, 20, 30, 40):
+            _mouse_move(slider, position + QPoint(offset, 0))
+        # the first move is applied, the others wait for the next frame
+        self.assertEqual(len(values), 1)
+        self.assertEqual(slider.get_coalesced_moves(), 2)
+        QTest.mouseRelease(
+            slider, Qt.MouseButton.LeftButton, pos=position + QPoint(40, 0)
+        )
+        self.assertEqual(len(values), 2)
+        self.assertGreater(values[1], values[0])
+        with self.assertRaises(ValueError):
+            slider.set_drag_compression(True, frame_rate=0)
+
+    def test_drag_compression_applies_moves_per_frame(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 1000)
+        slider.setMouseTracking(True)
+        slider.set_drag_compression(True, frame_rate=200)
+        _draw_widget(slider)
+        position = slider.get_layout().thumb_rects[0].center()
+        QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=position)
+        _mouse_move(slider, position + QPoint(10, 0))
+        value = slider.get_left_thumb_value()
+        _mouse_move(slider, position + QPoint(20, 0))
+        self.assertEqual(slider.get_left_thumb_value(), value)
+        QTest.qWait(50)
+        self.assertGreater(slider.get_left_thumb_value(), value)
+        QTest.mouseRelease(
+            slider, Qt.MouseButton.LeftButton, pos=position + QPoint(20, 0)
+        )
+
+    def test_distribution(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 1000)
+        _draw_widget(slider)
+        slider.set_distribution(np.arange(1000) % 100)
+        # pylint: disable=protected-access
+        self.assertIsNone(slider._background_cache)
+        slider.paintEvent(QPaintEvent(slider.rect()))
+        self.assertIsNotNone(slider._background_cache)
+        slider.append_samples([1, 2, 3])
+        slider.paintEvent(QPaintEvent(slider.rect()))
+        slider.set_histogram([1, 2, 3], [0, 10, 20, 1000])
+        slider.paintEvent(QPaintEvent(slider.rect()))
+        slider.clear_distribution()
+        self.assertIsNone(slider._distribution)
+
+    def test_match_count(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, 100, 10, 20)
+        self.assertIsNone(slider.get_match_count())
+        counts = []
+        slider.match_count_changed.connect(counts.append)
+        slider.set_data_column(np.arange(100))
+        self.assertEqual(slider.get_match_count(), 11)
+        slider.set_right_thumb_value(30)
+        self.assertEqual(slider.get_match_count(), 21)
+        slider.set_match_count_visible(True)
+        _draw_widget(slider)
+        slider.paintEvent(QPaintEvent(slider.rect()))
+        self.assertEqual(counts, [11, 21])
+        slider.clear_data_column()
+        self.assertIsNone(slider.get_match_count())
+
+    def test_instrumentation(self):
+        slider = QtRangeSlider(QtRangeSliderTest._form, 0, _gb_to_bytes(10))
+        self.assertIsNone(slider.get_instrumentation())
+        instrumentation = slider.enable_instrumentation()
+        slider.setMouseTracking(True)
+        _draw_widget(slider)
+        position = slider.get_layout().thumb_rects[0].center()
+        QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=position)
+        position.setX(position.x() + 10)
+        _mouse_move(slider, position)
+        _mouse_move(slider, position)
+        QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=position)
+
+        stats = instrumentation.to_dict()
+        self.assertEqual(stats["counters"]["paints"], 1)
+        self.assertEqual(stats["counters"]["resizes"], 1)
+        self.assertEqual(stats["counters"]["moves_handled"], 1)
+        self.assertEqual(stats["counters"]["moves_skipped"], 1)
+        self.assertEqual(stats["counters"]["emissions.left_thumb_value_changed"], 1)
+        self.assertEqual(stats["timings"]["mouse_move"]["count"], 2)
+
+        slider.disable_instrumentation()
+        _draw_widget(slider)
+        self.assertEqual(instrumentation.counter("paints"), 1)
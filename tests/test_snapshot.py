@@ -0,0 +1,47 @@
+import sys
+import unittest
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+from qt_range_slider import (
+    Scale,
+    SliderState,
+    render_range_slider,
+    render_range_sliders,
+)
+
+
+class SnapshotTest(unittest.TestCase):
+    """Tests for qt_range_slider.snapshot"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_render_image(self):
+        state = SliderState(0, 1000, 100, 900, ticks_count=10, tick_labels=True)
+        image = render_range_slider(state, QSize(300, 40), dpr=2.0)
+        self.assertEqual(image.size(), QSize(600, 80))
+        self.assertEqual(image.devicePixelRatio(), 2.0)
+        # the track fill is drawn in the middle between the thumbs
+        self.assertGreater(image.pixelColor(300, 40).alpha(), 0)
+
+    def test_render_bytes(self):
+        state = SliderState(1, 10**12, 10, 10**9, scale=Scale.LOG)
+        data = render_range_slider(state, (200, 30), image_format="PNG")
+        self.assertTrue(data.startswith(b"\x89PNG"))
+        self.assertEqual(QImage.fromData(data).size(), QSize(200, 30))
+
+    def test_invalid_state(self):
+        with self.assertRaises(ValueError):
+            render_range_slider(SliderState(0, 10, 5, 3), (200, 30))
+
+    def test_render_batch(self):
+        states = [SliderState(0, 100, low, 100) for low in range(4)]
+        images = list(render_range_sliders(states, (200, 30), processes=1))
+        self.assertEqual(len(images), 4)
+        self.assertEqual(
+            images[0], render_range_slider(states[0], (200, 30), image_format="PNG")
+        )
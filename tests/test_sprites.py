@@ -0,0 +1,65 @@
+import sys
+import unittest
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import QApplication
+
+from qt_range_slider.sprites import StaticTextCache, ThumbSpriteCache, ThumbState
+
+
+class ThumbSpriteCacheTest(unittest.TestCase):
+    """Tests for qt_range_slider.sprites"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ThumbSpriteCache(0)
+
+    def test_sprite_is_shared(self):
+        cache = ThumbSpriteCache()
+        size = QSize(16, 16)
+        sprite = cache.get(
+            size, QColor("white"), QColor("gray"), 1.0, ThumbState.NORMAL
+        )
+        self.assertEqual(sprite.width(), 16 + 2 * ThumbSpriteCache.MARGIN)
+        same = cache.get(size, QColor("white"), QColor("gray"), 1.0, ThumbState.NORMAL)
+        self.assertEqual(sprite.cacheKey(), same.cacheKey())
+        self.assertEqual(len(cache), 1)
+
+    def test_device_pixel_ratio(self):
+        cache = ThumbSpriteCache()
+        sprite = cache.get(
+            QSize(16, 16), QColor("white"), QColor("gray"), 2.0, ThumbState.HOVER
+        )
+        self.assertEqual(sprite.width(), 2 * (16 + 2 * ThumbSpriteCache.MARGIN))
+        self.assertEqual(sprite.devicePixelRatio(), 2.0)
+
+    def test_lru_eviction(self):
+        cache = ThumbSpriteCache(2)
+        colors = [QColor("red"), QColor("green"), QColor("blue")]
+        size = QSize(16, 16)
+        first = cache.get(size, colors[0], colors[0], 1.0, ThumbState.NORMAL)
+        cache.get(size, colors[1], colors[1], 1.0, ThumbState.NORMAL)
+        # touch the first sprite so that the second one becomes the oldest
+        cache.get(size, colors[0], colors[0], 1.0, ThumbState.NORMAL)
+        cache.get(size, colors[2], colors[2], 1.0, ThumbState.NORMAL)
+        self.assertEqual(len(cache), 2)
+        again = cache.get(size, colors[0], colors[0], 1.0, ThumbState.NORMAL)
+        self.assertEqual(first.cacheKey(), again.cacheKey())
+
+    def test_static_text_cache(self):
+        cache = StaticTextCache(2)
+        font = QFont()
+        label = cache.get("1,000", font)
+        self.assertIs(cache.get("1,000", font), label)
+        self.assertGreater(label.size().width(), 0)
+        bold = QFont(font)
+        bold.setBold(True)
+        self.assertIsNot(cache.get("1,000", bold), label)
+        cache.get("2,000", font)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(cache.get("1,000", font), label)